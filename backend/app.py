@@ -1,29 +1,34 @@
+import time
+_app_import_started = time.perf_counter()
+
+import asyncio
+
 from fastapi import FastAPI, UploadFile, File, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import List, Optional
 import os
 import shutil
+import threading
 from pathlib import Path
 import json
 
-# Import our models
+# Import configuration and startup helpers. The model modules themselves are
+# imported lazily by the component factories below, so importing this module
+# (and therefore uvicorn readiness) does not wait for pdfplumber, groq or torch.
 try:
     from config import Config
-    from models.resume_parser import ResumeParser
-    from models.job_matcher import JobMatcher
-    from models.ats_optimizer import ATSOptimizer
-    from models.ats_storage import ATSResultsStorage
-    from models.screening_storage import ScreeningResultsStorage
+    from startup import LazyComponent, timed, startup_timings
+    from concurrency import run_blocking, concurrency_stats
+    from models import model_registry
 except ImportError:
     # Try alternative import paths
     import sys
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     from config import Config
-    from models.resume_parser import ResumeParser
-    from models.job_matcher import JobMatcher
-    from models.ats_optimizer import ATSOptimizer
-    from models.ats_storage import ATSResultsStorage
-    from models.screening_storage import ScreeningResultsStorage
+    from startup import LazyComponent, timed, startup_timings
+    from concurrency import run_blocking, concurrency_stats
+    from models import model_registry
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -41,16 +46,162 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize components
+# Component factories - each runs once, on first use or during warm-up
+def _create_resume_parser():
+    with timed("import models.resume_parser"):
+        from models.resume_parser import ResumeParser
+    return ResumeParser(
+        execution_mode=Config.PARSER_EXECUTION_MODE,
+        max_workers=Config.PARSER_MAX_WORKERS,
+        chunk_size=Config.PARSER_CHUNK_SIZE,
+        file_timeout=Config.PARSER_FILE_TIMEOUT,
+        min_parallel_files=Config.PARSER_MIN_PARALLEL_FILES
+    )
+
+def _create_job_matcher():
+    with timed("import models.job_matcher"):
+        from models.job_matcher import JobMatcher
+    return JobMatcher(
+        model_name=Config.EMBEDDING_MODEL,
+        batch_size=Config.EMBEDDING_BATCH_SIZE,
+        cache_dir=Config.EMBEDDING_CACHE_DIR,
+        cache_max_entries=Config.EMBEDDING_CACHE_MAX_ENTRIES,
+        index_backend=Config.VECTOR_INDEX_BACKEND,
+        index_candidates=Config.VECTOR_INDEX_CANDIDATES,
+        index_dir=Config.VECTOR_INDEX_DIR,
+        index_save_seconds=Config.VECTOR_INDEX_SAVE_SECONDS,
+        chunk_tokens=Config.EMBEDDING_CHUNK_TOKENS,
+        chunk_overlap=Config.EMBEDDING_CHUNK_OVERLAP,
+        chunk_pooling=Config.MATCH_CHUNK_POOLING
+    )
+
+def _create_embedding_manager():
+    with timed("import models.embeddings"):
+        from models.embeddings import EmbeddingManager
+    return EmbeddingManager(
+        model_name=Config.EMBEDDING_MODEL,
+        cache_dir=Config.EMBEDDING_CACHE_DIR,
+        cache_max_entries=Config.EMBEDDING_CACHE_MAX_ENTRIES,
+        chunk_tokens=Config.EMBEDDING_CHUNK_TOKENS,
+        chunk_overlap=Config.EMBEDDING_CHUNK_OVERLAP,
+        overfetch=Config.SEARCH_OVERFETCH
+    )
+
+def _create_ats_optimizer():
+    with timed("import models.ats_optimizer"):
+        from models.ats_optimizer import ATSOptimizer
+    return ATSOptimizer(
+        model=Config.GROQ_MODEL,
+        base_url=Config.GROQ_BASE_URL,
+        max_concurrency=Config.LLM_MAX_CONCURRENCY,
+        max_retries=Config.LLM_MAX_RETRIES,
+        prompt_token_budget=Config.LLM_PROMPT_TOKEN_BUDGET,
+        job_prompt_tokens=Config.LLM_JOB_PROMPT_TOKENS,
+        embedding_model=Config.EMBEDDING_MODEL,
+        json_mode=Config.LLM_JSON_MODE,
+        embedding_cache_dir=Config.EMBEDDING_CACHE_DIR,
+        embedding_cache_max_entries=Config.EMBEDDING_CACHE_MAX_ENTRIES,
+        cache_path=Config.LLM_CACHE_PATH or None,
+        cache_ttl_seconds=Config.LLM_CACHE_TTL_SECONDS,
+        cache_max_entries=Config.LLM_CACHE_MAX_ENTRIES
+    )
+
+def _create_job_profiles():
+    with timed("import models.job_profile"):
+        from models.job_profile import JobProfileStore
+    return JobProfileStore(
+        database_path=Config.JOB_PROFILES_PATH,
+        embedding_model=model_registry.canonical_model_name(Config.EMBEDDING_MODEL),
+        max_cached=Config.JOB_PROFILES_MAX_CACHED
+    )
+
+def _create_resume_corpus():
+    with timed("import models.resume_corpus"):
+        from models.resume_corpus import ResumeCorpus
+    return ResumeCorpus(
+        corpus_dir=Config.RESUME_CORPUS_DIR,
+        embedding_model=model_registry.canonical_model_name(Config.EMBEDDING_MODEL)
+    )
+
+def _results_database_path():
+    if Config.RESULTS_STORAGE_BACKEND != "sqlite":
+        return None
+    from models.result_store import sqlite_path_from_url
+    return sqlite_path_from_url(Config.DATABASE_URL)
+
+def _create_ats_storage():
+    with timed("import models.ats_storage"):
+        from models.ats_storage import ATSResultsStorage
+    return ATSResultsStorage(
+        backend=Config.RESULTS_STORAGE_BACKEND,
+        database_path=_results_database_path(),
+        max_records=Config.RESULTS_MAX_RECORDS
+    )
+
+def _create_screening_storage():
+    with timed("import models.screening_storage"):
+        from models.screening_storage import ScreeningResultsStorage
+    return ScreeningResultsStorage(
+        backend=Config.RESULTS_STORAGE_BACKEND,
+        database_path=_results_database_path(),
+        max_records=Config.RESULTS_MAX_RECORDS
+    )
+
+# Initialize components (deferred - see LazyComponent)
 Config.create_directories()
-resume_parser = ResumeParser()
-job_matcher = JobMatcher()
-ats_optimizer = ATSOptimizer()
-ats_storage = ATSResultsStorage()
-screening_storage = ScreeningResultsStorage()
+resume_parser = LazyComponent("resume_parser", _create_resume_parser)
+job_matcher = LazyComponent("job_matcher", _create_job_matcher)
+embedding_manager = LazyComponent("embedding_manager", _create_embedding_manager)
+ats_optimizer = LazyComponent("ats_optimizer", _create_ats_optimizer)
+ats_storage = LazyComponent("ats_storage", _create_ats_storage)
+screening_storage = LazyComponent("screening_storage", _create_screening_storage)
+job_profiles = LazyComponent("job_profiles", _create_job_profiles)
+resume_corpus = LazyComponent("resume_corpus", _create_resume_corpus)
+
+components = {
+    "resume_parser": resume_parser,
+    "job_matcher": job_matcher,
+    "embedding_manager": embedding_manager,
+    "ats_optimizer": ats_optimizer,
+    "ats_storage": ats_storage,
+    "screening_storage": screening_storage,
+    "job_profiles": job_profiles,
+    "resume_corpus": resume_corpus
+}
 
-# Global storage for processed resumes (in production, use a database)
-processed_resumes = []
+warmup_state = {"status": "pending", "error": None}
+
+def warm_up():
+    """Build every component and load the embedding model ahead of the first request"""
+    warmup_state["status"] = "running"
+    try:
+        with timed("warm-up total"):
+            for component in components.values():
+                component.get()
+            with timed("load embedding model"):
+                job_matcher.model
+        warmup_state["status"] = "completed"
+        print(f"✅ Warm-up completed in {startup_timings['warm-up total']:.2f}s")
+    except Exception as e:
+        warmup_state["status"] = "failed"
+        warmup_state["error"] = str(e)
+        print(f"❌ Warm-up failed: {e}")
+
+@app.on_event("startup")
+async def start_warm_up():
+    """Kick off warm-up in the background so the server starts accepting requests immediately"""
+    if Config.WARMUP_ON_STARTUP:
+        threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+    else:
+        warmup_state["status"] = "disabled"
+
+@app.on_event("shutdown")
+async def shut_down_components():
+    """Terminate the resume parser's worker pool and save unsaved vector index changes"""
+    if resume_parser.is_initialized:
+        resume_parser.get().close()
+    if job_matcher.is_initialized:
+        job_matcher.get().save_vector_index()
 
 @app.get("/")
 async def root():
@@ -68,24 +219,248 @@ async def root():
             "upload_resumes": "/upload-resumes/",
             "match_resumes": "/match-resumes/",
             "optimize_resume": "/optimize-resume/",
+            "optimize_resume_stream": "/optimize-resume/stream/",
+            "optimize_resumes_batch": "/optimize-resumes/batch/",
+            "jobs": "/jobs/",
+            "resumes": "/resume-list/",
             "ats_results": "/ats-results/",
             "ats_statistics": "/ats-statistics/",
             "screening_results": "/screening-results/",
             "screening_statistics": "/screening-statistics/",
             "health": "/health/",
+            "ready": "/ready",
             "stats": "/stats/"
         }
     }
 
 @app.get("/health/")
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint (never builds components or touches storage)"""
     return {
         "status": "healthy",
         "api_version": "1.0.0",
-        "total_processed_resumes": len(processed_resumes)
+        "total_processed_resumes": resume_corpus.count() if resume_corpus.is_initialized else None
+    }
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness endpoint: 200 once every component is built and the embedding model is loaded.
+
+    Unlike /health/ (liveness), this returns 503 while warm-up is still running.
+    """
+    component_status = {name: component.is_initialized for name, component in components.items()}
+    model_loaded = model_registry.is_loaded(Config.EMBEDDING_MODEL)
+    ready = all(component_status.values()) and model_loaded
+    
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "ready": ready,
+            "warmup": warmup_state,
+            "components": component_status,
+            "embedding_model_loaded": model_loaded,
+            "startup_timings": startup_timings
+        }
+    )
+
+# Blocking halves of the CPU-heavy endpoints. They run on the shared executor via
+# run_blocking(), so component access (and first-use initialization) also happens
+# off the event loop.
+def _corpus_resumes():
+    """Every resume in the corpus, embedding (and storing) any stored without embeddings, e.g. after a model change"""
+    resumes = resume_corpus.resumes()
+    missing = [
+        resume for resume in resumes
+        if resume['parsing_status'] == 'success' and resume['full_text'] and resume.get('chunk_embeddings') is None
+    ]
+    if missing:
+        missing = [dict(resume) for resume in missing]  # corpus dicts are shared
+        job_matcher.embed_resumes(missing)
+        resume_corpus.add(missing)
+        resumes = resume_corpus.resumes()
+    return resumes
+
+def _require_resumes(resumes):
+    if not resumes:
+        raise HTTPException(status_code=400, detail="No resumes uploaded yet. Please upload resumes first.")
+
+def _save_parse_and_index(uploads):
+    """Write uploaded files to disk, parse and embed the new ones, add them to the corpus and build the match index.
+
+    Files already in the corpus (same bytes) are not parsed again; their stored
+    record is returned and the duplicate upload is removed.
+    """
+    for source, file_path in uploads:
+        with open(file_path, "wb") as buffer:
+            shutil.copyfileobj(source, buffer)
+    
+    file_paths = [file_path for _, file_path in uploads]
+    resume_ids = [resume_corpus.file_id(file_path) for file_path in file_paths]
+    known = {
+        resume_id: resume for resume_id, resume in resume_corpus.get_many(resume_ids).items()
+        if resume['parsing_status'] == 'success'
+    }
+    to_parse = [(resume_id, file_path) for resume_id, file_path in zip(resume_ids, file_paths) if resume_id not in known]
+    parsed = resume_parser.batch_parse_resumes([file_path for _, file_path in to_parse]) if to_parse else []
+    for (resume_id, _), parsed_resume in zip(to_parse, parsed):
+        parsed_resume['resume_id'] = resume_id
+    
+    for resume_id, file_path in zip(resume_ids, file_paths):
+        if resume_id in known and os.path.exists(file_path):
+            os.remove(file_path)
+    
+    job_matcher.embed_resumes([resume for resume in parsed if resume['parsing_status'] == 'success'])
+    resume_corpus.add(parsed)
+    parsed_by_id = {resume['resume_id']: resume for resume in parsed}
+    parsing_results = [known.get(resume_id) or parsed_by_id[resume_id] for resume_id in resume_ids]
+    
+    # Create searchable index for job matching over the whole corpus
+    success = job_matcher.create_resume_index(_corpus_resumes())
+    return parsing_results, success, len(resume_ids) - len(to_parse)
+
+def _remove_resume(resume_id):
+    """Take a resume out of the corpus and the match index; False if it was not in the corpus"""
+    if not resume_corpus.remove([resume_id]):
+        return False
+    job_matcher.remove_resumes([resume_id])
+    return True
+
+def _clear_all_data():
+    """Empty the corpus, match index, vector store, upload folder and ATS results; (files removed, ATS results cleared)"""
+    resume_corpus.clear()
+    
+    # Clear vector store/index if available
+    try:
+        job_matcher.clear_index()
+        if embedding_manager.is_initialized:
+            embedding_manager.clear_collection()
+    except Exception as e:
+        print(f"[DEBUG] Could not clear vector store: {e}")
+    
+    # Clean up uploaded files
+    files_cleaned = 0
+    if os.path.exists(Config.UPLOAD_FOLDER):
+        for file in os.listdir(Config.UPLOAD_FOLDER):
+            file_path = os.path.join(Config.UPLOAD_FOLDER, file)
+            if os.path.isfile(file_path):
+                try:
+                    os.remove(file_path)
+                    files_cleaned += 1
+                except Exception as e:
+                    print(f"[DEBUG] Could not remove file {file_path}: {e}")
+    
+    # Clear ATS optimization results
+    try:
+        ats_storage.clear_results()
+        ats_cleared = True
+    except Exception as e:
+        print(f"[DEBUG] Could not clear ATS results: {e}")
+        ats_cleared = False
+    
+    return files_cleaned, ats_cleared
+
+def _build_job_profile(job_description):
+    from models.job_profile import JobProfile
+    return JobProfile.build(job_description, job_matcher, ats_optimizer)
+
+def _job_profile(job_description):
+    """The stored JobProfile of a job description, built (embedding, keywords, analysis) on first use"""
+    return job_profiles.get_or_create(job_description, _build_job_profile)
+
+def _check_job_input(job_description, job_id):
+    """A request names its job by a registered job_id or by the job description itself"""
+    if not job_id and not job_description.strip():
+        raise HTTPException(status_code=400, detail="Job description cannot be empty (or pass a registered job_id)")
+
+def _resolve_job_profile(job_description, job_id=None):
+    """The JobProfile of a registered job_id (see /jobs/), or of the job description when no id is given"""
+    if job_id:
+        profile = job_profiles.get_by_id(job_id, _build_job_profile)
+        if profile is None:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        return profile
+    return _job_profile(job_description)
+
+def _match_and_save(job_description, top_k, job_id=None):
+    """Rank the corpus against the job (registered job_id or description) and store the screening result"""
+    resumes = _corpus_resumes()
+    _require_resumes(resumes)
+    profile = _resolve_job_profile(job_description, job_id)
+    job_description = profile.description
+    matches = job_matcher.match_resumes(resumes, job_description, top_k, job_profile=profile)
+    
+    # Save screening results to storage
+    screening_id = screening_storage.save_screening_result(
+        job_description=job_description,
+        total_candidates=len(resumes),
+        matches=matches,
+        top_k=top_k,
+        session_info={
+            "endpoint": "/match-resumes/",
+            "method": "POST"
+        },
+        job_id=profile.job_id
+    )
+    return matches, screening_id, profile.job_id, len(resumes)
+
+def _sync_and_search(job_description, page, page_size, aggregate, filters):
+    """Bring the vector store up to date with the resume corpus, then fetch one page of results"""
+    resumes = resume_corpus.resumes()
+    _require_resumes(resumes)
+    embedding_manager.add_resume_embeddings(resumes)
+    return embedding_manager.search_resumes_page(job_description, page, page_size, aggregate, filters)
+
+def _save_and_parse(source, temp_file_path):
+    """Write one uploaded resume to disk and parse it"""
+    with open(temp_file_path, "wb") as buffer:
+        shutil.copyfileobj(source, buffer)
+    
+    # Parse the resume
+    parsed_resume = resume_parser.parse_resume(temp_file_path)
+    
+    if parsed_resume['parsing_status'] != 'success':
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Failed to parse resume: {parsed_resume.get('error_message', 'Unknown error')}"
+        )
+    
+    # Build the optimizer here, off the event loop, before the async call uses it
+    ats_optimizer.get()
+    return parsed_resume
+
+def _save_and_parse_batch(uploads):
+    """Write uploaded resumes to disk and parse them (in parallel, see ResumeParser)"""
+    for source, file_path in uploads:
+        with open(file_path, "wb") as buffer:
+            shutil.copyfileobj(source, buffer)
+    return resume_parser.batch_parse_resumes([file_path for _, file_path in uploads])
+
+def _resume_info(parsed_resume):
+    """The parsed resume fields returned and stored with an optimization result"""
+    return {
+        "file_name": parsed_resume['file_name'],
+        "name": parsed_resume['name'],
+        "email": parsed_resume['email'],
+        "word_count": parsed_resume['word_count'],
+        "skills_found": parsed_resume['skills']
     }
 
+def _analyze_and_save(parsed_resume, profile, optimization_results):
+    """Store the optimization result with the job profile's analysis"""
+    job_analysis = profile.analysis
+    
+    resume_info = _resume_info(parsed_resume)
+    
+    # Save optimization results to storage
+    result_id = ats_storage.save_optimization_result(
+        resume_info=resume_info,
+        job_description=profile.description,
+        optimization_results=optimization_results,
+        job_analysis=job_analysis,
+        job_id=profile.job_id
+    )
+    return resume_info, job_analysis, result_id
+
 @app.post("/upload-resumes/")
 async def upload_resumes(files: List[UploadFile] = File(...)):
     """Upload and process multiple resume files"""
@@ -96,12 +471,9 @@ async def upload_resumes(files: List[UploadFile] = File(...)):
         raise HTTPException(status_code=400, detail="Maximum 20 files allowed per upload")
     
     uploaded_files = []
+    uploads = []
     parsing_results = []
     
-    # Clear previous processed resumes for new batch
-    processed_resumes.clear()
-    print(f"[DEBUG] Cleared previous resumes, starting fresh upload of {len(files)} files")
-    
     try:
         for file in files:
             # Validate file type
@@ -124,14 +496,12 @@ async def upload_resumes(files: List[UploadFile] = File(...)):
             
             print(f"[DEBUG] Uploading file: {file.filename} -> {unique_filename}")
             
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            
             uploaded_files.append(file_path)
+            uploads.append((file.file, file_path))
         
-        # Parse all uploaded resumes
+        # Save, parse and index all uploaded resumes off the event loop
         if uploaded_files:
-            parsing_results = resume_parser.batch_parse_resumes(uploaded_files)
+            parsing_results, success, already_stored = await run_blocking("upload", _save_parse_and_index, uploads)
             
             # Debug: Show what was parsed
             print(f"[DEBUG] Parsed {len(parsing_results)} resumes:")
@@ -140,13 +510,8 @@ async def upload_resumes(files: List[UploadFile] = File(...)):
                 if result.get('name'):
                     print(f"[DEBUG]   Candidate: {result.get('name')} - Email: {result.get('email', 'None')}")
             
-            # Add to global storage (replace with database in production)
-            processed_resumes.extend(parsing_results)
-            
-            print(f"[DEBUG] Total resumes in global storage: {len(processed_resumes)}")
-            
-            # Create searchable index for job matching
-            success = job_matcher.create_resume_index(parsing_results)
+            total_resumes = resume_corpus.count()
+            print(f"✅ Resume corpus: {total_resumes} resumes ({already_stored} already stored, not parsed again)")
             
             # Prepare response
             successful_parses = [r for r in parsing_results if r['parsing_status'] == 'success']
@@ -158,8 +523,11 @@ async def upload_resumes(files: List[UploadFile] = File(...)):
                 "successful_parses": len(successful_parses),
                 "failed_parses": len(failed_parses),
                 "index_created": success,
+                "already_stored": already_stored,
+                "total_resumes_in_corpus": total_resumes,
                 "processed_resumes": [
                     {
+                        "resume_id": r['resume_id'],
                         "file_name": r['file_name'],
                         "name": r['name'],
                         "email": r['email'],
@@ -187,109 +555,130 @@ async def upload_resumes(files: List[UploadFile] = File(...)):
         raise HTTPException(status_code=500, detail=f"Error processing files: {str(e)}")
 
 @app.post("/match-resumes/")
-async def match_resumes(job_description: str = Form(...), top_k: int = Form(3)):
-    """Find resumes that best match a job description"""
-    if not job_description.strip():
-        raise HTTPException(status_code=400, detail="Job description cannot be empty")
-    
-    if not processed_resumes:
-        raise HTTPException(status_code=400, detail="No resumes uploaded yet. Please upload resumes first.")
+async def match_resumes(job_description: str = Form(""), top_k: int = Form(3), job_id: Optional[str] = Form(None)):
+    """Find resumes that best match a job description (or a job registered with /jobs/, by job_id)"""
+    _check_job_input(job_description, job_id)
     
     if top_k < 1 or top_k > 10:
         raise HTTPException(status_code=400, detail="top_k must be between 1 and 10")
     
     try:
-        # Get matching results
-        matches = job_matcher.match_resumes(processed_resumes, job_description, top_k)
-        
-        # Save screening results to storage
-        screening_id = screening_storage.save_screening_result(
-            job_description=job_description,
-            total_candidates=len(processed_resumes),
-            matches=matches,
-            top_k=top_k,
-            session_info={
-                "endpoint": "/match-resumes/",
-                "method": "POST"
-            }
+        # Matches against a snapshot of the corpus, so a concurrent upload cannot change the list mid-ranking
+        matches, screening_id, job_id, total_candidates = await run_blocking(
+            "match", _match_and_save, job_description, top_k, job_id
         )
         
         return {
             "success": True,
             "screening_id": screening_id,  # Unique ID for this screening
-            "job_description_length": len(job_description),
-            "total_candidates_in_db": len(processed_resumes),
+            "job_id": job_id,
+            "job_description_length": len(job_description) if job_description.strip() else None,
+            "total_candidates_in_db": total_candidates,
             "matches": matches,
             "total_matches": len(matches),
             "saved_to_database": screening_id is not None
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error matching resumes: {str(e)}")
 
+@app.post("/search-resumes/")
+async def search_resumes(
+    job_description: str = Form(""),
+    job_id: Optional[str] = Form(None),
+    page: int = Form(1),
+    page_size: int = Form(10),
+    aggregate: str = Form("best"),
+    min_experience: Optional[float] = Form(None),
+    required_skills: str = Form(""),
+    file_names: str = Form(""),
+    resume_ids: str = Form("")
+):
+    """Browse uploaded resumes by semantic similarity to a job description, one page at a time.
+
+    The job is a description or a job_id registered with /jobs/. Optional filters
+    (applied inside the vector query): min_experience in years, required_skills,
+    file_names and resume_ids as comma-separated lists.
+    """
+    _check_job_input(job_description, job_id)
+    
+    if page < 1:
+        raise HTTPException(status_code=400, detail="page must be 1 or greater")
+    
+    if page_size < 1 or page_size > Config.SEARCH_MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"page_size must be between 1 and {Config.SEARCH_MAX_PAGE_SIZE}")
+    
+    if aggregate not in ("best", "mean"):
+        raise HTTPException(status_code=400, detail="aggregate must be 'best' or 'mean'")
+    
+    filters = {}
+    if min_experience:
+        filters["min_experience"] = min_experience
+    if required_skills.strip():
+        filters["required_skills"] = [skill.strip() for skill in required_skills.split(",") if skill.strip()]
+    if file_names.strip():
+        filters["file_names"] = [name.strip() for name in file_names.split(",") if name.strip()]
+    if resume_ids.strip():
+        filters["resume_ids"] = [resume_id.strip() for resume_id in resume_ids.split(",") if resume_id.strip()]
+    
+    try:
+        if job_id:
+            job_description = (await run_blocking("match", _resolve_job_profile, job_description, job_id)).description
+        results = await run_blocking("match", _sync_and_search, job_description, page, page_size,
+                                     aggregate, filters)
+        return {"success": True, **results}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching resumes: {str(e)}")
+
 @app.post("/optimize-resume/")
 async def optimize_resume(
     file: UploadFile = File(...),
-    job_description: str = Form(...)
+    job_description: str = Form(""),
+    job_id: Optional[str] = Form(None)
 ):
-    """Optimize a single resume for ATS and job description"""
+    """Optimize a single resume for ATS and job description (or a job registered with /jobs/, by job_id)"""
     if not file.filename.lower().endswith(('.pdf', '.docx', '.txt')):
         raise HTTPException(status_code=400, detail="Only PDF, DOCX, and TXT files are supported")
     
-    if not job_description.strip():
-        raise HTTPException(status_code=400, detail="Job description cannot be empty")
+    _check_job_input(job_description, job_id)
     
     temp_file_path = None
     
     try:
-        # Save uploaded file temporarily
-        temp_file_path = os.path.join(Config.UPLOAD_FOLDER, f"temp_{file.filename}")
-        
-        with open(temp_file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        # Parse the resume
-        parsed_resume = resume_parser.parse_resume(temp_file_path)
+        # Save uploaded file temporarily. The name is unique because requests run
+        # concurrently; it follows the name_tag_id.ext pattern the parser strips back
+        # to the original filename.
+        import uuid
+        base_name, file_extension = os.path.splitext(file.filename)
+        temp_file_path = os.path.join(
+            Config.UPLOAD_FOLDER, f"{base_name}_temp_{uuid.uuid4().hex[:8]}{file_extension}"
+        )
         
-        if parsed_resume['parsing_status'] != 'success':
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Failed to parse resume: {parsed_resume.get('error_message', 'Unknown error')}"
-            )
+        parsed_resume = await run_blocking("optimize", _save_and_parse, file.file, temp_file_path)
+        profile = await run_blocking("optimize", _resolve_job_profile, job_description, job_id)
         
-        # Get optimization suggestions
-        optimization_results = ats_optimizer.optimize_resume(
-            parsed_resume['full_text'], 
-            job_description
+        # Get optimization suggestions. The Groq call is awaited on the event loop
+        # through the async client, so no worker thread sits idle during it.
+        optimization_results = await ats_optimizer.optimize_resume_async(
+            parsed_resume['full_text'],
+            profile.description,
+            profile.ats_keywords
         )
         
-        # Analyze job description
-        job_analysis = ats_optimizer.analyze_job_keywords(job_description)
-        
-        # Save optimization results to storage
-        result_id = ats_storage.save_optimization_result(
-            resume_info={
-                "file_name": parsed_resume['file_name'],
-                "name": parsed_resume['name'],
-                "email": parsed_resume['email'],
-                "word_count": parsed_resume['word_count'],
-                "skills_found": parsed_resume['skills']
-            },
-            job_description=job_description,
-            optimization_results=optimization_results,
-            job_analysis=job_analysis
+        resume_info, job_analysis, result_id = await run_blocking(
+            "optimize", _analyze_and_save, parsed_resume, profile, optimization_results
         )
         
         return {
             "success": True,
             "result_id": result_id,  # Unique ID for this optimization
-            "resume_info": {
-                "file_name": parsed_resume['file_name'],
-                "name": parsed_resume['name'],
-                "email": parsed_resume['email'],
-                "word_count": parsed_resume['word_count'],
-                "skills_found": parsed_resume['skills']
-            },
+            "job_id": profile.job_id,
+            "resume_info": resume_info,
             "job_analysis": job_analysis,
             "optimization_results": optimization_results,
             "saved_to_database": result_id is not None
@@ -305,63 +694,414 @@ async def optimize_resume(
         if temp_file_path and os.path.exists(temp_file_path):
             os.remove(temp_file_path)
 
-@app.get("/stats/")
-async def get_statistics():
-    """Get system statistics"""
+@app.post("/optimize-resumes/batch/")
+async def optimize_resumes_batch(
+    files: List[UploadFile] = File(...),
+    job_description: str = Form(""),
+    job_id: Optional[str] = Form(None)
+):
+    """Optimize many resumes for one job description.
+    
+    The job description is analyzed once (its JobProfile). The resumes are parsed in parallel, then
+    optimized concurrently (at most BATCH_OPTIMIZE_CONCURRENCY at a time; the Groq
+    client applies its own limit). Each file gets its own entry in results, in upload order, failed
+    ones with an error; timing breaks down where the time went.
+    """
+    if not files:
+        raise HTTPException(status_code=400, detail="No files uploaded")
+    
+    if len(files) > Config.BATCH_OPTIMIZE_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Maximum {Config.BATCH_OPTIMIZE_MAX_FILES} files allowed per batch"
+        )
+    
+    _check_job_input(job_description, job_id)
+    
+    batch_started = time.perf_counter()
+    # One entry per uploaded file, in upload order
+    results = [None] * len(files)
+    uploads = []
+    positions = []
+    
+    import uuid
+    for index, file in enumerate(files):
+        if not file.filename.lower().endswith(('.pdf', '.docx', '.txt')):
+            results[index] = {
+                "file_name": file.filename,
+                "success": False,
+                "error": "Only PDF, DOCX, and TXT files are supported"
+            }
+            continue
+        base_name, file_extension = os.path.splitext(file.filename)
+        temp_file_path = os.path.join(
+            Config.UPLOAD_FOLDER, f"{base_name}_temp_{uuid.uuid4().hex[:8]}{file_extension}"
+        )
+        uploads.append((file.file, temp_file_path))
+        positions.append(index)
+    
     try:
-        # Calculate processing statistics
-        successful_resumes = [r for r in processed_resumes if r['parsing_status'] == 'success']
-        failed_resumes = [r for r in processed_resumes if r['parsing_status'] == 'error']
-        
-        # Get skill statistics
-        all_skills = []
-        for resume in successful_resumes:
-            all_skills.extend(resume['skills'])
+        # Job description keywords and analysis, once for the whole batch
+        started = time.perf_counter()
+        profile = await run_blocking("optimize", _resolve_job_profile, job_description, job_id)
+        job_description = profile.description
+        job_keywords, job_analysis = profile.ats_keywords, profile.analysis
+        job_analysis_seconds = time.perf_counter() - started
         
-        skill_counts = {}
-        for skill in all_skills:
-            skill_counts[skill] = skill_counts.get(skill, 0) + 1
+        started = time.perf_counter()
+        parsed_resumes = await run_blocking("optimize", _save_and_parse_batch, uploads) if uploads else []
+        parse_seconds = time.perf_counter() - started
         
-        top_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        semaphore = asyncio.Semaphore(Config.BATCH_OPTIMIZE_CONCURRENCY)
         
-        # Get vector store stats if available
-        matcher_stats = {}
-        try:
-            if hasattr(job_matcher, 'resume_index'):
-                matcher_stats = {
-                    "resumes_in_index": len(job_matcher.resume_index),
-                    "index_status": "active" if job_matcher.resume_index else "empty"
+        async def optimize_one(parsed_resume):
+            if parsed_resume['parsing_status'] != 'success':
+                return {
+                    "file_name": parsed_resume['file_name'],
+                    "success": False,
+                    "error": f"Failed to parse resume: {parsed_resume.get('error_message', 'Unknown error')}"
+                }
+            
+            async with semaphore:
+                file_started = time.perf_counter()
+                try:
+                    optimization_results = await ats_optimizer.optimize_resume_async(
+                        parsed_resume['full_text'], job_description, job_keywords
+                    )
+                    resume_info = _resume_info(parsed_resume)
+                    result_id = await run_blocking("optimize", lambda: ats_storage.save_optimization_result(
+                        resume_info=resume_info,
+                        job_description=job_description,
+                        optimization_results=optimization_results,
+                        job_analysis=job_analysis,
+                        job_id=profile.job_id
+                    ))
+                except Exception as e:
+                    print(f"❌ Error optimizing {parsed_resume['file_name']}: {e}")
+                    return {"file_name": parsed_resume['file_name'], "success": False, "error": str(e)}
+                
+                return {
+                    "file_name": parsed_resume['file_name'],
+                    "success": True,
+                    "result_id": result_id,
+                    "resume_info": resume_info,
+                    "optimization_results": optimization_results,
+                    "saved_to_database": result_id is not None,
+                    "seconds": round(time.perf_counter() - file_started, 3)
                 }
-        except:
-            matcher_stats = {"index_status": "unavailable"}
         
-        # Get ATS optimization statistics
-        ats_stats = ats_storage.get_statistics()
+        started = time.perf_counter()
+        optimized_results = await asyncio.gather(*(optimize_one(parsed) for parsed in parsed_resumes))
+        for index, result in zip(positions, optimized_results):
+            results[index] = result
+        optimize_seconds = time.perf_counter() - started
         
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error optimizing resumes: {str(e)}")
+    
+    finally:
+        # Clean up temporary files
+        for _, temp_file_path in uploads:
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+    
+    optimized = [result for result in results if result['success']]
+    file_seconds = [result['seconds'] for result in optimized]
+    total_seconds = time.perf_counter() - batch_started
+    
+    return {
+        "success": True,
+        "total_files": len(files),
+        "optimized": len(optimized),
+        "failed": len(results) - len(optimized),
+        "job_id": profile.job_id,
+        "job_analysis": job_analysis,
+        "results": results,
+        "timing": {
+            "total_seconds": round(total_seconds, 3),
+            "job_analysis_seconds": round(job_analysis_seconds, 3),
+            "parse_seconds": round(parse_seconds, 3),
+            "optimize_seconds": round(optimize_seconds, 3),
+            "avg_file_seconds": round(sum(file_seconds) / len(file_seconds), 3) if file_seconds else 0,
+            "max_file_seconds": max(file_seconds, default=0),
+            "cached_answers": sum(
+                bool(result['optimization_results'].get('llm_usage', {}).get('cached')) for result in optimized
+            ),
+            "files_per_second": round(len(optimized) / total_seconds, 2) if total_seconds else 0
+        }
+    }
+
+def _sse_event(event, data):
+    """One server-sent event carrying a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.post("/optimize-resume/stream/")
+async def optimize_resume_stream(
+    file: UploadFile = File(...),
+    job_description: str = Form(""),
+    job_id: Optional[str] = Form(None)
+):
+    """Optimize a single resume, sending results as server-sent events as they become ready.
+    
+    Events in order: resume_info, job_analysis, basic_analysis (keyword analysis,
+    no AI), token (one per piece of the AI answer), optimization (the final report,
+    as in /optimize-resume/) and saved (result_id, job_id); error replaces the rest on failure.
+    """
+    if not file.filename.lower().endswith(('.pdf', '.docx', '.txt')):
+        raise HTTPException(status_code=400, detail="Only PDF, DOCX, and TXT files are supported")
+    
+    _check_job_input(job_description, job_id)
+    
+    # Parse before the stream starts so upload problems (and unknown job ids) still get a proper status code
+    temp_file_path = None
+    try:
+        import uuid
+        base_name, file_extension = os.path.splitext(file.filename)
+        temp_file_path = os.path.join(
+            Config.UPLOAD_FOLDER, f"{base_name}_temp_{uuid.uuid4().hex[:8]}{file_extension}"
+        )
+        parsed_resume = await run_blocking("optimize", _save_and_parse, file.file, temp_file_path)
+        if job_id:
+            await run_blocking("optimize", _resolve_job_profile, job_description, job_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error optimizing resume: {str(e)}")
+    finally:
+        if temp_file_path and os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+    
+    resume_info = _resume_info(parsed_resume)
+    
+    async def events():
+        yield _sse_event("resume_info", resume_info)
+        try:
+            profile = await run_blocking("optimize", _resolve_job_profile, job_description, job_id)
+            job_analysis = profile.analysis
+            yield _sse_event("job_analysis", job_analysis)
+            
+            optimization_results = {}
+            async for event, data in ats_optimizer.optimize_resume_stream(
+                parsed_resume['full_text'], profile.description, profile.ats_keywords
+            ):
+                if event == "optimization":
+                    optimization_results = data
+                yield _sse_event(event, data)
+            
+            result_id = await run_blocking("optimize", lambda: ats_storage.save_optimization_result(
+                resume_info=resume_info,
+                job_description=profile.description,
+                optimization_results=optimization_results,
+                job_analysis=job_analysis,
+                job_id=profile.job_id
+            ))
+            yield _sse_event("saved", {
+                "result_id": result_id,
+                "job_id": profile.job_id,
+                "saved_to_database": result_id is not None
+            })
+        except Exception as e:
+            print(f"❌ Error streaming optimization: {e}")
+            yield _sse_event("error", {"detail": f"Error optimizing resume: {str(e)}"})
+    
+    # No caching or proxy buffering (nginx), so every event reaches the client as it is sent
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _register_job(job_description, title):
+    """Store the job's profile (once per distinct description) and label it; returns (profile, created)"""
+    from models.job_profile import job_id_for
+    created = job_profiles.get_by_id(job_id_for(job_description), _build_job_profile) is None
+    profile = _job_profile(job_description)
+    if title and title != profile.title:
+        profile = job_profiles.set_title(profile.job_id, title)
+    return profile, created
+
+@app.post("/jobs/")
+async def create_job(job_description: str = Form(...), title: str = Form("")):
+    """Register a job description; later requests can pass its job_id instead of the text.
+
+    The job_id is a hash of the description, so posting the same description again
+    returns the existing job (created is false).
+    """
+    if not job_description.strip():
+        raise HTTPException(status_code=400, detail="Job description cannot be empty")
+
+    try:
+        profile, created = await run_blocking("match", _register_job, job_description, title.strip() or None)
         return {
-            "total_resumes": len(processed_resumes),
-            "total_resumes_processed": len(processed_resumes),
-            "successful_parses": len(successful_resumes),
-            "failed_parses": len(failed_resumes),
-            "success_rate": round(len(successful_resumes) / len(processed_resumes) * 100, 2) if processed_resumes else 0,
-            "vector_store_stats": matcher_stats,
-            "top_skills_found": top_skills,
-            "top_skills": [{"name": skill, "count": count} for skill, count in top_skills],
-            "most_common_skill": top_skills[0][0] if top_skills else None,
-            "average_word_count": round(sum(r['word_count'] for r in successful_resumes) / len(successful_resumes)) if successful_resumes else 0,
-            "resumes_with_email": len([r for r in successful_resumes if r['email']]),
-            "resumes_with_phone": len([r for r in successful_resumes if r['phone']]),
-            "match_score_distribution": [85, 92, 78, 88, 95] if len(successful_resumes) > 0 else [],
-            "optimization_trends": [
-                {"date": "2025-06-20", "score": 85},
-                {"date": "2025-06-21", "score": 88},
-                {"date": "2025-06-22", "score": 92},
-                {"date": "2025-06-23", "score": 90},
-                {"date": "2025-06-24", "score": 95}
-            ] if len(successful_resumes) > 0 else [],
-            "ats_optimization_stats": ats_stats
+            "success": True,
+            "job_id": profile.job_id,
+            "created": created,
+            "job": profile.to_dict()
         }
-        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error registering job: {str(e)}")
+
+@app.get("/jobs/")
+async def list_jobs(limit: int = 50, offset: int = 0):
+    """List registered jobs, most recently used first (without their descriptions)"""
+    try:
+        jobs, total_jobs = await run_blocking(
+            "match", lambda: (job_profiles.list(limit, offset), job_profiles.stats()["entries"])
+        )
+        return {
+            "success": True,
+            "total_jobs": total_jobs,
+            "jobs": jobs
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error listing jobs: {str(e)}")
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get a registered job with its description and analysis"""
+    try:
+        profile = await run_blocking("match", _resolve_job_profile, "", job_id)
+        return {
+            "success": True,
+            "job": profile.to_dict()
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving job: {str(e)}")
+
+@app.put("/jobs/{job_id}")
+async def update_job(job_id: str, title: str = Form("")):
+    """Change the title of a registered job.
+
+    The description cannot change, since the job_id is its hash: post a new job instead.
+    """
+    try:
+        profile = await run_blocking("match", lambda: job_profiles.set_title(job_id, title.strip() or None))
+        if profile is None:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        return {
+            "success": True,
+            "job": profile.to_dict(include_description=False)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error updating job: {str(e)}")
+
+@app.delete("/jobs/{job_id}")
+async def delete_job(job_id: str):
+    """Remove a registered job (stored screening and optimization results are kept)"""
+    try:
+        if not await run_blocking("match", lambda: job_profiles.delete(job_id)):
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        return {
+            "success": True,
+            "message": f"Job {job_id} deleted"
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error deleting job: {str(e)}")
+
+@app.get("/jobs/{job_id}/results")
+async def get_job_results(job_id: str, limit: int = 10):
+    """Get the screening and ATS optimization results stored for a job"""
+    try:
+        screening_results, ats_results = await run_blocking("match", lambda: (
+            screening_storage.get_results_by_job_hash(job_id, limit),
+            ats_storage.get_results_by_job_hash(job_id, limit)
+        ))
+        return {
+            "success": True,
+            "job_id": job_id,
+            "screening_results": screening_results,
+            "ats_results": ats_results
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting job results: {str(e)}")
+
+def _collect_statistics():
+    """Body of /stats/. Components that have not been built yet are reported as None
+    instead of being loaded just to be counted."""
+    # Calculate processing statistics
+    resumes = resume_corpus.resumes() if resume_corpus.is_initialized else []
+    successful_resumes = [r for r in resumes if r['parsing_status'] == 'success']
+    failed_resumes = [r for r in resumes if r['parsing_status'] == 'error']
+    
+    # Get skill statistics
+    all_skills = []
+    for resume in successful_resumes:
+        all_skills.extend(resume['skills'])
+    
+    skill_counts = {}
+    for skill in all_skills:
+        skill_counts[skill] = skill_counts.get(skill, 0) + 1
+    
+    top_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+    
+    # Get vector store stats if available
+    matcher_stats = {"index_status": "not loaded"}
+    try:
+        if job_matcher.is_initialized and hasattr(job_matcher, 'resume_index'):
+            matcher_stats = {
+                "resumes_in_index": len(job_matcher.resume_index),
+                "index_status": "active" if job_matcher.resume_index else "empty"
+            }
+    except:
+        matcher_stats = {"index_status": "unavailable"}
+    
+    # Get embedding cache hit/miss counters
+    embedding_cache_stats = None
+    if job_matcher.is_initialized:
+        embedding_cache_stats = job_matcher.embedding_cache.stats() if job_matcher.embedding_cache else {}
+    
+    # Get LLM response cache hit/miss counters
+    llm_cache_stats = llm_client_stats = llm_usage = None
+    if ats_optimizer.is_initialized:
+        llm_cache_stats = ats_optimizer.response_cache.stats() if ats_optimizer.response_cache else {}
+        llm_client_stats = ats_optimizer.async_client.stats() if ats_optimizer.async_client else {}
+        llm_usage = ats_optimizer.usage_stats()
+    
+    return {
+        "total_resumes": len(resumes),
+        "total_resumes_processed": len(resumes),
+        "successful_parses": len(successful_resumes),
+        "failed_parses": len(failed_resumes),
+        "success_rate": round(len(successful_resumes) / len(resumes) * 100, 2) if resumes else 0,
+        "vector_store_stats": matcher_stats,
+        "embedding_cache_stats": embedding_cache_stats,
+        "llm_cache_stats": llm_cache_stats,
+        "llm_client_stats": llm_client_stats,
+        "llm_usage": llm_usage,
+        "job_profile_stats": job_profiles.stats() if job_profiles.is_initialized else None,
+        "resume_corpus_stats": resume_corpus.stats() if resume_corpus.is_initialized else None,
+        "model_memory": model_registry.memory_footprint(),
+        "concurrency": concurrency_stats(),
+        "top_skills_found": top_skills,
+        "top_skills": [{"name": skill, "count": count} for skill, count in top_skills],
+        "most_common_skill": top_skills[0][0] if top_skills else None,
+        "average_word_count": round(sum(r['word_count'] for r in successful_resumes) / len(successful_resumes)) if successful_resumes else 0,
+        "resumes_with_email": len([r for r in successful_resumes if r['email']]),
+        "resumes_with_phone": len([r for r in successful_resumes if r['phone']]),
+        "match_score_distribution": [85, 92, 78, 88, 95] if len(successful_resumes) > 0 else [],
+        "optimization_trends": [
+            {"date": "2025-06-20", "score": 85},
+            {"date": "2025-06-21", "score": 88},
+            {"date": "2025-06-22", "score": 92},
+            {"date": "2025-06-23", "score": 90},
+            {"date": "2025-06-24", "score": 95}
+        ] if len(successful_resumes) > 0 else [],
+        "ats_optimization_stats": ats_storage.get_statistics() if ats_storage.is_initialized else None
+    }
+
+@app.get("/stats/")
+async def get_statistics():
+    """Get system statistics"""
+    try:
+        return await run_blocking("match", _collect_statistics)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting statistics: {str(e)}")
 
@@ -369,37 +1109,7 @@ async def get_statistics():
 async def clear_all_data():
     """Clear all processed resumes and vector store (useful for testing)"""
     try:
-        global processed_resumes
-        processed_resumes.clear()
-        
-        # Clear vector store/index if available
-        try:
-            if hasattr(job_matcher, 'resume_index'):
-                job_matcher.resume_index.clear()
-            if hasattr(job_matcher, 'embedding_manager') and hasattr(job_matcher.embedding_manager, 'clear_collection'):
-                job_matcher.embedding_manager.clear_collection()
-        except Exception as e:
-            print(f"[DEBUG] Could not clear vector store: {e}")
-        
-        # Clean up uploaded files
-        files_cleaned = 0
-        if os.path.exists(Config.UPLOAD_FOLDER):
-            for file in os.listdir(Config.UPLOAD_FOLDER):
-                file_path = os.path.join(Config.UPLOAD_FOLDER, file)
-                if os.path.isfile(file_path):
-                    try:
-                        os.remove(file_path)
-                        files_cleaned += 1
-                    except Exception as e:
-                        print(f"[DEBUG] Could not remove file {file_path}: {e}")
-        
-        # Clear ATS optimization results
-        try:
-            ats_storage.clear_results()
-            ats_cleared = True
-        except Exception as e:
-            print(f"[DEBUG] Could not clear ATS results: {e}")
-            ats_cleared = False
+        files_cleaned, ats_cleared = await run_blocking("upload", _clear_all_data)
         
         return {
             "message": "All data cleared successfully",
@@ -417,8 +1127,9 @@ async def get_resume_list():
     """Get list of all processed resumes"""
     try:
         resume_list = []
-        for resume in processed_resumes:
+        for resume in await run_blocking("match", lambda: resume_corpus.resumes()):
             resume_list.append({
+                "resume_id": resume['resume_id'],
                 "file_name": resume['file_name'],
                 "name": resume['name'],
                 "email": resume['email'],
@@ -437,11 +1148,28 @@ async def get_resume_list():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting resume list: {str(e)}")
 
+@app.delete("/resumes/{resume_id}")
+async def delete_resume(resume_id: str):
+    """Remove one resume from the corpus (it is no longer matched or searched)"""
+    try:
+        if not await run_blocking("upload", _remove_resume, resume_id):
+            raise HTTPException(status_code=404, detail="Resume not found")
+        return {
+            "success": True,
+            "message": f"Resume {resume_id} deleted",
+            "total_resumes": resume_corpus.count()
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error deleting resume: {str(e)}")
+
 @app.get("/debug/resumes/")
 async def debug_resumes():
-    """Debug endpoint to see what resumes are currently in memory"""
+    """Debug endpoint to see what resumes are currently in the corpus"""
+    resumes = await run_blocking("match", lambda: resume_corpus.resumes())
     return {
-        "total_processed_resumes": len(processed_resumes),
+        "total_processed_resumes": len(resumes),
         "resume_list": [
             {
                 "file_name": resume.get('file_name', 'Unknown'),
@@ -450,7 +1178,7 @@ async def debug_resumes():
                 "parsing_status": resume.get('parsing_status', 'Unknown'),
                 "word_count": resume.get('word_count', 0)
             }
-            for resume in processed_resumes
+            for resume in resumes
         ]
     }
 
@@ -458,7 +1186,7 @@ async def debug_resumes():
 async def get_ats_result(result_id: str):
     """Get specific ATS optimization result by ID"""
     try:
-        result = ats_storage.get_optimization_result(result_id)
+        result = await run_blocking("optimize", lambda: ats_storage.get_optimization_result(result_id))
         if result:
             return {
                 "success": True,
@@ -473,7 +1201,7 @@ async def get_ats_result(result_id: str):
 async def get_recent_ats_results(limit: int = 10):
     """Get recent ATS optimization results"""
     try:
-        results = ats_storage.get_recent_results(limit)
+        results = await run_blocking("optimize", lambda: ats_storage.get_recent_results(limit))
         return {
             "success": True,
             "total_results": len(results),
@@ -486,7 +1214,7 @@ async def get_recent_ats_results(limit: int = 10):
 async def get_user_ats_results(email: str, limit: int = 10):
     """Get ATS optimization results for a specific user"""
     try:
-        results = ats_storage.get_user_results(email, limit)
+        results = await run_blocking("optimize", lambda: ats_storage.get_user_results(email, limit))
         return {
             "success": True,
             "email": email,
@@ -500,7 +1228,7 @@ async def get_user_ats_results(email: str, limit: int = 10):
 async def get_ats_statistics():
     """Get ATS optimization statistics"""
     try:
-        stats = ats_storage.get_statistics()
+        stats = await run_blocking("optimize", lambda: ats_storage.get_statistics())
         return {
             "success": True,
             "statistics": stats
@@ -512,7 +1240,7 @@ async def get_ats_statistics():
 async def clear_ats_results():
     """Clear all ATS optimization results (admin/testing use)"""
     try:
-        ats_storage.clear_results()
+        await run_blocking("optimize", lambda: ats_storage.clear_results())
         return {
             "success": True,
             "message": "All ATS optimization results cleared"
@@ -525,7 +1253,7 @@ async def clear_ats_results():
 async def get_screening_result(result_id: str):
     """Get specific screening result by ID"""
     try:
-        result = screening_storage.get_screening_result(result_id)
+        result = await run_blocking("match", lambda: screening_storage.get_screening_result(result_id))
         if result:
             return {
                 "success": True,
@@ -540,7 +1268,7 @@ async def get_screening_result(result_id: str):
 async def get_recent_screening_results(limit: int = 10):
     """Get recent screening results"""
     try:
-        results = screening_storage.get_recent_results(limit)
+        results = await run_blocking("match", lambda: screening_storage.get_recent_results(limit))
         return {
             "success": True,
             "total_results": len(results),
@@ -553,7 +1281,7 @@ async def get_recent_screening_results(limit: int = 10):
 async def get_candidate_screening_history(email: str, limit: int = 10):
     """Get screening history for a specific candidate"""
     try:
-        results = screening_storage.get_candidate_history(email, limit)
+        results = await run_blocking("match", lambda: screening_storage.get_candidate_history(email, limit))
         return {
             "success": True,
             "candidate_email": email,
@@ -567,7 +1295,7 @@ async def get_candidate_screening_history(email: str, limit: int = 10):
 async def get_screening_statistics():
     """Get screening statistics"""
     try:
-        stats = screening_storage.get_statistics()
+        stats = await run_blocking("match", lambda: screening_storage.get_statistics())
         return {
             "success": True,
             "statistics": stats
@@ -579,7 +1307,7 @@ async def get_screening_statistics():
 async def clear_screening_results():
     """Clear all screening results (admin/testing use)"""
     try:
-        screening_storage.clear_results()
+        await run_blocking("match", lambda: screening_storage.clear_results())
         return {
             "success": True,
             "message": "All screening results cleared"
@@ -587,6 +1315,8 @@ async def clear_screening_results():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error clearing screening results: {str(e)}")
 
+startup_timings["import app"] = round(time.perf_counter() - _app_import_started, 4)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
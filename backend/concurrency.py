@@ -0,0 +1,58 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+from config import Config
+
+# One bounded thread pool runs all blocking work (parsing, model encoding,
+# Groq calls, storage I/O) so the event loop stays free for other requests,
+# including /health/. Each endpoint additionally gets its own semaphore so a
+# burst of uploads cannot occupy every worker thread.
+executor = ThreadPoolExecutor(
+    max_workers=Config.BLOCKING_EXECUTOR_WORKERS,
+    thread_name_prefix="blocking"
+)
+
+endpoint_limits: Dict[str, int] = {
+    "upload": Config.UPLOAD_CONCURRENCY,
+    "match": Config.MATCH_CONCURRENCY,
+    "optimize": Config.OPTIMIZE_CONCURRENCY
+}
+
+_semaphores = {name: asyncio.Semaphore(limit) for name, limit in endpoint_limits.items()}
+_in_flight = {name: 0 for name in endpoint_limits}
+_waiting = {name: 0 for name in endpoint_limits}
+
+
+async def run_blocking(endpoint: str, func: Callable, *args, **kwargs):
+    """Run func(*args, **kwargs) on the executor, at most endpoint_limits[endpoint] at a time"""
+    semaphore = _semaphores[endpoint]
+    _waiting[endpoint] += 1
+    try:
+        await semaphore.acquire()
+    finally:
+        _waiting[endpoint] -= 1
+
+    _in_flight[endpoint] += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+    finally:
+        _in_flight[endpoint] -= 1
+        semaphore.release()
+
+
+def concurrency_stats() -> Dict:
+    """Current limits, running and queued calls per endpoint"""
+    return {
+        "executor_workers": Config.BLOCKING_EXECUTOR_WORKERS,
+        "endpoints": {
+            name: {
+                "limit": limit,
+                "in_flight": _in_flight[name],
+                "waiting": _waiting[name]
+            }
+            for name, limit in endpoint_limits.items()
+        }
+    }
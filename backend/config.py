@@ -10,15 +10,66 @@ class Config:
     
     # Database - Uses SQLite (file-based, no server needed!)
     DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./resume_optimizer.db")
+    # Where ATS and screening results are kept: "sqlite" (DATABASE_URL), "journal"
+    # (append-only JSON lines) or "json" (rewritten files); the file backends keep
+    # the newest RESULTS_MAX_RECORDS (0 = the storage's own default)
+    RESULTS_STORAGE_BACKEND = os.getenv("RESULTS_STORAGE_BACKEND", "sqlite")
+    RESULTS_MAX_RECORDS = int(os.getenv("RESULTS_MAX_RECORDS", 0))
     
     # File Settings
     UPLOAD_FOLDER = "./data/resumes"
     MAX_FILE_SIZE_MB = int(os.getenv("MAX_FILE_SIZE_MB", 10))
     ALLOWED_EXTENSIONS = {'pdf', 'docx'}
     
+    # Resume Parsing - "process" spreads batches over a worker pool, "sequential" parses in-line
+    PARSER_EXECUTION_MODE = os.getenv("PARSER_EXECUTION_MODE", "process")
+    PARSER_MAX_WORKERS = int(os.getenv("PARSER_MAX_WORKERS", min(os.cpu_count() or 1, 8)))
+    PARSER_CHUNK_SIZE = int(os.getenv("PARSER_CHUNK_SIZE", 8))
+    PARSER_FILE_TIMEOUT = float(os.getenv("PARSER_FILE_TIMEOUT", 60))
+    PARSER_MIN_PARALLEL_FILES = int(os.getenv("PARSER_MIN_PARALLEL_FILES", 4))  # smaller uploads parse in-line
+
     # AI Models
     EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+    EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", 32))
+    EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", "./data/embedding_cache")
+    EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", 50000))
+    VECTOR_INDEX_BACKEND = os.getenv("VECTOR_INDEX_BACKEND", "brute")  # brute or hnsw
+    VECTOR_INDEX_CANDIDATES = int(os.getenv("VECTOR_INDEX_CANDIDATES", 500))
+    VECTOR_INDEX_DIR = os.getenv("VECTOR_INDEX_DIR", "./data/vector_index")
+    VECTOR_INDEX_SAVE_SECONDS = float(os.getenv("VECTOR_INDEX_SAVE_SECONDS", 30))
+    EMBEDDING_CHUNK_TOKENS = int(os.getenv("EMBEDDING_CHUNK_TOKENS", 0))  # 0: the model's input window
+    EMBEDDING_CHUNK_OVERLAP = int(os.getenv("EMBEDDING_CHUNK_OVERLAP", 32))
+    MATCH_CHUNK_POOLING = os.getenv("MATCH_CHUNK_POOLING", "max")  # max or mean
+    SEARCH_OVERFETCH = float(os.getenv("SEARCH_OVERFETCH", 2.0))
+    SEARCH_MAX_PAGE_SIZE = int(os.getenv("SEARCH_MAX_PAGE_SIZE", 50))
     GROQ_MODEL = "mixtral-8x7b-32768"
+    GROQ_BASE_URL = os.getenv("GROQ_BASE_URL") or None  # e.g. a local stub server
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", 4))
+    LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", 3))
+    # Prompt size: resume + job description tokens (job description at most LLM_JOB_PROMPT_TOKENS)
+    LLM_PROMPT_TOKEN_BUDGET = int(os.getenv("LLM_PROMPT_TOKEN_BUDGET", 900))
+    LLM_JOB_PROMPT_TOKENS = int(os.getenv("LLM_JOB_PROMPT_TOKENS", 300))
+    LLM_JSON_MODE = os.getenv("LLM_JSON_MODE", "true").lower() == "true"
+    # Job descriptions: embedding, keywords and analysis computed once and stored by content hash
+    JOB_PROFILES_PATH = os.getenv("JOB_PROFILES_PATH", "./data/job_profiles.sqlite3")
+    JOB_PROFILES_MAX_CACHED = int(os.getenv("JOB_PROFILES_MAX_CACHED", 256))
+    # Uploaded resumes (parsed fields, text and chunk embeddings), kept across uploads and restarts
+    RESUME_CORPUS_DIR = os.getenv("RESUME_CORPUS_DIR", "./data/resume_corpus")
+    # Persistent cache of Groq responses for /optimize-resume/ (empty path disables it)
+    LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "./data/llm_cache.sqlite3")
+    LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 5000))
+    
+    # Startup - build components and load the embedding model in a background thread
+    WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "true").lower() == "true"
+    
+    # Concurrency - blocking work runs on a shared thread pool, limited per endpoint
+    BLOCKING_EXECUTOR_WORKERS = int(os.getenv("BLOCKING_EXECUTOR_WORKERS", 8))
+    UPLOAD_CONCURRENCY = int(os.getenv("UPLOAD_CONCURRENCY", 2))
+    MATCH_CONCURRENCY = int(os.getenv("MATCH_CONCURRENCY", 4))
+    OPTIMIZE_CONCURRENCY = int(os.getenv("OPTIMIZE_CONCURRENCY", 4))
+    BATCH_OPTIMIZE_MAX_FILES = int(os.getenv("BATCH_OPTIMIZE_MAX_FILES", 50))
+    BATCH_OPTIMIZE_CONCURRENCY = int(os.getenv("BATCH_OPTIMIZE_CONCURRENCY", 8))  # resumes of one batch at a time
     
     # Security
     SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
@@ -28,3 +79,4 @@ class Config:
         """Create necessary directories if they don't exist"""
         os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
         os.makedirs("./data/vector_db", exist_ok=True)
+        os.makedirs(Config.EMBEDDING_CACHE_DIR, exist_ok=True)
@@ -1,13 +1,318 @@
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
 import json
 import re
 import os
+import threading
+import time
 import groq
+import httpx
+import numpy as np
+
+from .keyword_matcher import KeywordMatcher
+from .llm_cache import LLMResponseCache
+from .llm_client import AsyncLLMClient
+from .embedding_cache import get_embedding_cache
+from .model_registry import canonical_model_name, get_model
+from .prompt_builder import PromptBuilder
+from .report_schema import repair_json, schema_example, validate_report
+
+
+# Comprehensive keywords pool organized by department and category
+KEYWORDS_POOL = {
+    # TECHNOLOGY & ENGINEERING
+    'programming_languages': [
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 
+        'rust', 'kotlin', 'swift', 'r', 'matlab', 'scala', 'perl', 'shell', 'bash',
+        'powershell', 'lua', 'dart', 'elixir', 'clojure', 'haskell', 'f#', 'cobol', 'fortran'
+    ],
+    'web_technologies': [
+        'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'next.js', 
+        'nuxt.js', 'gatsby', 'svelte', 'bootstrap', 'tailwind', 'sass', 'less', 
+        'webpack', 'vite', 'parcel', 'rollup', 'jquery', 'backbone.js', 'ember.js',
+        'react native', 'flutter', 'ionic', 'cordova', 'phonegap', 'xamarin'
+    ],
+    'databases': [
+        'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'sql server',
+        'cassandra', 'dynamodb', 'elasticsearch', 'neo4j', 'firebase', 'supabase',
+        'mariadb', 'couchdb', 'influxdb', 'clickhouse', 'bigquery', 'snowflake'
+    ],
+    'frameworks_libraries': [
+        'django', 'flask', 'fastapi', 'spring', 'spring boot', 'laravel', 'rails',
+        'express.js', 'nest.js', 'asp.net', 'xamarin', '.net', 'entity framework',
+        'hibernate', 'struts', 'play framework', 'symfony', 'codeigniter', 'yii'
+    ],
+    'cloud_devops': [
+        'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'jenkins', 
+        'gitlab ci', 'github actions', 'terraform', 'ansible', 'chef', 'puppet', 
+        'vagrant', 'nginx', 'apache', 'linux', 'ubuntu', 'centos', 'redhat',
+        'heroku', 'digitalocean', 'cloudflare', 'lambda', 'ec2', 's3', 'rds'
+    ],
+    'data_science_ai': [
+        'machine learning', 'deep learning', 'artificial intelligence', 'data science',
+        'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras',
+        'matplotlib', 'seaborn', 'plotly', 'jupyter', 'anaconda', 'spark', 'hadoop',
+        'tableau', 'power bi', 'looker', 'qlik', 'nlp', 'computer vision', 'opencv',
+        'neural networks', 'lstm', 'cnn', 'transformers', 'bert', 'gpt'
+    ],
+    
+    # MARKETING & DIGITAL MARKETING
+    'digital_marketing': [
+        'seo', 'sem', 'ppc', 'google ads', 'facebook ads', 'instagram marketing',
+        'linkedin marketing', 'twitter marketing', 'youtube marketing', 'tiktok marketing',
+        'content marketing', 'email marketing', 'affiliate marketing', 'influencer marketing',
+        'social media marketing', 'growth hacking', 'conversion optimization', 'cro'
+    ],
+    'marketing_tools': [
+        'google analytics', 'google tag manager', 'hubspot', 'salesforce marketing cloud',
+        'mailchimp', 'constant contact', 'hootsuite', 'buffer', 'sprout social',
+        'canva', 'adobe creative suite', 'photoshop', 'illustrator', 'indesign',
+        'figma', 'sketch', 'wordpress', 'shopify', 'magento', 'woocommerce'
+    ],
+    'marketing_metrics': [
+        'cpa', 'cpc', 'cpm', 'ctr', 'roi', 'roas', 'ltv', 'cac', 'conversion rate',
+        'bounce rate', 'engagement rate', 'impressions', 'reach', 'frequency',
+        'organic traffic', 'paid traffic', 'lead generation', 'lead nurturing'
+    ],
+    
+    # SALES & BUSINESS DEVELOPMENT
+    'sales_skills': [
+        'prospecting', 'lead qualification', 'cold calling', 'cold emailing',
+        'relationship building', 'account management', 'territory management',
+        'pipeline management', 'forecasting', 'negotiation', 'closing deals',
+        'upselling', 'cross-selling', 'customer retention', 'b2b sales', 'b2c sales'
+    ],
+    'sales_tools': [
+        'salesforce', 'hubspot crm', 'pipedrive', 'zoho crm', 'freshsales',
+        'outreach.io', 'salesloft', 'linkedin sales navigator', 'zoominfo',
+        'apollo.io', 'clearbit', 'gong', 'chorus', 'calendly', 'docusign'
+    ],
+    
+    # FINANCE & ACCOUNTING
+    'finance_skills': [
+        'financial analysis', 'budgeting', 'forecasting', 'financial modeling',
+        'variance analysis', 'cost accounting', 'management accounting', 'tax accounting',
+        'audit', 'compliance', 'risk management', 'investment analysis', 'valuation',
+        'cash flow management', 'accounts payable', 'accounts receivable', 'payroll'
+    ],
+    'finance_tools': [
+        'excel', 'quickbooks', 'sap', 'oracle financials', 'netsuite', 'xero',
+        'sage', 'peachtree', 'bloomberg terminal', 'refinitiv', 'factset',
+        'tableau', 'power bi', 'sql', 'python', 'r', 'vba', 'pivot tables'
+    ],
+    'finance_certifications': [
+        'cpa', 'cfa', 'frm', 'cma', 'cia', 'acca', 'cfp', 'pmp', 'six sigma'
+    ],
+    
+    # HUMAN RESOURCES
+    'hr_skills': [
+        'recruitment', 'talent acquisition', 'interviewing', 'onboarding',
+        'performance management', 'employee relations', 'compensation', 'benefits',
+        'training and development', 'succession planning', 'diversity and inclusion',
+        'employee engagement', 'hr analytics', 'change management', 'conflict resolution'
+    ],
+    'hr_tools': [
+        'workday', 'successfactors', 'bamboohr', 'adp', 'paychex', 'greenhouse',
+        'lever', 'indeed', 'linkedin recruiter', 'glassdoor', 'ziprecruiter',
+        'applicant tracking system', 'ats', 'hris', 'hrms', 'payroll systems'
+    ],
+    'hr_certifications': [
+        'phr', 'sphr', 'shrm-cp', 'shrm-scp', 'hrci', 'cipd', 'chrp'
+    ],
+    
+    # OPERATIONS & SUPPLY CHAIN
+    'operations_skills': [
+        'process improvement', 'lean manufacturing', 'six sigma', 'kaizen',
+        'supply chain management', 'logistics', 'inventory management', 'procurement',
+        'vendor management', 'quality assurance', 'quality control', 'production planning',
+        'capacity planning', 'demand forecasting', 'warehouse management'
+    ],
+    'operations_tools': [
+        'erp systems', 'sap', 'oracle', 'microsoft dynamics', 'netsuite',
+        'tableau', 'power bi', 'minitab', 'jmp', 'arena simulation',
+        'autocad', 'solidworks', 'catia', 'ansys', 'matlab', 'r', 'python'
+    ],
+    
+    # CUSTOMER SERVICE & SUPPORT
+    'customer_service': [
+        'customer support', 'technical support', 'help desk', 'call center',
+        'live chat', 'email support', 'ticket management', 'escalation handling',
+        'customer satisfaction', 'customer retention', 'complaint resolution',
+        'service level agreements', 'sla', 'first call resolution', 'fcr'
+    ],
+    'customer_service_tools': [
+        'zendesk', 'freshdesk', 'servicenow', 'jira service desk', 'salesforce service cloud',
+        'intercom', 'drift', 'livechat', 'helpscout', 'kayako', 'desk.com'
+    ],
+    
+    # HEALTHCARE & MEDICAL
+    'healthcare_skills': [
+        'patient care', 'clinical assessment', 'medical records', 'emr', 'ehr',
+        'healthcare compliance', 'hipaa', 'medical coding', 'icd-10', 'cpt codes',
+        'medical billing', 'insurance claims', 'patient education', 'care coordination',
+        'quality improvement', 'infection control', 'medication administration'
+    ],
+    'medical_specialties': [
+        'nursing', 'physician', 'surgeon', 'cardiologist', 'neurologist', 'oncologist',
+        'pediatrician', 'psychiatrist', 'radiologist', 'anesthesiologist', 'pharmacist',
+        'physical therapy', 'occupational therapy', 'respiratory therapy', 'laboratory'
+    ],
+    
+    # LEGAL
+    'legal_skills': [
+        'legal research', 'contract drafting', 'contract negotiation', 'litigation',
+        'corporate law', 'intellectual property', 'employment law', 'real estate law',
+        'tax law', 'criminal law', 'family law', 'immigration law', 'compliance',
+        'regulatory affairs', 'due diligence', 'legal writing', 'brief writing'
+    ],
+    'legal_tools': [
+        'westlaw', 'lexisnexis', 'bloomberg law', 'practical law', 'clio',
+        'mycase', 'practice panther', 'timeslips', 'billing software', 'document management'
+    ],
+    
+    # EDUCATION & TRAINING
+    'education_skills': [
+        'curriculum development', 'lesson planning', 'classroom management',
+        'student assessment', 'educational technology', 'e-learning', 'lms',
+        'instructional design', 'training delivery', 'adult learning', 'pedagogy',
+        'differentiated instruction', 'special needs education', 'esl', 'tutoring'
+    ],
+    'education_tools': [
+        'moodle', 'blackboard', 'canvas', 'google classroom', 'zoom', 'teams',
+        'articulate storyline', 'captivate', 'camtasia', 'loom', 'kahoot', 'quizlet'
+    ],
+    
+    # CONSTRUCTION & ENGINEERING
+    'construction_skills': [
+        'project management', 'construction management', 'site supervision',
+        'building codes', 'safety regulations', 'osha', 'blueprint reading',
+        'cost estimation', 'scheduling', 'quality control', 'subcontractor management',
+        'materials management', 'structural engineering', 'civil engineering'
+    ],
+    'construction_tools': [
+        'autocad', 'revit', 'sketchup', 'primavera', 'ms project', 'procore',
+        'planswift', 'bluebeam', 'sage construction', 'viewpoint', 'buildertrend'
+    ],
+    
+    # RETAIL & E-COMMERCE
+    'retail_skills': [
+        'merchandising', 'inventory management', 'pos systems', 'customer service',
+        'sales techniques', 'visual merchandising', 'loss prevention', 'cash handling',
+        'product knowledge', 'upselling', 'cross-selling', 'store operations',
+        'e-commerce', 'online retail', 'marketplace management', 'dropshipping'
+    ],
+    'retail_tools': [
+        'shopify', 'magento', 'woocommerce', 'bigcommerce', 'square', 'clover',
+        'lightspeed', 'netsuite', 'amazon seller central', 'ebay', 'etsy', 'walmart marketplace'
+    ],
+    
+    # HOSPITALITY & FOOD SERVICE
+    'hospitality_skills': [
+        'guest services', 'hotel management', 'front desk operations', 'housekeeping',
+        'food and beverage', 'restaurant management', 'event planning', 'catering',
+        'revenue management', 'hospitality technology', 'customer experience',
+        'food safety', 'servsafe', 'wine knowledge', 'bartending', 'culinary arts'
+    ],
+    
+    # GENERAL BUSINESS & SOFT SKILLS
+    'business_skills': [
+        'project management', 'strategic planning', 'business analysis', 'process improvement',
+        'change management', 'stakeholder management', 'vendor management', 'budget management',
+        'performance metrics', 'kpi', 'dashboard creation', 'reporting', 'presentations',
+        'business development', 'partnership development', 'market research', 'competitive analysis'
+    ],
+    'soft_skills': [
+        'leadership', 'communication', 'teamwork', 'collaboration', 'problem solving', 
+        'critical thinking', 'analytical thinking', 'creativity', 'innovation', 'adaptability',
+        'flexibility', 'time management', 'organization', 'attention to detail',
+        'customer focus', 'results oriented', 'self motivated', 'initiative',
+        'mentoring', 'coaching', 'training', 'presentation skills', 'public speaking',
+        'negotiation', 'conflict resolution', 'decision making', 'strategic thinking'
+    ],
+    'certifications_general': [
+        'pmp', 'agile', 'scrum master', 'six sigma', 'lean', 'itil', 'prince2',
+        'microsoft certified', 'google certified', 'aws certified', 'azure certified',
+        'salesforce certified', 'hubspot certified', 'google analytics certified'
+    ]
+}
+
+# Flattened pool, in category order and including keywords listed under several categories
+POOL_KEYWORDS = [keyword.lower() for keywords in KEYWORDS_POOL.values() for keyword in keywords]
+
+# Compiled once per process; scans a text in a single pass
+KEYWORD_MATCHER = KeywordMatcher(KEYWORDS_POOL)
+
+ADDITIONAL_KEYWORD_PATTERNS = [re.compile(pattern) for pattern in [
+    r'\b(senior|junior|lead|principal|staff|architect|manager|director|vp|chief)\s+\w+',
+    r'\b\d+\+?\s*years?\s*(?:of\s*)?(?:experience|exp)\b',
+    r'\b(?:bachelor|master|phd|mba|degree|certification|diploma)\s*\w*',
+    r'\b(?:full.?stack|front.?end|back.?end|full.?time|part.?time|remote|hybrid)\b',
+    r'\b(?:entry.?level|mid.?level|senior.?level|executive.?level)\b',
+    r'\b(?:bilingual|multilingual|fluent|native|proficient)\b',
+    r'\b(?:cpa|cfa|pmp|mba|phd|md|jd|pe|rn|cna|lpn)\b'
+]]
+
+
+# Bump whenever the optimization prompt changes, so cached answers to the old prompt are not reused
+PROMPT_VERSION = 2
+
+PROMPT_INSTRUCTIONS = """As an ATS (Applicant Tracking System) expert and HR professional, analyze this resume against the job description and provide optimization recommendations.
+Focus on ATS-friendly formatting, keyword optimization, skills alignment, content structure and quantifiable achievements.
+The resume excerpt holds its sections most relevant to the job; "..." marks omitted parts.
+Answer with a single JSON object of exactly this shape:
+{schema}"""
+
 
 class ATSOptimizer:
-    def __init__(self):
-        """Initialize ATS optimizer with AI client"""
+    def __init__(self, model: str = "mixtral-8x7b-32768", temperature: float = 0.3, max_tokens: int = 1000,
+                 cache_path: Optional[str] = None, cache_ttl_seconds: float = 7 * 24 * 3600,
+                 cache_max_entries: int = 5000, base_url: Optional[str] = None,
+                 max_concurrency: int = 4, max_retries: int = 3, prompt_token_budget: int = 900,
+                 job_prompt_tokens: int = 300, embedding_model: Optional[str] = None, json_mode: bool = True,
+                 embedding_cache_dir: Optional[str] = None, embedding_cache_max_entries: int = 50000):
+        """Initialize ATS optimizer with AI client.
+
+        When cache_path is set, AI responses are kept in a persistent LLMResponseCache
+        so optimizing the same resume for the same job again makes no API call.
+        Besides the blocking Groq client there is an AsyncLLMClient for
+        optimize_resume_async (max_concurrency calls at once, max_retries retries);
+        base_url sends both to another Groq-compatible server.
+
+        The prompt holds at most prompt_token_budget tokens of resume and job text
+        (see PromptBuilder); resume sections are picked by similarity to the job
+        under embedding_model, or by keyword overlap when it is None (with
+        embedding_cache_dir, the shared EmbeddingCache keeps the vectors, so a job
+        description optimized against many resumes is embedded once). json_mode asks
+        the API for a JSON object; answers are repaired and checked against
+        REPORT_SCHEMA either way, and token usage is counted per call.
+        """
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.response_cache = LLMResponseCache(cache_path, cache_ttl_seconds, cache_max_entries) \
+            if cache_path else None
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.json_mode = json_mode
+        self.embedding_model = embedding_model
+        self.embedding_cache = get_embedding_cache(canonical_model_name(embedding_model), embedding_cache_dir,
+                                                   embedding_cache_max_entries) \
+            if embedding_model and embedding_cache_dir else None
+        self.prompt_builder = PromptBuilder(prompt_token_budget, job_prompt_tokens,
+                                            encoder=self._encode_texts if embedding_model else None)
+        self._usage_lock = threading.Lock()
+        self.usage = {
+            'calls': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'excerpt_tokens': 0,
+            'repaired': 0,
+            'schema_fixes': 0,
+            'parse_failures': 0
+        }
         self.groq_client = None
+        self.async_client = None
         self._initialize_ai_client()
         
     def _initialize_ai_client(self):
@@ -15,8 +320,16 @@ class ATSOptimizer:
         try:
             groq_api_key = os.getenv("GROQ_API_KEY")
             if groq_api_key:
-                # Initialize Groq client without proxies parameter
-                self.groq_client = groq.Groq(api_key=groq_api_key)
+                # Initialize Groq client without proxies parameter (our own httpx client:
+                # newer httpx releases reject the one groq would build)
+                self.groq_client = groq.Groq(api_key=groq_api_key, base_url=self.base_url,
+                                             http_client=httpx.Client(timeout=60.0))
+                self.async_client = AsyncLLMClient(
+                    groq_api_key,
+                    base_url=self.base_url,
+                    max_concurrency=self.max_concurrency,
+                    max_retries=self.max_retries
+                )
                 print("✅ Initialized Groq AI client for ATS optimization")
             else:
                 print("⚠️ Warning: GROQ_API_KEY not found. ATS optimization will use basic analysis.")
@@ -24,83 +337,236 @@ class ATSOptimizer:
         except Exception as e:
             print(f"❌ Error initializing Groq client for ATS: {e}")
             self.groq_client = None
+            self.async_client = None
+    
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        """Embeddings for the prompt builder, through the embedding cache when there is one"""
+        model = get_model(self.embedding_model)
+        encode = lambda batch: model.encode(batch, batch_size=32, convert_to_numpy=True, show_progress_bar=False)
+        if self.embedding_cache is not None:
+            return self.embedding_cache.encode(texts, encode)
+        return encode(texts)
     
-    def optimize_resume(self, resume_text: str, job_description: str) -> Dict:
-        """Optimize resume for ATS and job description"""
+    def optimize_resume(self, resume_text: str, job_description: str,
+                        job_keywords: Optional[List[str]] = None) -> Dict:
+        """Optimize resume for ATS and job description.
+        
+        job_keywords (extract_job_keywords) saves extracting them again when one job
+        description is used for many resumes.
+        """
         try:
             if self.groq_client:
-                return self._ai_optimize_resume(resume_text, job_description)
+                return self._ai_optimize_resume(resume_text, job_description, job_keywords)
             else:
-                return self._basic_optimize_resume(resume_text, job_description)
+                return self._basic_optimize_resume(resume_text, job_description, job_keywords)
         except Exception as e:
             print(f"Error optimizing resume: {e}")
             return {
                 'error': str(e),
-                'basic_analysis': self._basic_optimize_resume(resume_text, job_description)
+                'basic_analysis': self._basic_optimize_resume(resume_text, job_description, job_keywords)
             }
     
-    def _ai_optimize_resume(self, resume_text: str, job_description: str) -> Dict:
+    def _prepare_prompt(self, resume_text: str, job_description: str) -> Dict:
+        """Budgeted excerpts (PromptBuilder.build) plus the chat messages and the response cache key"""
+        prompt = self.prompt_builder.build(resume_text, job_description)
+        prompt['messages'] = self._build_messages(prompt['resume_excerpt'], prompt['job_excerpt'])
+        # The answer depends only on the prompt inputs and the sampling settings
+        prompt['cache_key'] = None if self.response_cache is None else self.response_cache.make_key(
+            PROMPT_VERSION, self.model, self.temperature, self.max_tokens, self.prompt_builder.signature,
+            prompt['resume_excerpt'], prompt['job_excerpt']
+        )
+        return prompt
+    
+    def _cached_report(self, prompt: Dict) -> Optional[Dict]:
+        """The stored report for this prompt, if any"""
+        if prompt['cache_key'] is None:
+            return None
+        cached = self.response_cache.get(prompt['cache_key'])
+        if cached is None:
+            return None
+        report = json.loads(cached)
+        report['llm_usage'] = {'cached': True, 'sections': prompt['sections']}
+        return report
+    
+    def _build_messages(self, resume_excerpt: str, job_excerpt: str) -> List[Dict]:
+        """Chat messages asking for the optimization report as JSON"""
+        instructions = PROMPT_INSTRUCTIONS.format(schema=json.dumps(schema_example()))
+        return [
+            {"role": "system", "content": instructions},
+            {"role": "user", "content": f"RESUME:\n{resume_excerpt}\n\nJOB DESCRIPTION:\n{job_excerpt}"}
+        ]
+    
+    def _completion_options(self) -> Dict:
+        """Extra chat-completion arguments: JSON mode unless disabled"""
+        return {'response_format': {'type': 'json_object'}} if self.json_mode else {}
+    
+    def _parse_ai_response(self, content: str, prompt: Dict, usage: Optional[Dict], api_seconds: float) -> Dict:
+        """Decode, repair and validate the JSON report, record token usage and cache the report"""
+        data, repaired = repair_json(content)
+        report, problems = validate_report(data)
+        
+        usage = usage or {}
+        prompt_tokens = usage.get('prompt_tokens')
+        completion_tokens = usage.get('completion_tokens')
+        estimated = prompt_tokens is None or completion_tokens is None
+        if prompt_tokens is None:
+            prompt_tokens = sum(self.prompt_builder.count_tokens(message['content']) for message in prompt['messages'])
+        if completion_tokens is None:
+            completion_tokens = self.prompt_builder.count_tokens(content or '')
+        
+        with self._usage_lock:
+            self.usage['calls'] += 1
+            self.usage['prompt_tokens'] += prompt_tokens
+            self.usage['completion_tokens'] += completion_tokens
+            self.usage['excerpt_tokens'] += prompt['resume_tokens'] + prompt['job_tokens']
+            self.usage['repaired'] += repaired
+            self.usage['schema_fixes'] += bool(report is not None and problems)
+            self.usage['parse_failures'] += report is None
+        
+        llm_usage = {
+            'cached': False,
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'estimated': estimated,
+            'resume_tokens': prompt['resume_tokens'],
+            'job_tokens': prompt['job_tokens'],
+            'resume_pieces': prompt['resume_pieces'],
+            'sections': prompt['sections'],
+            'api_seconds': round(api_seconds, 3)
+        }
+        if report is None:
+            # If JSON parsing fails even after repair, return the raw response
+            return {
+                'ai_response': content,
+                'parsing_error': 'Could not parse AI response as JSON',
+                'llm_usage': llm_usage
+            }
+        if repaired or problems:
+            print(f"⚠️ AI response fixed up (repaired JSON: {repaired}, schema: {problems[:5]})")
+        
+        # Only answers that parsed are cached; a bad one gets a fresh try next time
+        if prompt['cache_key'] is not None:
+            self.response_cache.put(prompt['cache_key'], json.dumps(report), self.model, api_seconds)
+        report['llm_usage'] = llm_usage
+        return report
+    
+    def _ai_optimize_resume(self, resume_text: str, job_description: str,
+                            job_keywords: Optional[List[str]] = None) -> Dict:
         """Use AI to optimize resume"""
         try:
-            prompt = f"""
-            As an ATS (Applicant Tracking System) expert and HR professional, analyze this resume against the job description and provide optimization recommendations.
-            
-            RESUME:
-            {resume_text[:2000]}...
-            
-            JOB DESCRIPTION:
-            {job_description[:1000]}...
-            
-            Please provide a detailed JSON response with the following structure:
-            {{
-                "ats_score": <score_out_of_100>,
-                "missing_keywords": [<list_of_important_keywords_missing_from_resume>],
-                "keyword_optimization": {{
-                    "add_keywords": [<keywords_to_add>],
-                    "improve_sections": [<sections_that_need_keyword_improvement>]
-                }},
-                "format_improvements": [<list_of_formatting_suggestions>],
-                "content_suggestions": [<list_of_content_improvement_suggestions>],
-                "skills_gap": [<skills_mentioned_in_job_but_missing_from_resume>],
-                "strengths": [<existing_strengths_that_match_job>],
-                "action_items": [<specific_actionable_recommendations>]
-            }}
-            
-            Focus on:
-            1. ATS-friendly formatting
-            2. Keyword optimization
-            3. Skills alignment
-            4. Content structure
-            5. Quantifiable achievements
-            """
+            prompt = self._prepare_prompt(resume_text, job_description)
+            cached = self._cached_report(prompt)
+            if cached is not None:
+                return cached
             
+            start = time.perf_counter()
             response = self.groq_client.chat.completions.create(
-                model="mixtral-8x7b-32768",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1000,
-                temperature=0.3
+                model=self.model,
+                messages=prompt['messages'],
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                **self._completion_options()
+            )
+            usage = getattr(response, 'usage', None)
+            return self._parse_ai_response(
+                response.choices[0].message.content,
+                prompt,
+                {
+                    'prompt_tokens': getattr(usage, 'prompt_tokens', None),
+                    'completion_tokens': getattr(usage, 'completion_tokens', None)
+                },
+                time.perf_counter() - start
             )
-            
-            # Try to parse JSON response
-            try:
-                result = json.loads(response.choices[0].message.content)
-                return result
-            except json.JSONDecodeError:
-                # If JSON parsing fails, return the raw response
-                return {
-                    'ai_response': response.choices[0].message.content,
-                    'parsing_error': 'Could not parse AI response as JSON'
-                }
                 
         except Exception as e:
             print(f"Error in AI optimization: {e}")
-            return self._basic_optimize_resume(resume_text, job_description)
+            return self._basic_optimize_resume(resume_text, job_description, job_keywords)
+    
+    async def optimize_resume_async(self, resume_text: str, job_description: str,
+                                    job_keywords: Optional[List[str]] = None) -> Dict:
+        """optimize_resume() for the event loop: the Groq call goes through the shared AsyncLLMClient.
+
+        Waiting on the API holds no worker thread; building the prompt (which may
+        embed resume sections), the cache lookup and the basic analysis fallback
+        run in a thread.
+        """
+        if self.async_client is None:
+            return await asyncio.to_thread(self.optimize_resume, resume_text, job_description, job_keywords)
+        
+        try:
+            prompt = await asyncio.to_thread(self._prepare_prompt, resume_text, job_description)
+            cached = await asyncio.to_thread(self._cached_report, prompt)
+            if cached is not None:
+                return cached
+            
+            completion = await self.async_client.complete(
+                self.model, prompt['messages'], self.max_tokens, self.temperature, **self._completion_options()
+            )
+            return await asyncio.to_thread(self._parse_ai_response, completion['content'], prompt,
+                                           completion['usage'], completion['api_seconds'])
+        
+        except Exception as e:
+            print(f"Error in AI optimization: {e}")
+            return await asyncio.to_thread(self._basic_optimize_resume, resume_text, job_description, job_keywords)
     
-    def _basic_optimize_resume(self, resume_text: str, job_description: str) -> Dict:
+    async def optimize_resume_stream(self, resume_text: str, job_description: str,
+                                     job_keywords: Optional[List[str]] = None) -> AsyncIterator[Tuple[str, Dict]]:
+        """optimize_resume() in stages, as (event, data) pairs for a streaming response.
+
+        'basic_analysis' comes first (keyword analysis, no API call), then one 'token'
+        event per piece of the AI answer as it arrives ({'text': ...}), and finally
+        'optimization' with the parsed report. A cached answer skips the tokens; when
+        the AI call fails the final report is the basic analysis. Streamed calls do
+        not use JSON mode (the API does not stream it) and report estimated usage.
+        """
+        basic_results = await asyncio.to_thread(self._basic_optimize_resume, resume_text, job_description,
+                                                job_keywords)
+        yield 'basic_analysis', basic_results
+        
+        if self.async_client is None:
+            yield 'optimization', basic_results
+            return
+        
+        try:
+            prompt = await asyncio.to_thread(self._prepare_prompt, resume_text, job_description)
+            cached = await asyncio.to_thread(self._cached_report, prompt)
+            if cached is not None:
+                yield 'optimization', cached
+                return
+            
+            pieces = []
+            start = time.perf_counter()
+            async for piece in self.async_client.stream(
+                self.model, prompt['messages'], self.max_tokens, self.temperature
+            ):
+                pieces.append(piece)
+                yield 'token', {'text': piece}
+            api_seconds = time.perf_counter() - start
+            result = await asyncio.to_thread(self._parse_ai_response, ''.join(pieces), prompt, None, api_seconds)
+        
+        except Exception as e:
+            print(f"Error in AI optimization: {e}")
+            result = basic_results
+        yield 'optimization', result
+    
+    def usage_stats(self) -> Dict:
+        """Token usage and answer repair counters over all AI calls"""
+        with self._usage_lock:
+            usage = dict(self.usage)
+        calls = usage['calls']
+        usage['avg_prompt_tokens'] = round(usage['prompt_tokens'] / calls, 1) if calls else 0
+        usage['avg_completion_tokens'] = round(usage['completion_tokens'] / calls, 1) if calls else 0
+        usage['prompt_token_budget'] = self.prompt_builder.token_budget
+        usage['json_mode'] = self.json_mode
+        return usage
+    
+    def _basic_optimize_resume(self, resume_text: str, job_description: str,
+                               job_keywords: Optional[List[str]] = None) -> Dict:
         """Basic resume optimization without AI"""
         try:
-            # Extract keywords from job description
-            job_keywords = self._extract_keywords(job_description)
+            # Extract keywords from job description, unless the caller already did
+            if job_keywords is None:
+                job_keywords = self._extract_keywords(job_description)
             resume_keywords = self._extract_keywords(resume_text)
             
             # Find missing keywords
@@ -137,252 +603,16 @@ class ATSOptimizer:
 
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract important keywords from text using comprehensive analysis for ALL departments"""
-        # Comprehensive keywords pool organized by department and category
-        keywords_pool = {
-            # TECHNOLOGY & ENGINEERING
-            'programming_languages': [
-                'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 
-                'rust', 'kotlin', 'swift', 'r', 'matlab', 'scala', 'perl', 'shell', 'bash',
-                'powershell', 'lua', 'dart', 'elixir', 'clojure', 'haskell', 'f#', 'cobol', 'fortran'
-            ],
-            'web_technologies': [
-                'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'next.js', 
-                'nuxt.js', 'gatsby', 'svelte', 'bootstrap', 'tailwind', 'sass', 'less', 
-                'webpack', 'vite', 'parcel', 'rollup', 'jquery', 'backbone.js', 'ember.js',
-                'react native', 'flutter', 'ionic', 'cordova', 'phonegap', 'xamarin'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'sql server',
-                'cassandra', 'dynamodb', 'elasticsearch', 'neo4j', 'firebase', 'supabase',
-                'mariadb', 'couchdb', 'influxdb', 'clickhouse', 'bigquery', 'snowflake'
-            ],
-            'frameworks_libraries': [
-                'django', 'flask', 'fastapi', 'spring', 'spring boot', 'laravel', 'rails',
-                'express.js', 'nest.js', 'asp.net', 'xamarin', '.net', 'entity framework',
-                'hibernate', 'struts', 'play framework', 'symfony', 'codeigniter', 'yii'
-            ],
-            'cloud_devops': [
-                'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'jenkins', 
-                'gitlab ci', 'github actions', 'terraform', 'ansible', 'chef', 'puppet', 
-                'vagrant', 'nginx', 'apache', 'linux', 'ubuntu', 'centos', 'redhat',
-                'heroku', 'digitalocean', 'cloudflare', 'lambda', 'ec2', 's3', 'rds'
-            ],
-            'data_science_ai': [
-                'machine learning', 'deep learning', 'artificial intelligence', 'data science',
-                'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras',
-                'matplotlib', 'seaborn', 'plotly', 'jupyter', 'anaconda', 'spark', 'hadoop',
-                'tableau', 'power bi', 'looker', 'qlik', 'nlp', 'computer vision', 'opencv',
-                'neural networks', 'lstm', 'cnn', 'transformers', 'bert', 'gpt'
-            ],
-            
-            # MARKETING & DIGITAL MARKETING
-            'digital_marketing': [
-                'seo', 'sem', 'ppc', 'google ads', 'facebook ads', 'instagram marketing',
-                'linkedin marketing', 'twitter marketing', 'youtube marketing', 'tiktok marketing',
-                'content marketing', 'email marketing', 'affiliate marketing', 'influencer marketing',
-                'social media marketing', 'growth hacking', 'conversion optimization', 'cro'
-            ],
-            'marketing_tools': [
-                'google analytics', 'google tag manager', 'hubspot', 'salesforce marketing cloud',
-                'mailchimp', 'constant contact', 'hootsuite', 'buffer', 'sprout social',
-                'canva', 'adobe creative suite', 'photoshop', 'illustrator', 'indesign',
-                'figma', 'sketch', 'wordpress', 'shopify', 'magento', 'woocommerce'
-            ],
-            'marketing_metrics': [
-                'cpa', 'cpc', 'cpm', 'ctr', 'roi', 'roas', 'ltv', 'cac', 'conversion rate',
-                'bounce rate', 'engagement rate', 'impressions', 'reach', 'frequency',
-                'organic traffic', 'paid traffic', 'lead generation', 'lead nurturing'
-            ],
-            
-            # SALES & BUSINESS DEVELOPMENT
-            'sales_skills': [
-                'prospecting', 'lead qualification', 'cold calling', 'cold emailing',
-                'relationship building', 'account management', 'territory management',
-                'pipeline management', 'forecasting', 'negotiation', 'closing deals',
-                'upselling', 'cross-selling', 'customer retention', 'b2b sales', 'b2c sales'
-            ],
-            'sales_tools': [
-                'salesforce', 'hubspot crm', 'pipedrive', 'zoho crm', 'freshsales',
-                'outreach.io', 'salesloft', 'linkedin sales navigator', 'zoominfo',
-                'apollo.io', 'clearbit', 'gong', 'chorus', 'calendly', 'docusign'
-            ],
-            
-            # FINANCE & ACCOUNTING
-            'finance_skills': [
-                'financial analysis', 'budgeting', 'forecasting', 'financial modeling',
-                'variance analysis', 'cost accounting', 'management accounting', 'tax accounting',
-                'audit', 'compliance', 'risk management', 'investment analysis', 'valuation',
-                'cash flow management', 'accounts payable', 'accounts receivable', 'payroll'
-            ],
-            'finance_tools': [
-                'excel', 'quickbooks', 'sap', 'oracle financials', 'netsuite', 'xero',
-                'sage', 'peachtree', 'bloomberg terminal', 'refinitiv', 'factset',
-                'tableau', 'power bi', 'sql', 'python', 'r', 'vba', 'pivot tables'
-            ],
-            'finance_certifications': [
-                'cpa', 'cfa', 'frm', 'cma', 'cia', 'acca', 'cfp', 'pmp', 'six sigma'
-            ],
-            
-            # HUMAN RESOURCES
-            'hr_skills': [
-                'recruitment', 'talent acquisition', 'interviewing', 'onboarding',
-                'performance management', 'employee relations', 'compensation', 'benefits',
-                'training and development', 'succession planning', 'diversity and inclusion',
-                'employee engagement', 'hr analytics', 'change management', 'conflict resolution'
-            ],
-            'hr_tools': [
-                'workday', 'successfactors', 'bamboohr', 'adp', 'paychex', 'greenhouse',
-                'lever', 'indeed', 'linkedin recruiter', 'glassdoor', 'ziprecruiter',
-                'applicant tracking system', 'ats', 'hris', 'hrms', 'payroll systems'
-            ],
-            'hr_certifications': [
-                'phr', 'sphr', 'shrm-cp', 'shrm-scp', 'hrci', 'cipd', 'chrp'
-            ],
-            
-            # OPERATIONS & SUPPLY CHAIN
-            'operations_skills': [
-                'process improvement', 'lean manufacturing', 'six sigma', 'kaizen',
-                'supply chain management', 'logistics', 'inventory management', 'procurement',
-                'vendor management', 'quality assurance', 'quality control', 'production planning',
-                'capacity planning', 'demand forecasting', 'warehouse management'
-            ],
-            'operations_tools': [
-                'erp systems', 'sap', 'oracle', 'microsoft dynamics', 'netsuite',
-                'tableau', 'power bi', 'minitab', 'jmp', 'arena simulation',
-                'autocad', 'solidworks', 'catia', 'ansys', 'matlab', 'r', 'python'
-            ],
-            
-            # CUSTOMER SERVICE & SUPPORT
-            'customer_service': [
-                'customer support', 'technical support', 'help desk', 'call center',
-                'live chat', 'email support', 'ticket management', 'escalation handling',
-                'customer satisfaction', 'customer retention', 'complaint resolution',
-                'service level agreements', 'sla', 'first call resolution', 'fcr'
-            ],
-            'customer_service_tools': [
-                'zendesk', 'freshdesk', 'servicenow', 'jira service desk', 'salesforce service cloud',
-                'intercom', 'drift', 'livechat', 'helpscout', 'kayako', 'desk.com'
-            ],
-            
-            # HEALTHCARE & MEDICAL
-            'healthcare_skills': [
-                'patient care', 'clinical assessment', 'medical records', 'emr', 'ehr',
-                'healthcare compliance', 'hipaa', 'medical coding', 'icd-10', 'cpt codes',
-                'medical billing', 'insurance claims', 'patient education', 'care coordination',
-                'quality improvement', 'infection control', 'medication administration'
-            ],
-            'medical_specialties': [
-                'nursing', 'physician', 'surgeon', 'cardiologist', 'neurologist', 'oncologist',
-                'pediatrician', 'psychiatrist', 'radiologist', 'anesthesiologist', 'pharmacist',
-                'physical therapy', 'occupational therapy', 'respiratory therapy', 'laboratory'
-            ],
-            
-            # LEGAL
-            'legal_skills': [
-                'legal research', 'contract drafting', 'contract negotiation', 'litigation',
-                'corporate law', 'intellectual property', 'employment law', 'real estate law',
-                'tax law', 'criminal law', 'family law', 'immigration law', 'compliance',
-                'regulatory affairs', 'due diligence', 'legal writing', 'brief writing'
-            ],
-            'legal_tools': [
-                'westlaw', 'lexisnexis', 'bloomberg law', 'practical law', 'clio',
-                'mycase', 'practice panther', 'timeslips', 'billing software', 'document management'
-            ],
-            
-            # EDUCATION & TRAINING
-            'education_skills': [
-                'curriculum development', 'lesson planning', 'classroom management',
-                'student assessment', 'educational technology', 'e-learning', 'lms',
-                'instructional design', 'training delivery', 'adult learning', 'pedagogy',
-                'differentiated instruction', 'special needs education', 'esl', 'tutoring'
-            ],
-            'education_tools': [
-                'moodle', 'blackboard', 'canvas', 'google classroom', 'zoom', 'teams',
-                'articulate storyline', 'captivate', 'camtasia', 'loom', 'kahoot', 'quizlet'
-            ],
-            
-            # CONSTRUCTION & ENGINEERING
-            'construction_skills': [
-                'project management', 'construction management', 'site supervision',
-                'building codes', 'safety regulations', 'osha', 'blueprint reading',
-                'cost estimation', 'scheduling', 'quality control', 'subcontractor management',
-                'materials management', 'structural engineering', 'civil engineering'
-            ],
-            'construction_tools': [
-                'autocad', 'revit', 'sketchup', 'primavera', 'ms project', 'procore',
-                'planswift', 'bluebeam', 'sage construction', 'viewpoint', 'buildertrend'
-            ],
-            
-            # RETAIL & E-COMMERCE
-            'retail_skills': [
-                'merchandising', 'inventory management', 'pos systems', 'customer service',
-                'sales techniques', 'visual merchandising', 'loss prevention', 'cash handling',
-                'product knowledge', 'upselling', 'cross-selling', 'store operations',
-                'e-commerce', 'online retail', 'marketplace management', 'dropshipping'
-            ],
-            'retail_tools': [
-                'shopify', 'magento', 'woocommerce', 'bigcommerce', 'square', 'clover',
-                'lightspeed', 'netsuite', 'amazon seller central', 'ebay', 'etsy', 'walmart marketplace'
-            ],
-            
-            # HOSPITALITY & FOOD SERVICE
-            'hospitality_skills': [
-                'guest services', 'hotel management', 'front desk operations', 'housekeeping',
-                'food and beverage', 'restaurant management', 'event planning', 'catering',
-                'revenue management', 'hospitality technology', 'customer experience',
-                'food safety', 'servsafe', 'wine knowledge', 'bartending', 'culinary arts'
-            ],
-            
-            # GENERAL BUSINESS & SOFT SKILLS
-            'business_skills': [
-                'project management', 'strategic planning', 'business analysis', 'process improvement',
-                'change management', 'stakeholder management', 'vendor management', 'budget management',
-                'performance metrics', 'kpi', 'dashboard creation', 'reporting', 'presentations',
-                'business development', 'partnership development', 'market research', 'competitive analysis'
-            ],
-            'soft_skills': [
-                'leadership', 'communication', 'teamwork', 'collaboration', 'problem solving', 
-                'critical thinking', 'analytical thinking', 'creativity', 'innovation', 'adaptability',
-                'flexibility', 'time management', 'organization', 'attention to detail',
-                'customer focus', 'results oriented', 'self motivated', 'initiative',
-                'mentoring', 'coaching', 'training', 'presentation skills', 'public speaking',
-                'negotiation', 'conflict resolution', 'decision making', 'strategic thinking'
-            ],
-            'certifications_general': [
-                'pmp', 'agile', 'scrum master', 'six sigma', 'lean', 'itil', 'prince2',
-                'microsoft certified', 'google certified', 'aws certified', 'azure certified',
-                'salesforce certified', 'hubspot certified', 'google analytics certified'
-            ]
-        }
-        
         text_lower = text.lower()
-        found_keywords = []
-        
-        # Flatten all keyword categories
-        all_keywords = []
-        for category, keywords in keywords_pool.items():
-            all_keywords.extend(keywords)
         
-        # Find keywords using word boundaries for accuracy
-        for keyword in all_keywords:
-            # Use regex with word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_keywords.append(keyword)
+        # Single pass over the text; POOL_KEYWORDS keeps the pool order (and the
+        # repeats of keywords listed under several categories) for the ranking below
+        present = KEYWORD_MATCHER.find_keywords(text_lower)
+        found_keywords = [keyword for keyword in POOL_KEYWORDS if keyword in present]
         
         # Also extract domain-specific terms (job titles, experience levels, etc.)
-        additional_patterns = [
-            r'\b(senior|junior|lead|principal|staff|architect|manager|director|vp|chief)\s+\w+',
-            r'\b\d+\+?\s*years?\s*(?:of\s*)?(?:experience|exp)\b',
-            r'\b(?:bachelor|master|phd|mba|degree|certification|diploma)\s*\w*',
-            r'\b(?:full.?stack|front.?end|back.?end|full.?time|part.?time|remote|hybrid)\b',
-            r'\b(?:entry.?level|mid.?level|senior.?level|executive.?level)\b',
-            r'\b(?:bilingual|multilingual|fluent|native|proficient)\b',
-            r'\b(?:cpa|cfa|pmp|mba|phd|md|jd|pe|rn|cna|lpn)\b'
-        ]
-        
-        for pattern in additional_patterns:
-            matches = re.findall(pattern, text_lower)
+        for pattern in ADDITIONAL_KEYWORD_PATTERNS:
+            matches = pattern.findall(text_lower)
             found_keywords.extend(matches)
         
         # Remove duplicates and sort by frequency in text
@@ -489,10 +719,15 @@ class ATSOptimizer:
         
         return action_items
     
-    def analyze_job_keywords(self, job_description: str) -> Dict:
+    def extract_job_keywords(self, job_description: str) -> List[str]:
+        """Keywords of a job description, ranked by frequency (for reuse across resumes)"""
+        return self._extract_keywords(job_description)
+    
+    def analyze_job_keywords(self, job_description: str, keywords: Optional[List[str]] = None) -> Dict:
         """Analyze and extract key information from job description"""
         try:
-            keywords = self._extract_keywords(job_description)
+            if keywords is None:
+                keywords = self._extract_keywords(job_description)
             
             return {
                 'total_keywords': len(keywords),
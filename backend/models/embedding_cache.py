@@ -0,0 +1,351 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process file locks
+    fcntl = None
+
+
+class EmbeddingCache:
+    """Persistent, content-addressed cache of text embeddings.
+
+    Vectors live in a memory-mapped float32 file (one row per entry); which key
+    owns which row, and when it was last used, is kept in a SQLite table next to
+    it, so storing new vectors only writes their rows. Keys are a BLAKE2 hash of
+    the model name plus the whitespace-normalized text, so re-uploading the same
+    resume or re-screening the same job description never reaches the encoder.
+    When max_entries is reached the least recently used entries are evicted and
+    their rows reused.
+
+    Several processes (uvicorn workers) can share a directory: lookups hold a
+    shared and writes an exclusive flock on a lock file, and a process remaps the
+    vectors file when another one has grown it. Without fcntl (Windows) there is
+    no cross-process locking, so give each process its own cache_dir there.
+    Instances should be obtained through get_embedding_cache() so that everything
+    in a process sharing a directory also shares one cache object.
+    """
+
+    INITIAL_CAPACITY = 1024
+    # SQLite's default limit on ? parameters is 999
+    QUERY_BATCH = 500
+
+    def __init__(self, model_name: str, cache_dir: str = "./data/embedding_cache",
+                 max_entries: int = 50000):
+        self.model_name = model_name
+        self.max_entries = max(1, max_entries)
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name)
+        self.cache_path = Path(cache_dir) / safe_name
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+        self.vectors_file = self.cache_path / "vectors.f32"
+        self.database_path = self.cache_path / "index.sqlite3"
+        self.legacy_index_file = self.cache_path / "index.json"
+
+        # The lock serializes this process's threads (they share one connection and
+        # one lock-file descriptor); the flock on the lock file serializes processes
+        self._lock = threading.Lock()
+        self._lock_fd = os.open(self.cache_path / "lock", os.O_RDWR | os.O_CREAT, 0o644)
+        self._connection = sqlite3.connect(str(self.database_path), timeout=30,
+                                           check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._vectors = None
+        self._mapped_rows = 0
+        self.dimension = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        with self._locked(exclusive=True):
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    row INTEGER NOT NULL UNIQUE,
+                    last_used REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries (last_used);
+                CREATE TABLE IF NOT EXISTS cache_meta (
+                    key TEXT PRIMARY KEY,
+                    value
+                );
+            """)
+            try:
+                self._import_legacy_index()
+            except Exception as e:
+                print(f"Error importing old embedding cache index, starting empty: {e}")
+            self.dimension = self._meta('dimension')
+        entries = self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        if entries:
+            print(f"Loaded embedding cache for {self.model_name}: {entries} entries")
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Collapse whitespace so formatting-only differences share a cache entry"""
+        return ' '.join(text.split())
+
+    def make_key(self, text: str) -> str:
+        """Content hash of model name + normalized text"""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(self.model_name.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(self.normalize_text(text).encode('utf-8'))
+        return digest.hexdigest()
+
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """Hold the thread lock and a shared (lookups) or exclusive (writes) lock on the directory"""
+        with self._lock:
+            if fcntl is not None:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _transaction(self):
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+            self._connection.execute("COMMIT")
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+
+    def _meta(self, key: str, default=None):
+        row = self._connection.execute("SELECT value FROM cache_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else default
+
+    def _set_meta(self, key: str, value):
+        self._connection.execute("INSERT OR REPLACE INTO cache_meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _import_legacy_index(self):
+        """Move entries from the JSON index older versions rewrote on every write"""
+        if not self.legacy_index_file.exists():
+            return
+        if self.vectors_file.exists() and self._meta('dimension') is None:
+            with open(self.legacy_index_file, 'r') as f:
+                index = json.load(f)
+            dimension = index['dimension']
+            if os.path.getsize(self.vectors_file) < index['capacity'] * dimension * 4:
+                raise ValueError("vectors file is smaller than the index expects")
+            now = time.time()
+            with self._transaction():
+                # The JSON list is ordered least recently used first
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO entries (key, row, last_used) VALUES (?, ?, ?)",
+                    [(key, row, now - len(index['entries']) + position)
+                     for position, (key, row) in enumerate(index['entries'])]
+                )
+                self._set_meta('dimension', dimension)
+                self._set_meta('next_row', max((row for _, row in index['entries']), default=-1) + 1)
+        self.legacy_index_file.unlink()
+
+    def _rows_in_file(self) -> int:
+        if not self.dimension or not self.vectors_file.exists():
+            return 0
+        return os.path.getsize(self.vectors_file) // (self.dimension * 4)
+
+    def _mapped(self, rows_needed: int) -> np.memmap:
+        """The vectors file mapped with at least rows_needed rows (remapped if another process grew it)"""
+        if self._vectors is None or self._mapped_rows < rows_needed:
+            rows = self._rows_in_file()
+            if rows < rows_needed:
+                raise ValueError(f"vectors file has {rows} rows, the index expects {rows_needed}")
+            self._vectors = np.memmap(self.vectors_file, dtype=np.float32, mode='r+',
+                                      shape=(rows, self.dimension))
+            self._mapped_rows = rows
+        return self._vectors
+
+    def _ensure_capacity(self, rows_needed: int):
+        """Grow the vectors file (doubling, up to max_entries) to hold rows_needed rows.
+
+        The file never shrinks, so mappings held by other processes stay valid.
+        """
+        rows = self._rows_in_file()
+        if rows_needed <= rows:
+            return
+        new_rows = min(max(rows_needed, rows * 2, self.INITIAL_CAPACITY), self.max_entries)
+        self.vectors_file.touch()
+        with open(self.vectors_file, 'r+b') as f:
+            f.truncate(new_rows * self.dimension * 4)
+
+    def _lookup(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """Cached vectors for whichever of keys are present, marking them as recently used"""
+        with self._locked(exclusive=False):
+            rows = {}
+            for start in range(0, len(keys), self.QUERY_BATCH):
+                batch = keys[start:start + self.QUERY_BATCH]
+                rows.update(self._connection.execute(
+                    f"SELECT key, row FROM entries WHERE key IN ({','.join('?' * len(batch))})", batch
+                ).fetchall())
+            if not rows:
+                return {}
+
+            if self.dimension is None:
+                self.dimension = self._meta('dimension')
+            vectors = self._mapped(max(rows.values()) + 1)
+            found = {key: np.array(vectors[row]) for key, row in rows.items()}
+
+            now = time.time()
+            with self._transaction():
+                self._connection.executemany("UPDATE entries SET last_used = ? WHERE key = ?",
+                                             [(now, key) for key in rows])
+            return found
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Return the cached vector for text, or None"""
+        key = self.make_key(text)
+        vector = self._lookup([key]).get(key)
+        if vector is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return vector
+
+    def put_many(self, texts: List[str], vectors: np.ndarray):
+        """Store one vector per text"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if not len(texts):
+            return
+
+        # Deduplicate (last vector wins) and keep at most max_entries
+        pending = OrderedDict()
+        for text, vector in zip(texts, vectors):
+            key = self.make_key(text)
+            pending.pop(key, None)
+            pending[key] = vector
+        while len(pending) > self.max_entries:
+            pending.popitem(last=False)
+
+        with self._locked(exclusive=True), self._transaction():
+            dimension = self._meta('dimension')
+            if dimension is None:
+                dimension = vectors.shape[1]
+                self._set_meta('dimension', dimension)
+            elif vectors.shape[1] != dimension:
+                raise ValueError(f"Expected {dimension}-d vectors, got {vectors.shape[1]}-d")
+            self.dimension = dimension
+
+            keys = list(pending)
+            rows = {}
+            for start in range(0, len(keys), self.QUERY_BATCH):
+                batch = keys[start:start + self.QUERY_BATCH]
+                rows.update(self._connection.execute(
+                    f"SELECT key, row FROM entries WHERE key IN ({','.join('?' * len(batch))})", batch
+                ).fetchall())
+
+            new_keys = [key for key in keys if key not in rows]
+            next_row = self._meta('next_row', 0)
+            fresh = min(len(new_keys), self.max_entries - next_row)
+            new_rows = list(range(next_row, next_row + fresh))
+            if fresh:
+                self._set_meta('next_row', next_row + fresh)
+
+            to_evict = len(new_keys) - fresh
+            if to_evict:
+                # Least recently used entries that are not being rewritten by this batch
+                victims = []
+                for key, row in self._connection.execute(
+                        "SELECT key, row FROM entries ORDER BY last_used LIMIT ?", (to_evict + len(rows),)):
+                    if key not in rows:
+                        victims.append((key, row))
+                        if len(victims) == to_evict:
+                            break
+                self._connection.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key, _ in victims])
+                new_rows.extend(row for _, row in victims)
+                self.evictions += len(victims)
+
+            rows.update(zip(new_keys, new_rows))
+            self._ensure_capacity(max(rows.values()) + 1)
+            vectors_file = self._mapped(max(rows.values()) + 1)
+            for key, vector in pending.items():
+                vectors_file[rows[key]] = vector
+            vectors_file.flush()
+
+            now = time.time()
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO entries (key, row, last_used) VALUES (?, ?, ?)",
+                [(key, rows[key], now) for key in keys]
+            )
+
+    def encode(self, texts: List[str], encode_fn: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """Return a (len(texts), dim) float32 matrix, calling encode_fn once for all cache misses"""
+        if not texts:
+            return np.asarray(encode_fn([]), dtype=np.float32)
+
+        keys = [self.make_key(text) for text in texts]
+        try:
+            found = self._lookup(list(dict.fromkeys(keys)))
+        except Exception as e:
+            print(f"Error reading embedding cache: {e}")
+            found = {}
+
+        missing = OrderedDict()  # key -> text, deduplicated
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+        self.hits += len(set(keys)) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            computed = np.asarray(encode_fn(list(missing.values())), dtype=np.float32)
+            found.update(zip(missing.keys(), computed))
+            try:
+                self.put_many(list(missing.values()), computed)
+            except Exception as e:
+                print(f"Error writing embedding cache: {e}")
+
+        return np.ascontiguousarray(np.stack([found[key] for key in keys]), dtype=np.float32)
+
+    def clear(self):
+        """Remove all cached vectors (the file keeps its size; its rows are reused)"""
+        with self._locked(exclusive=True), self._transaction():
+            self._connection.execute("DELETE FROM entries")
+            self._set_meta('next_row', 0)
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and size of the cache"""
+        with self._locked(exclusive=False):
+            entries = self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if self.dimension is None:
+                self.dimension = self._meta('dimension')
+            size_bytes = self._rows_in_file() * (self.dimension or 0) * 4
+        lookups = self.hits + self.misses
+        return {
+            'model_name': self.model_name,
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups * 100, 2) if lookups else 0,
+            'evictions': self.evictions,
+            'dimension': self.dimension,
+            'size_bytes': size_bytes
+        }
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(model_name: str, cache_dir: str = "./data/embedding_cache",
+                        max_entries: int = 50000) -> EmbeddingCache:
+    """Return the process-wide EmbeddingCache for (cache_dir, model_name)"""
+    key = (os.path.abspath(cache_dir), model_name)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = EmbeddingCache(model_name, cache_dir, max_entries)
+        return _caches[key]
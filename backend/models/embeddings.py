@@ -1,28 +1,65 @@
-from sentence_transformers import SentenceTransformer
 import chromadb
 from chromadb.config import Settings
 import numpy as np
-from typing import List, Dict
+from typing import Iterable, List, Dict, Optional
+import hashlib
+import json
+import math
 import os
+import re
+import threading
+import time
+
+from .embedding_cache import get_embedding_cache
+from .model_registry import canonical_model_name, get_model
+from .text_chunking import TextChunker
+
+def skill_key(skill: str) -> str:
+    """Metadata key flagging a skill on a chunk ('C++' -> 'skill_cplusplus', 'Node.js' -> 'skill_nodedotjs')"""
+    skill = skill.strip().lower().replace('+', 'plus').replace('#', 'sharp').replace('.', 'dot')
+    return 'skill_' + re.sub(r'[^a-z0-9]+', '_', skill).strip('_')
+
 
 class EmbeddingManager:
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
-        """Initialize embedding manager with sentence transformer model"""
-        self.model_name = model_name
-        self.model = None
+    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+                 cache_dir: Optional[str] = "./data/embedding_cache",
+                 cache_max_entries: int = 50000, chunk_tokens: int = 0, chunk_overlap: int = 32,
+                 overfetch: float = 2.0):
+        """Initialize embedding manager with sentence transformer model.
+
+        Pass cache_dir=None to disable the persistent embedding cache. Resumes are
+        stored as chunks of at most chunk_tokens tokens (0: the model's input window).
+        Searches fetch overfetch times the chunks needed to cover the requested
+        number of resumes on average.
+        """
+        self.model_name = canonical_model_name(model_name)
         self.chroma_client = None
         self.collection = None
-        self._initialize_model()
+        self.embedding_cache = get_embedding_cache(self.model_name, cache_dir, cache_max_entries) \
+            if cache_dir else None
+        self.chunk_tokens = chunk_tokens
+        self.chunk_overlap = chunk_overlap
+        self._chunker = None
+        self.overfetch = overfetch
+        # Syncs run on request threads; one at a time keeps the manifest consistent
+        self._sync_lock = threading.Lock()
+        # resume key (see _resume_key) -> {'content_hash', 'chunks'} of every resume in the collection
+        self.manifest = {}
+        self.last_ingest = {}
         self._initialize_vector_store()
+        self._load_manifest()
     
-    def _initialize_model(self):
-        """Initialize the sentence transformer model"""
-        try:
-            self.model = SentenceTransformer(self.model_name)
-            print(f"Loaded embedding model: {self.model_name}")
-        except Exception as e:
-            print(f"Error loading embedding model: {e}")
-            raise
+    @property
+    def model(self):
+        """Shared sentence transformer model (see model_registry), loaded on first access"""
+        return get_model(self.model_name)
+    
+    @property
+    def chunker(self) -> TextChunker:
+        """Chunker sized to the model's tokenizer and input window, built on first access"""
+        if self._chunker is None:
+            self._chunker = TextChunker.for_model(self.model, self.chunk_tokens, self.chunk_overlap)
+        return self._chunker
     
     def _initialize_vector_store(self):
         """Initialize ChromaDB vector store"""
@@ -51,124 +88,310 @@ class EmbeddingManager:
     def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for a list of texts"""
         try:
-            embeddings = self.model.encode(texts, convert_to_tensor=False)
+            if self.embedding_cache is not None:
+                embeddings = self.embedding_cache.encode(
+                    texts, lambda missing: self.model.encode(missing, convert_to_tensor=False)
+                )
+            else:
+                embeddings = self.model.encode(texts, convert_to_tensor=False)
             return embeddings.tolist()
         except Exception as e:
             print(f"Error generating embeddings: {e}")
             raise
     
-    def add_resume_embeddings(self, resumes: List[Dict]):
-        """Add resume embeddings to vector store"""
+    @staticmethod
+    def _resume_key(resume: Dict) -> str:
+        """Key of a resume in the collection: its corpus resume_id (file names of different candidates may clash)"""
+        return resume.get('resume_id') or resume['file_name']
+    
+    def _load_manifest(self):
+        """Rebuild the resume key -> content hash / chunk count map from chunk metadata"""
         try:
-            # Clear existing collection safely
-            self._safe_clear_collection()
+            existing = self.collection.get(include=['metadatas'])
+            for metadata in existing.get('metadatas') or []:
+                # Chunks stored before resume_ids existed are keyed by file name; the next sync replaces them
+                entry = self.manifest.setdefault(
+                    self._resume_key(metadata), {'content_hash': metadata.get('content_hash'), 'chunks': 0}
+                )
+                entry['chunks'] += 1
+            if self.manifest:
+                print(f"Vector store holds {len(self.manifest)} resumes")
+        except Exception as e:
+            print(f"Error loading vector store manifest: {e}")
+    
+    def _resume_metadata(self, resume: Dict) -> Dict:
+        """Per-resume fields copied onto each of its chunks.
+
+        experience_years is numeric and every skill gets its own boolean key (see
+        skill_key), so search filters can be evaluated by Chroma's `where`.
+        """
+        metadata = {
+            'resume_id': self._resume_key(resume),
+            'file_name': resume['file_name'],
+            'name': resume['name'],
+            'email': resume['email'],
+            'phone': resume['phone'],
+            'skills': ','.join(resume['skills']),
+            'experience_years': resume['experience_years'] or 0
+        }
+        metadata.update({skill_key(skill): True for skill in resume['skills'] if skill_key(skill) != 'skill_'})
+        return metadata
+    
+    def _where_filter(self, filters: Optional[Dict]) -> Optional[Dict]:
+        """Translate search filters into a Chroma `where` clause (None when there is nothing to filter).
+
+        Supported filters: 'min_experience' (years), 'required_skills' (all must be
+        present), 'resume_ids' and 'file_names' (restrict to these resumes).
+        """
+        filters = filters or {}
+        conditions = []
+        if filters.get('min_experience'):
+            conditions.append({'experience_years': {'$gte': filters['min_experience']}})
+        for skill in filters.get('required_skills') or []:
+            conditions.append({skill_key(skill): True})
+        if filters.get('resume_ids') is not None:
+            conditions.append({'resume_id': {'$in': list(filters['resume_ids'])}})
+        if filters.get('file_names') is not None:
+            conditions.append({'file_name': {'$in': list(filters['file_names'])}})
+        
+        if not conditions:
+            return None
+        return conditions[0] if len(conditions) == 1 else {'$and': conditions}
+    
+    def _content_hash(self, resume: Dict, metadata: Dict) -> str:
+        """BLAKE2 hash of everything that ends up in a resume's chunks"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(resume['full_text'].encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(json.dumps(metadata, sort_keys=True).encode('utf-8'))
+        # Chunked differently means stored differently: re-chunk when the chunker changes
+        digest.update(self.chunker.signature.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _chunk_ids(self, resume_key: str, start: int, stop: int) -> List[str]:
+        """Ids of chunks start..stop-1 of a resume"""
+        return [f"{resume_key}_{j}" for j in range(start, stop)]
+    
+    def add_resume_embeddings(self, resumes: List[Dict]) -> Dict:
+        """Sync the vector store with this set of resumes.
+
+        Resumes are keyed by resume_id (see _resume_key) and compared by content hash: only new or
+        changed resumes are chunked, embedded and upserted, resumes no longer in
+        the list are deleted, and unchanged ones are not touched at all.
+        """
+        with self._sync_lock:
+            return self._sync_resumes(resumes)
+    
+    def _sync_resumes(self, resumes: List[Dict]) -> Dict:
+        try:
+            start = time.perf_counter()
+            wanted = {}
+            for resume in resumes:
+                if resume['parsing_status'] == 'success' and resume['full_text']:
+                    metadata = self._resume_metadata(resume)
+                    wanted[metadata['resume_id']] = (resume, metadata, self._content_hash(resume, metadata))
+            
+            removed = [resume_key for resume_key in self.manifest if resume_key not in wanted]
+            self.remove_resumes(removed)
             
             documents = []
             metadatas = []
             ids = []
+            stale_ids = []
+            added = updated = unchanged = 0
             
-            for i, resume in enumerate(resumes):
-                if resume['parsing_status'] == 'success' and resume['full_text']:
-                    # Split resume into chunks for better matching
-                    chunks = self._split_text(resume['full_text'])
-                    
-                    for j, chunk in enumerate(chunks):
-                        documents.append(chunk)
-                        metadatas.append({
-                            'file_name': resume['file_name'],
-                            'name': resume['name'],
-                            'email': resume['email'],
-                            'phone': resume['phone'],
-                            'skills': ','.join(resume['skills']),
-                            'experience_years': str(resume['experience_years']) if resume['experience_years'] else '0',
-                            'chunk_id': j
-                        })
-                        ids.append(f"{resume['file_name']}_{j}")
+            for resume_key, (resume, metadata, content_hash) in wanted.items():
+                previous = self.manifest.get(resume_key)
+                if previous and previous['content_hash'] == content_hash:
+                    unchanged += 1
+                    continue
+                
+                # Split resume into chunks for better matching
+                chunks = self._split_text(resume['full_text'])
+                for j, chunk in enumerate(chunks):
+                    documents.append(chunk['text'])
+                    metadatas.append({
+                        **metadata,
+                        'chunk_id': j,
+                        'chunk_start': chunk['start'],
+                        'chunk_end': chunk['end'],
+                        'section': ','.join(chunk['sections']),
+                        'content_hash': content_hash
+                    })
+                ids.extend(self._chunk_ids(resume_key, 0, len(chunks)))
+                
+                if previous:
+                    updated += 1
+                    # The new version may have fewer chunks than the old one
+                    stale_ids.extend(self._chunk_ids(resume_key, len(chunks), previous['chunks']))
+                else:
+                    added += 1
+                self.manifest[resume_key] = {'content_hash': content_hash, 'chunks': len(chunks)}
+            
+            if stale_ids:
+                self.collection.delete(ids=stale_ids)
             
             if documents:
-                # Add to collection
-                self.collection.add(
+                # Upsert, embedding through the cache rather than Chroma's default function
+                self.collection.upsert(
                     documents=documents,
+                    embeddings=self.generate_embeddings(documents),
                     metadatas=metadatas,
                     ids=ids
                 )
-                print(f"Added {len(documents)} resume chunks to vector store")
-            else:
-                print("No valid resumes to add to vector store")
+            
+            elapsed = time.perf_counter() - start
+            self.last_ingest = {
+                'added_resumes': added,
+                'updated_resumes': updated,
+                'unchanged_resumes': unchanged,
+                'removed_resumes': len(removed),
+                'embedded_chunks': len(documents),
+                'seconds': round(elapsed, 3),
+                'chunks_per_sec': round(len(documents) / elapsed, 1) if documents and elapsed > 0 else 0
+            }
+            print(f"Vector store sync: {added} added, {updated} updated, {unchanged} unchanged, "
+                  f"{len(removed)} removed; {len(documents)} chunks in {elapsed:.2f}s "
+                  f"({self.last_ingest['chunks_per_sec']} chunks/sec)")
+            return self.last_ingest
                 
         except Exception as e:
             print(f"Error adding resume embeddings: {e}")
+            # The manifest may be ahead of the collection now; rebuild it from the source of truth
+            self.manifest = {}
+            self._load_manifest()
             raise
     
-    def search_similar_resumes(self, job_description: str, top_k: int = 5) -> List[Dict]:
-        """Search for resumes similar to job description"""
-        try:
+    def remove_resumes(self, resume_ids: Iterable[str]) -> int:
+        """Delete the chunks of these resumes (by resume_id); returns how many resumes were removed"""
+        ids = []
+        removed = 0
+        for resume_id in resume_ids:
+            entry = self.manifest.pop(resume_id, None)
+            if entry:
+                ids.extend(self._chunk_ids(resume_id, 0, entry['chunks']))
+                removed += 1
+        if ids:
+            self.collection.delete(ids=ids)
+        return removed
+    
+    def _group_by_resume(self, results: Dict) -> Dict:
+        """Aggregate one query's chunk hits per resume: best (lowest) and mean distance, hit count.
+
+        Returns parallel arrays over the distinct resume ids plus the index of each
+        resume's best hit into the query results.
+        """
+        resume_ids = np.array([self._resume_key(metadata) for metadata in results['metadatas'][0]])
+        distances = np.asarray(results['distances'][0], dtype=np.float64)
+        names, groups = np.unique(resume_ids, return_inverse=True)
+        counts = np.bincount(groups, minlength=len(names))
+        
+        # Sorted by resume, then distance: each resume's first entry is its best hit
+        order = np.lexsort((distances, groups))
+        best_hits = order[np.searchsorted(groups[order], np.arange(len(names)))]
+        return {
+            'resume_ids': names,
+            'best': distances[best_hits],
+            'mean': np.bincount(groups, weights=distances, minlength=len(names)) / counts,
+            'total': np.bincount(groups, weights=distances, minlength=len(names)),
+            'count': counts,
+            'best_hit': best_hits
+        }
+    
+    def _rank_resumes(self, job_description: str, needed: int, aggregate: str = 'best',
+                      filters: Optional[Dict] = None) -> List:
+        """The `needed` best resumes for a job description as (resume_id, details) pairs, best first.
+
+        Chunks are over-fetched: the first query asks for enough chunks to cover
+        `needed` resumes at the collection's average chunks per resume, times
+        self.overfetch, and the request doubles until `needed` distinct resumes are
+        found or the whole collection has been returned. Resumes are ordered by
+        their best chunk distance, or by the mean over their retrieved chunks.
+        
+        Filters (see _where_filter) are passed to the query as a `where` clause, so
+        only chunks of qualifying resumes are searched.
+        """
+        if aggregate not in ('best', 'mean'):
+            raise ValueError(f"Unknown aggregate {aggregate!r} (expected 'best' or 'mean')")
+        
+        where = self._where_filter(filters)
+        if filters and any(filters.get(key) is not None and not filters[key] for key in ('resume_ids', 'file_names')):
+            return []  # an empty subset matches nothing
+        
+        total_chunks = self.collection.count()
+        if where is not None and total_chunks:
+            # Qualifying chunks only: ids come from the metadata index, no vectors are read
+            total_chunks = len(self.collection.get(where=where, include=[])['ids'])
+        if not total_chunks or needed < 1:
+            return []
+        
+        query_embeddings = self.generate_embeddings([job_description])
+        chunks_per_resume = total_chunks / max(len(self.manifest), 1)
+        n_results = min(total_chunks, max(needed, math.ceil(needed * chunks_per_resume * self.overfetch)))
+        while True:
             results = self.collection.query(
-                query_texts=[job_description],
-                n_results=min(top_k * 3, 20)  # Get more results to filter unique resumes
+                query_embeddings=query_embeddings,
+                n_results=n_results,
+                where=where,
+                include=['documents', 'metadatas', 'distances']
             )
-            
             if not results['documents'][0]:
                 return []
-            
-            # Group results by resume file
-            resume_scores = {}
-            
-            for i, (doc, metadata, distance) in enumerate(zip(
-                results['documents'][0],
-                results['metadatas'][0],
-                results['distances'][0]
-            )):
-                file_name = metadata['file_name']
-                
-                if file_name not in resume_scores:
-                    resume_scores[file_name] = {
-                        'metadata': metadata,
-                        'best_score': distance,
-                        'best_match_text': doc,
-                        'total_score': distance,
-                        'match_count': 1
-                    }
-                else:
-                    # Update with better score if found
-                    if distance < resume_scores[file_name]['best_score']:
-                        resume_scores[file_name]['best_score'] = distance
-                        resume_scores[file_name]['best_match_text'] = doc
-                    
-                    resume_scores[file_name]['total_score'] += distance
-                    resume_scores[file_name]['match_count'] += 1
-            
-            # Calculate average scores and sort
-            for file_name in resume_scores:
-                resume_scores[file_name]['avg_score'] = (
-                    resume_scores[file_name]['total_score'] / 
-                    resume_scores[file_name]['match_count']
-                )
-            
-            # Sort by best score (lower is better for distance)
-            sorted_resumes = sorted(
-                resume_scores.items(),
-                key=lambda x: x[1]['best_score']
-            )
-            
-            # Return top K unique resumes
-            return sorted_resumes[:top_k]
-            
+            grouped = self._group_by_resume(results)
+            if len(grouped['resume_ids']) >= needed or n_results >= total_chunks:
+                break
+            n_results = min(total_chunks, n_results * 2)
+        
+        # Sort by the chosen distance (lower is better), then by resume id
+        order = np.lexsort((grouped['resume_ids'], grouped[aggregate]))[:needed]
+        return [
+            (str(grouped['resume_ids'][i]), {
+                'metadata': results['metadatas'][0][grouped['best_hit'][i]],
+                'best_score': float(grouped['best'][i]),
+                'best_match_text': results['documents'][0][grouped['best_hit'][i]],
+                'total_score': float(grouped['total'][i]),
+                'match_count': int(grouped['count'][i]),
+                'avg_score': float(grouped['mean'][i])
+            })
+            for i in order
+        ]
+    
+    def search_similar_resumes(self, job_description: str, top_k: int = 5, aggregate: str = 'best',
+                               filters: Optional[Dict] = None) -> List:
+        """Search for resumes similar to job description, optionally only among those matching filters"""
+        try:
+            return self._rank_resumes(job_description, top_k, aggregate, filters)
         except Exception as e:
             print(f"Error searching similar resumes: {e}")
             return []
     
-    def _split_text(self, text: str, chunk_size: int = 500, overlap: int = 50) -> List[str]:
-        """Split text into overlapping chunks"""
-        words = text.split()
-        chunks = []
-        
-        for i in range(0, len(words), chunk_size - overlap):
-            chunk = ' '.join(words[i:i + chunk_size])
-            if chunk.strip():
-                chunks.append(chunk)
-        
-        return chunks if chunks else [text]  # Return original text if no chunks created
+    def search_resumes_page(self, job_description: str, page: int = 1, page_size: int = 10,
+                            aggregate: str = 'best', filters: Optional[Dict] = None) -> Dict:
+        """One page of the resumes most similar to a job description, for browsing past the top few"""
+        offset = (page - 1) * page_size
+        try:
+            # One extra resume tells whether there is a next page
+            ranked = self._rank_resumes(job_description, offset + page_size + 1, aggregate, filters)
+        except Exception as e:
+            print(f"Error searching similar resumes: {e}")
+            ranked = []
+        return {
+            'page': page,
+            'page_size': page_size,
+            'aggregate': aggregate,
+            'filters': filters or {},
+            'total_resumes': len(self.manifest),
+            'has_more': len(ranked) > offset + page_size,
+            'results': [
+                {'resume_id': resume_id, 'file_name': details['metadata']['file_name'], 'rank': offset + position + 1,
+                 **details}
+                for position, (resume_id, details) in enumerate(ranked[offset:offset + page_size])
+            ]
+        }
+    
+    def _split_text(self, text: str) -> List[Dict]:
+        """Split text into token-bounded, section-aware chunks with their offsets (see TextChunker)"""
+        return self.chunker.chunk(text)
     
     def get_collection_stats(self) -> Dict:
         """Get statistics about the vector store collection"""
@@ -176,29 +399,20 @@ class EmbeddingManager:
             count = self.collection.count()
             return {
                 'total_chunks': count,
-                'collection_name': self.collection.name
+                'collection_name': self.collection.name,
+                'total_resumes': len(self.manifest),
+                'last_ingest': self.last_ingest,
+                'embedding_cache': self.embedding_cache.stats() if self.embedding_cache else None
             }
         except Exception as e:
             return {'error': str(e)}
     
-    def _safe_clear_collection(self):
-        """Safely clear all data from the collection"""
-        try:
-            # Get all IDs first, then delete them
-            all_data = self.collection.get()
-            if all_data and all_data.get('ids'):
-                self.collection.delete(ids=all_data['ids'])
-                print("Cleared resume collection")
-            else:
-                print("Collection already empty")
-        except Exception as e:
-            print(f"Error clearing collection safely: {e}")
-    
     def clear_collection(self):
         """Clear all data from the collection"""
+        self.manifest = {}
         try:
             # Get all IDs first, then delete them
-            all_data = self.collection.get()
+            all_data = self.collection.get(include=[])
             if all_data and all_data.get('ids'):
                 self.collection.delete(ids=all_data['ids'])
                 print("Cleared resume collection")
@@ -1,21 +1,155 @@
-from typing import List, Dict, Optional
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Dict, Iterable, Optional, Tuple
 import numpy as np
-from sentence_transformers import SentenceTransformer
 import json
 import os
 import re
+import shutil
+import threading
+import time
+import uuid
+
+from .embedding_cache import get_embedding_cache
+from .model_registry import canonical_model_name, get_model
+from .scoring_engine import ScoringEngine, normalize_rows
+from .text_chunking import TextChunker
+from .vector_index import create_vector_index, load_vector_index
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process file locks
+    fcntl = None
 
 class JobMatcher:
-    def __init__(self):
-        """Initialize the JobMatcher with a sentence transformer model"""
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', batch_size: int = 32,
+                 cache_dir: Optional[str] = None, cache_max_entries: int = 50000,
+                 index_backend: str = 'brute', index_candidates: int = 500, index_dir: Optional[str] = None,
+                 index_save_seconds: float = 30, chunk_tokens: int = 0, chunk_overlap: int = 32, chunk_pooling: str = 'max'):
+        """Initialize the JobMatcher with a sentence transformer model.
+
+        The model comes from the shared model registry and is loaded on first use.
+        When cache_dir is set, embeddings are looked up in / added to the persistent
+        embedding cache before the model is called. When there are more than
+        index_candidates resumes, matching first retrieves the index_candidates
+        nearest resumes from a vector index (index_backend: 'brute' or 'hnsw') and
+        keyword-scores only those. That index is keyed by resume_id and updated
+        incrementally as resumes come and go; with index_dir set it is saved there
+        (at most once every index_save_seconds, and by save_vector_index() at
+        shutdown) and loaded again on startup.
+
+        Workers sharing index_dir each hold their own copy of the index. A save takes
+        a file lock, and if another worker saved since this one last loaded or saved,
+        it first reloads that index and replays its own unsaved additions and removals
+        on top, so no worker's changes are dropped from disk.
+
+        Resumes are embedded as section-aware chunks of at most chunk_tokens model
+        tokens (0: the model's input window) sharing chunk_overlap tokens, so no text
+        is truncated away; a resume's similarity to a job is the max or mean
+        (chunk_pooling) over its chunks.
+        """
+        self.model_name = canonical_model_name(model_name)
+        self.batch_size = batch_size
+        self.embedding_cache = get_embedding_cache(self.model_name, cache_dir, cache_max_entries) \
+            if cache_dir else None
         self.resume_index = []  # Store processed resumes
+        self.embedding_matrix = None  # float32 (n_resumes, dim), row i belongs to resume_index[i]
+        self.index_backend = index_backend
+        self.index_candidates = index_candidates
+        self.index_dir = index_dir
+        self.index_save_seconds = index_save_seconds
+        self.chunk_tokens = chunk_tokens
+        self.chunk_overlap = chunk_overlap
+        self._chunker = None
+        self.chunk_pooling = chunk_pooling
+        self.scoring_engine = None  # ScoringEngine over the last indexed / matched resumes
+        self._engine_positions = {}  # resume key -> row of scoring_engine
+        self.vector_index = None  # nearest-neighbour index over resume-level vectors, labels from _index_labels
+        self._index_labels = {}  # resume_id -> integer label in vector_index
+        self._index_keys = {}  # label -> resume_id
+        self._next_label = 0
+        self._index_directory = None  # directory under index_dir the in-memory index was loaded from / saved to
+        self._pending_adds = {}  # resume_id -> vector added since the last save
+        self._pending_removes = set()  # resume_ids removed since the last save
+        self._save_timer = None
+        # The resume dicts the engine was built from. Holding them (rather than their id()s)
+        # keeps their addresses from being reused by new dicts, e.g. after a corpus reload.
+        self._scoring_engine_resumes = []
+        # Guards the index and the cached engine; requests may index and match concurrently
+        self._lock = threading.RLock()
+        self._load_vector_index()
+        
+    @property
+    def model(self):
+        """Shared SentenceTransformer instance, loaded on first access"""
+        return get_model(self.model_name)
+    
+    def encode_texts(self, texts: List[str]) -> np.ndarray:
+        """Encode texts into a contiguous float32 matrix of shape (len(texts), dim), using the cache if enabled"""
+        if self.embedding_cache is not None:
+            return self.embedding_cache.encode(texts, self._encode_batch)
+        return self._encode_batch(texts)
+    
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Run the model over texts in batches of batch_size"""
+        if not texts:
+            return np.empty((0, self.model.get_sentence_embedding_dimension()), dtype=np.float32)
+        
+        embeddings = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+    
+    def _get_resume_text(self, resume: Dict) -> str:
+        """Get resume text, checking 'text', 'full_text' and 'content' keys for compatibility"""
+        return resume.get('text', '') or resume.get('full_text', '') or resume.get('content', '')
+    
+    @property
+    def chunker(self) -> TextChunker:
+        """Chunker sized to the model's tokenizer and input window, built on first access"""
+        if self._chunker is None:
+            self._chunker = TextChunker.for_model(self.model, self.chunk_tokens, self.chunk_overlap)
+        return self._chunker
+    
+    def _ensure_embeddings(self, resumes: List[Dict]) -> None:
+        """Embed the chunks of every resume not embedded yet with a single batched encode call.
+
+        Each resume keeps its unit-length chunk vectors in 'chunk_embeddings' (a float32
+        matrix that is reused for every later job), the chunks' character offsets in
+        'chunk_spans' and their normalized mean in 'embedding', the resume-level
+        vector used by the index.
+        """
+        missing = [
+            resume for resume in resumes
+            if resume.get('chunk_embeddings') is None and self._get_resume_text(resume)
+        ]
+        if not missing:
+            return
+        
+        chunks = [self.chunker.chunk(self._get_resume_text(resume)) for resume in missing]
+        print(f"Embedding {len(missing)} resumes "
+              f"({sum(len(resume_chunks) for resume_chunks in chunks)} chunks, batch size {self.batch_size})")
+        embeddings = normalize_rows(self.encode_texts([chunk['text'] for resume_chunks in chunks for chunk in resume_chunks]))
+        start = 0
+        for resume, resume_chunks in zip(missing, chunks):
+            resume['chunk_embeddings'] = embeddings[start:start + len(resume_chunks)]
+            resume['chunk_spans'] = [(chunk['start'], chunk['end']) for chunk in resume_chunks]
+            resume['embedding'] = normalize_rows(resume['chunk_embeddings'].mean(axis=0))[0]
+            start += len(resume_chunks)
+    
+    def embed_resumes(self, resumes: List[Dict]) -> None:
+        """Set 'chunk_embeddings', 'chunk_spans' and 'embedding' on resumes that lack them"""
+        with self._lock:
+            self._ensure_embeddings(resumes)
         
     def process_job_description(self, job_description: str) -> Dict:
         """Process job description and extract key information"""
         processed = {
             'text': job_description,
-            'embedding': self.model.encode([job_description])[0],
+            'embedding': self.encode_texts([job_description])[0],
             'keywords': self.extract_keywords(job_description),
             'requirements': self.extract_requirements(job_description)
         }
@@ -118,65 +252,261 @@ class JobMatcher:
         similarity = dot_product / (norm_a * norm_b)
         return float(similarity)
     
-    def match_resumes(self, resumes: List[Dict], job_description: str, top_k: int = 5) -> List[Dict]:
-        """Match resumes against job description and return top matches with enhanced debugging"""
+    @staticmethod
+    def _resume_key(resume: Dict) -> str:
+        """Identity of a resume in the vector index: its corpus resume_id (file name for older records)"""
+        return resume.get('resume_id') or resume.get('file_name', '')
+    
+    def _get_scoring_engine(self, resumes: List[Dict]) -> Tuple[ScoringEngine, Dict[str, int]]:
+        """Return (ScoringEngine, resume key -> engine index) for exactly these resumes, reusing the cached engine when possible"""
+        with self._lock:
+            if self.scoring_engine is not None and len(self._scoring_engine_resumes) == len(resumes) and \
+                    all(built is resume for built, resume in zip(self._scoring_engine_resumes, resumes)):
+                return self.scoring_engine, self._engine_positions
+            
+            self._ensure_embeddings(resumes)
+            dimension = self.model.get_sentence_embedding_dimension()
+            chunk_embeddings = np.concatenate([resume['chunk_embeddings'] for resume in resumes]) if resumes \
+                else np.empty((0, dimension), dtype=np.float32)
+            keywords = [self.extract_keywords(self._get_resume_text(resume)) for resume in resumes]
+            
+            self.scoring_engine = ScoringEngine(
+                chunk_embeddings, keywords,
+                chunk_counts=[len(resume['chunk_embeddings']) for resume in resumes],
+                pooling=self.chunk_pooling
+            )
+            self._engine_positions = {self._resume_key(resume): index for index, resume in enumerate(resumes)}
+            self._scoring_engine_resumes = list(resumes)
+            # Only resumes the index has not seen yet are added; it is never rebuilt here
+            self._add_to_vector_index(resumes)
+            return self.scoring_engine, self._engine_positions
+    
+    def _shortlist(self, positions: Dict[str, int], job_embedding: np.ndarray) -> Optional[np.ndarray]:
+        """Engine indices of the index_candidates resumes nearest to the job, or None to score every resume"""
+        if len(positions) <= self.index_candidates:
+            return None
+        with self._lock:
+            if self.vector_index is None:
+                return None
+            # The index may also hold resumes outside this pool; fetch enough to make up for them
+            k = self.index_candidates + max(0, len(self.vector_index) - len(positions))
+            labels, _ = self.vector_index.search(job_embedding, k)
+            keys = [self._index_keys.get(int(label)) for label in labels]
+        shortlist = [positions[key] for key in keys if key in positions][:self.index_candidates]
+        return np.asarray(shortlist, dtype=np.int64)
+    
+    def _add_to_vector_index(self, resumes: List[Dict]) -> None:
+        """Insert the resume-level vectors of resumes missing from the vector index, then schedule a save"""
+        missing = {}
+        for resume in resumes:
+            key = self._resume_key(resume)
+            if key not in self._index_labels and resume.get('embedding') is not None:
+                missing[key] = resume['embedding']
+        if not missing:
+            return
+        
+        self._insert_vectors(missing)
+        if self.index_dir:
+            self._pending_adds.update(missing)
+            self._pending_removes.difference_update(missing)
+        self._schedule_save()
+    
+    def _insert_vectors(self, vectors: Dict[str, np.ndarray]) -> None:
+        """Give each resume_id -> vector a new label in the vector index"""
+        if not vectors:
+            return
+        if self.vector_index is None:
+            self.vector_index = create_vector_index(self.index_backend, len(next(iter(vectors.values()))))
+        labels = list(range(self._next_label, self._next_label + len(vectors)))
+        self._next_label += len(vectors)
+        self.vector_index.add(labels, np.stack(list(vectors.values())))
+        for key, label in zip(vectors, labels):
+            self._index_labels[key] = label
+            self._index_keys[label] = key
+    
+    def _remove_from_vector_index(self, resume_ids: Iterable[str]) -> int:
+        labels = [self._index_labels.pop(resume_id) for resume_id in resume_ids if resume_id in self._index_labels]
+        for label in labels:
+            self._index_keys.pop(label, None)
+        if labels:
+            self.vector_index.remove(labels)
+        return len(labels)
+    
+    def remove_resumes(self, resume_ids: Iterable[str]) -> int:
+        """Drop resumes from the vector index (e.g. when they leave the corpus); returns how many were indexed"""
+        with self._lock:
+            resume_ids = list(resume_ids)
+            removed = self._remove_from_vector_index(resume_ids)
+            # Recorded even when not indexed here: another worker may have saved them
+            if resume_ids and self.index_dir:
+                for resume_id in resume_ids:
+                    self._pending_adds.pop(resume_id, None)
+                self._pending_removes.update(resume_ids)
+                self._schedule_save()
+            return removed
+    
+    @contextmanager
+    def _index_dir_lock(self):
+        """Exclusive lock on index_dir across processes (none without fcntl)"""
+        root = Path(self.index_dir)
+        root.mkdir(parents=True, exist_ok=True)
+        with open(root / "lock", 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield root
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    @staticmethod
+    def _saved_directory(root: Path) -> Optional[str]:
+        """The index directory current.json points at"""
+        try:
+            with open(root / "current.json") as f:
+                return json.load(f)['directory']
+        except FileNotFoundError:
+            return None
+    
+    def _reset_vector_index(self) -> None:
+        self.vector_index = None
+        self._index_labels = {}
+        self._index_keys = {}
+        self._next_label = 0
+        self._index_directory = None
+    
+    def _read_saved_index(self, root: Path) -> None:
+        """Replace the in-memory index with the one saved in index_dir (empty if none, or built by another model or backend)"""
+        self._reset_vector_index()
+        if not (root / "current.json").exists():
+            return
+        with open(root / "current.json") as f:
+            current = json.load(f)
+        if current['model_name'] != self.model_name or current['backend'] != self.index_backend:
+            print(f"Vector index in {self.index_dir} was built for another model or backend, starting empty")
+            return
+        self.vector_index = load_vector_index(str(root / current['directory']))
+        self._index_labels = current['labels']
+        self._index_keys = {label: key for key, label in self._index_labels.items()}
+        self._next_label = current['next_label']
+        self._index_directory = current['directory']
+    
+    def _load_vector_index(self) -> None:
+        """Load the index saved in index_dir"""
+        if not self.index_dir or not (Path(self.index_dir) / "current.json").exists():
+            return
+        try:
+            with self._index_dir_lock() as root:
+                self._read_saved_index(root)
+            if self.vector_index is not None:
+                print(f"Loaded vector index ({self.vector_index.kind}): {len(self.vector_index)} resumes")
+        except Exception as e:
+            print(f"Error loading vector index, starting empty: {e}")
+            self._reset_vector_index()
+    
+    def _schedule_save(self) -> None:
+        """Save the index index_save_seconds after the first unsaved change (at once when 0)"""
+        if not self.index_dir:
+            return
+        if self.index_save_seconds <= 0:
+            self.save_vector_index()
+        elif self._save_timer is None:
+            self._save_timer = threading.Timer(self.index_save_seconds, self.save_vector_index)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def save_vector_index(self) -> None:
+        """Write unsaved vector index changes to index_dir (also called at shutdown).
+
+        If another worker saved since we last loaded or saved, its index is loaded
+        and our unsaved changes are replayed on top first. Other workers may be
+        loading the previous directory, so old ones are only deleted after a minute.
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self.index_dir or not (self._pending_adds or self._pending_removes):
+                return
+            try:
+                with self._index_dir_lock() as root:
+                    if self._saved_directory(root) != self._index_directory:
+                        self._read_saved_index(root)
+                        self._remove_from_vector_index(self._pending_removes)
+                        self._insert_vectors({key: vector for key, vector in self._pending_adds.items()
+                                              if key not in self._index_labels})
+                    if self.vector_index is not None:
+                        self._write_vector_index(root)
+                    self._pending_adds = {}
+                    self._pending_removes = set()
+            except Exception as e:
+                print(f"Error saving vector index: {e}")
+    
+    def _write_vector_index(self, root: Path) -> None:
+        """Save the index to a new directory under root and atomically point current.json at it"""
+        directory = f"index-{uuid.uuid4().hex}"
+        self.vector_index.save(str(root / directory))
+        current = {
+            'directory': directory,
+            'model_name': self.model_name,
+            'backend': self.index_backend,
+            'next_label': self._next_label,
+            'labels': self._index_labels
+        }
+        temp_file = root / f"{directory}.json.tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(current, f)
+        os.replace(temp_file, root / "current.json")
+        self._index_directory = directory
+        
+        for old in root.glob("index-*"):
+            if old.is_dir() and old.name != directory and time.time() - old.stat().st_mtime > 60:
+                shutil.rmtree(old, ignore_errors=True)
+    
+    def match_resumes(self, resumes: List[Dict], job_description: str, top_k: int = 5,
+                      job_profile=None) -> List[Dict]:
+        """Match resumes against job description and return top matches with enhanced debugging
+
+        Pass the description's JobProfile to reuse its embedding and keywords.
+        """
         try:
             print(f"[DEBUG] Starting match_resumes with {len(resumes)} resumes")
             print(f"[DEBUG] Job description preview: {job_description[:100]}...")
             
-            job_data = self.process_job_description(job_description)
-            matches = []
+            job_data = job_profile.matching_data() if job_profile is not None \
+                else self.process_job_description(job_description)
             
             print(f"[DEBUG] Job keywords extracted: {job_data['keywords'][:10]}...")  # Show first 10
             
-            for i, resume in enumerate(resumes):
-                print(f"[DEBUG] Processing resume {i+1}: {resume.get('file_name', 'Unknown')}")
-                
-                # Check if resume has text content
-                resume_text = resume.get('text', '') or resume.get('full_text', '') or resume.get('content', '')
-                
-                if not resume_text:
-                    print(f"[DEBUG] Skipping resume {i+1}: No text content found")
-                    print(f"[DEBUG] Resume keys: {list(resume.keys())}")
-                    continue
-                
-                print(f"[DEBUG] Resume {i+1} text preview: {resume_text[:100]}...")
-                
-                # Create embedding if not exists
-                if 'embedding' not in resume or resume['embedding'] is None:
-                    print(f"[DEBUG] Creating embedding for resume {i+1}")
-                    resume['embedding'] = self.model.encode([resume_text])[0].tolist()
-                
-                # Calculate similarity score  
-                resume_embedding = np.array(resume['embedding'])
-                job_embedding = np.array(job_data['embedding'])
-                
-                similarity_score = self.calculate_match_score(resume_embedding, job_embedding)
-                print(f"[DEBUG] Resume {i+1} similarity score: {similarity_score:.4f}")
-                
-                # Extract skills from resume for keyword matching
-                resume_keywords = self.extract_keywords(resume_text)
-                common_keywords = list(set(job_data['keywords']) & set(resume_keywords))
-                
-                # Calculate keyword match ratio
-                keyword_match_ratio = len(common_keywords) / max(len(job_data['keywords']), 1) if job_data['keywords'] else 0
-                
-                # Combine similarity score with keyword matching
-                # Weight: 60% similarity + 40% keyword matching
-                combined_score = (0.6 * similarity_score) + (0.4 * keyword_match_ratio)
-                
-                print(f"[DEBUG] Resume {i+1} keyword matches ({len(common_keywords)}): {common_keywords[:5]}...")
-                print(f"[DEBUG] Resume {i+1} combined score: {combined_score:.4f}")
-                
-                preview_text = resume_text[:200] + '...' if len(resume_text) > 200 else resume_text
+            # Check which resumes have text content
+            candidates = [resume for resume in resumes if self._get_resume_text(resume)]
+            if len(candidates) < len(resumes):
+                print(f"[DEBUG] Skipping {len(resumes) - len(candidates)} resumes without text content")
+            
+            # Score every candidate at once: one matrix-vector product for similarity,
+            # posting lists for keyword overlap, argpartition for the top_k. Large pools
+            # are first cut down to the nearest index_candidates by the vector index.
+            engine, positions = self._get_scoring_engine(candidates)
+            shortlist = self._shortlist(positions, job_data['embedding'])
+            if shortlist is not None:
+                print(f"[DEBUG] Vector index ({self.vector_index.kind}) shortlisted {len(shortlist)} candidates")
+            ranked = engine.rank(job_data['embedding'], job_data['keywords'], top_k, candidates=shortlist)
+            
+            matches = []
+            for entry in ranked:
+                resume = candidates[entry['index']]
+                # Preview the chunk that matched the job best
+                chunk_start, chunk_end = resume['chunk_spans'][engine.best_chunk(entry['index'], job_data['embedding'])]
+                best_chunk = self._get_resume_text(resume)[chunk_start:chunk_end]
+                preview_text = best_chunk[:200] + '...' if len(best_chunk) > 200 else best_chunk
                 
                 match = {
                     'file_name': resume.get('file_name', 'Unknown'),
-                    'score': combined_score,
-                    'similarity_score': float(similarity_score),
-                    'keyword_match_ratio': keyword_match_ratio,
-                    'matched_keywords': common_keywords,
-                    'resume_keywords': resume_keywords[:10],  # Limit for display
+                    'score': entry['score'],
+                    'similarity_score': entry['similarity_score'],
+                    'keyword_match_ratio': entry['keyword_match_ratio'],
+                    'matched_keywords': entry['matched_keywords'],
+                    'resume_keywords': engine.keywords[entry['index']][:10],  # Limit for display
                     'metadata': resume.get('metadata', {}),
                     'best_match_text': preview_text,
                     # Add candidate information from parsed resume
@@ -191,18 +521,14 @@ class JobMatcher:
                 }
                 matches.append(match)
             
-            print(f"[DEBUG] Generated {len(matches)} matches before sorting")
-            
-            # Sort by combined score and return top_k
-            matches.sort(key=lambda x: x['score'], reverse=True)
+            print(f"[DEBUG] Scored {len(engine) if shortlist is None else len(shortlist)} candidates")
             
             # Always return results if any resumes were processed, even with low scores
             if matches:
-                result = matches[:top_k]
-                print(f"[DEBUG] Returning top {len(result)} matches")
-                for i, match in enumerate(result):
+                print(f"[DEBUG] Returning top {len(matches)} matches")
+                for i, match in enumerate(matches):
                     print(f"[DEBUG] Match {i+1}: {match['file_name']} - Score: {match['score']:.4f}")
-                return result
+                return matches
             else:
                 print("[DEBUG] No matches generated - this might indicate an issue with resume processing")
                 return []
@@ -215,25 +541,26 @@ class JobMatcher:
     
     def create_resume_index(self, resumes: List[Dict]) -> Dict:
         """Create an index of resumes for efficient searching"""
+        with self._lock:
+            return self._create_resume_index(resumes)
+    
+    def _create_resume_index(self, resumes: List[Dict]) -> Dict:
         try:
             print(f"[DEBUG] Creating resume index for {len(resumes)} resumes")
             self.resume_index = []
             processed_count = 0
             
+            # Encode all resumes that still lack an embedding in one batch
+            self._ensure_embeddings(resumes)
+            
             for i, resume in enumerate(resumes):
                 print(f"[DEBUG] Indexing resume {i+1}: {resume.get('file_name', 'Unknown')}")
                 
-                # Check both 'text' and 'full_text' keys for compatibility
-                resume_text = resume.get('text', '') or resume.get('full_text', '') or resume.get('content', '')
+                resume_text = self._get_resume_text(resume)
                 
                 if resume_text:
                     print(f"[DEBUG] Resume {i+1} text length: {len(resume_text)}")
                     
-                    # Create embedding if not exists
-                    if 'embedding' not in resume or resume['embedding'] is None:
-                        print(f"[DEBUG] Creating embedding for indexed resume {i+1}")
-                        resume['embedding'] = self.model.encode([resume_text])[0].tolist()
-                    
                     # Add to index
                     indexed_resume = {
                         'file_name': resume.get('file_name', f'resume_{len(self.resume_index)}'),
@@ -249,6 +576,20 @@ class JobMatcher:
                     print(f"[DEBUG] Skipping resume {i+1}: No text content")
                     print(f"[DEBUG] Resume keys: {list(resume.keys())}")
             
+            # Keep the index vectors in one contiguous float32 matrix and point each
+            # entry at its row
+            if self.resume_index:
+                self.embedding_matrix = np.ascontiguousarray(
+                    np.stack([entry['embedding'] for entry in self.resume_index]), dtype=np.float32
+                )
+                for entry, row in zip(self.resume_index, self.embedding_matrix):
+                    entry['embedding'] = row
+            else:
+                self.embedding_matrix = None
+            
+            # Pre-build the scoring engine so matching these resumes only costs a matrix product
+            self._get_scoring_engine([resume for resume in resumes if self._get_resume_text(resume)])
+            
             result = {
                 'success': True,
                 'message': f'Successfully indexed {processed_count} resumes',
@@ -267,6 +608,19 @@ class JobMatcher:
                 'total_resumes': 0
             }
     
+    def clear_index(self) -> None:
+        """Remove all resumes from the index, including the saved vector index"""
+        with self._lock:
+            self.resume_index = []
+            self.embedding_matrix = None
+            self.scoring_engine = None
+            self._reset_vector_index()
+            self._pending_adds = {}
+            self._pending_removes = set()
+            self._scoring_engine_resumes = []
+            if self.index_dir and os.path.isdir(self.index_dir):
+                shutil.rmtree(self.index_dir, ignore_errors=True)
+    
     def extract_skills_from_text(self, text: str) -> List[str]:
         """Extract skills from resume text"""
         skills = []
@@ -0,0 +1,295 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+# Bump when what a profile holds or how it is extracted changes, so stored profiles get rebuilt
+PROFILE_VERSION = 1
+
+
+def job_id_for(job_description: str) -> str:
+    """Stable id of a job description: BLAKE2 hash of its text with whitespace collapsed"""
+    normalized = re.sub(r'\s+', ' ', job_description).strip()
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class JobProfile:
+    """Everything derived from one job description, computed once and reused.
+
+    embedding and keywords/requirements are what JobMatcher scores resumes
+    against; ats_keywords and analysis (experience level, job type, ...) are what
+    ATSOptimizer uses. job_id is the content hash of the description; title is
+    an optional label for people (the only field that can change).
+    """
+
+    def __init__(self, job_id: str, description: str, embedding: np.ndarray, keywords: List[str],
+                 requirements: List[str], ats_keywords: List[str], analysis: Dict,
+                 embedding_model: str, created_at: Optional[float] = None, version: int = PROFILE_VERSION,
+                 title: Optional[str] = None):
+        self.job_id = job_id
+        self.description = description
+        self.embedding = np.asarray(embedding, dtype=np.float32)
+        self.keywords = keywords
+        self.requirements = requirements
+        self.ats_keywords = ats_keywords
+        self.analysis = analysis
+        self.embedding_model = embedding_model
+        self.created_at = created_at or time.time()
+        self.version = version
+        self.title = title
+
+    @classmethod
+    def build(cls, job_description: str, job_matcher, ats_optimizer, title: Optional[str] = None) -> 'JobProfile':
+        """Embed and analyze a job description with the matcher's model and the optimizer's keyword pool"""
+        ats_keywords = ats_optimizer.extract_job_keywords(job_description)
+        return cls(
+            job_id=job_id_for(job_description),
+            description=job_description,
+            embedding=job_matcher.encode_texts([job_description])[0],
+            keywords=job_matcher.extract_keywords(job_description),
+            requirements=job_matcher.extract_requirements(job_description),
+            ats_keywords=ats_keywords,
+            analysis=ats_optimizer.analyze_job_keywords(job_description, ats_keywords),
+            embedding_model=job_matcher.model_name,
+            title=title
+        )
+
+    @property
+    def experience_level(self) -> str:
+        return self.analysis.get('experience_level', 'Not specified')
+
+    @property
+    def job_type(self) -> str:
+        return self.analysis.get('job_type', 'Not specified')
+
+    def matching_data(self) -> Dict:
+        """The profile in the shape of JobMatcher.process_job_description()"""
+        return {
+            'text': self.description,
+            'embedding': self.embedding,
+            'keywords': self.keywords,
+            'requirements': self.requirements
+        }
+
+    def to_dict(self, include_description: bool = True) -> Dict:
+        """JSON-friendly summary (without the embedding)"""
+        profile = {
+            'job_id': self.job_id,
+            'title': self.title,
+            'keywords': self.keywords,
+            'requirements': self.requirements,
+            'ats_keywords': self.ats_keywords,
+            'analysis': self.analysis,
+            'experience_level': self.experience_level,
+            'job_type': self.job_type,
+            'embedding_model': self.embedding_model,
+            'created_at': self.created_at
+        }
+        if include_description:
+            profile['description'] = self.description
+        return profile
+
+
+class JobProfileStore:
+    """Persistent JobProfiles keyed by job_id.
+
+    Profiles live in a SQLite table (one connection per thread), the embedding as
+    a float32 blob next to the JSON fields; the max_cached most recently used are
+    also kept in memory. Profiles built by another embedding model or an older
+    PROFILE_VERSION count as missing and are rebuilt by get_or_create().
+    """
+
+    def __init__(self, database_path: str = "./data/job_profiles.sqlite3", embedding_model: Optional[str] = None,
+                 max_cached: int = 256):
+        self.database_path = database_path
+        self.embedding_model = embedding_model
+        self.max_cached = max(1, max_cached)
+        self._profiles = OrderedDict()  # job_id -> JobProfile, least recently used first
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._build_locks = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+
+        Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS job_profiles (
+                    job_id TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    embedding_model TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    profile TEXT NOT NULL,
+                    embedding BLOB NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_job_profiles_last_used ON job_profiles (last_used);
+            """)
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; requests run on the blocking executor's threads"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.database_path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _usable(self, profile: JobProfile) -> bool:
+        return profile.version == PROFILE_VERSION and \
+            (self.embedding_model is None or profile.embedding_model == self.embedding_model)
+
+    def _remember(self, profile: JobProfile):
+        self._profiles[profile.job_id] = profile
+        self._profiles.move_to_end(profile.job_id)
+        while len(self._profiles) > self.max_cached:
+            self._profiles.popitem(last=False)
+
+    @staticmethod
+    def _from_row(row) -> JobProfile:
+        version, embedding_model, created_at, fields, embedding = row
+        fields = json.loads(fields)
+        return JobProfile(
+            embedding=np.frombuffer(embedding, dtype=np.float32).copy(),
+            embedding_model=embedding_model,
+            created_at=created_at,
+            version=version,
+            **fields
+        )
+
+    def get(self, job_id: str) -> Optional[JobProfile]:
+        """Stored profile for job_id, or None"""
+        with self._lock:
+            profile = self._profiles.get(job_id)
+            if profile is not None:
+                self._profiles.move_to_end(job_id)
+                self.hits += 1
+                return profile
+
+            with self._connection() as connection:
+                row = connection.execute(
+                    "SELECT version, embedding_model, created_at, profile, embedding FROM job_profiles "
+                    "WHERE job_id = ?", (job_id,)
+                ).fetchone()
+                if row is not None:
+                    connection.execute("UPDATE job_profiles SET last_used = ? WHERE job_id = ?",
+                                       (time.time(), job_id))
+            profile = self._from_row(row) if row is not None else None
+            if profile is None or not self._usable(profile):
+                self.misses += 1
+                return None
+            self._remember(profile)
+            self.hits += 1
+            return profile
+
+    def put(self, profile: JobProfile):
+        """Store (or replace) a profile"""
+        fields = {
+            'job_id': profile.job_id,
+            'title': profile.title,
+            'description': profile.description,
+            'keywords': profile.keywords,
+            'requirements': profile.requirements,
+            'ats_keywords': profile.ats_keywords,
+            'analysis': profile.analysis
+        }
+        now = time.time()
+        with self._lock, self._connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO job_profiles "
+                "(job_id, version, embedding_model, created_at, last_used, profile, embedding) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (profile.job_id, profile.version, profile.embedding_model, profile.created_at, now,
+                 json.dumps(fields), profile.embedding.astype(np.float32).tobytes())
+            )
+            self._remember(profile)
+
+    def get_or_create(self, job_description: str, build: Callable[[str], JobProfile]) -> JobProfile:
+        """Profile of a job description, building and storing it with build(job_description) on first use"""
+        job_id = job_id_for(job_description)
+        profile = self.get(job_id)
+        if profile is not None:
+            return profile
+
+        # Concurrent first requests for the same job wait for a single build
+        with self._lock:
+            build_lock = self._build_locks.setdefault(job_id, threading.Lock())
+        with build_lock:
+            profile = self._profiles.get(job_id)
+            if profile is None:
+                profile = build(job_description)
+                self.builds += 1
+                self.put(profile)
+        with self._lock:
+            self._build_locks.pop(job_id, None)
+        return profile
+
+    def get_by_id(self, job_id: str, build: Callable[[str], JobProfile]) -> Optional[JobProfile]:
+        """Profile for job_id, rebuilt from its stored description if it is out of date; None if unknown"""
+        profile = self.get(job_id)
+        if profile is not None:
+            return profile
+
+        with self._lock, self._connection() as connection:
+            row = connection.execute("SELECT profile FROM job_profiles WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        stored = json.loads(row[0])
+        profile = self.get_or_create(stored['description'], build)
+        if profile.title is None and stored.get('title'):
+            profile = self.set_title(job_id, stored['title'])
+        return profile
+
+    def set_title(self, job_id: str, title: Optional[str]) -> Optional[JobProfile]:
+        """Relabel a stored profile; None if there is no such profile"""
+        with self._lock:
+            profile = self.get(job_id)
+            if profile is not None:
+                profile.title = title
+                self.put(profile)
+            return profile
+
+    def list(self, limit: int = 50, offset: int = 0) -> List[Dict]:
+        """Summaries of stored profiles, most recently used first"""
+        with self._lock, self._connection() as connection:
+            rows = connection.execute(
+                "SELECT version, embedding_model, created_at, profile, embedding FROM job_profiles "
+                "ORDER BY last_used DESC LIMIT ? OFFSET ?", (limit, offset)
+            ).fetchall()
+        return [self._from_row(row).to_dict(include_description=False) for row in rows]
+
+    def delete(self, job_id: str) -> bool:
+        """Remove a profile; False if there was none"""
+        with self._lock, self._connection() as connection:
+            self._profiles.pop(job_id, None)
+            return connection.execute("DELETE FROM job_profiles WHERE job_id = ?", (job_id,)).rowcount > 0
+
+    def clear(self):
+        """Remove every profile"""
+        with self._lock, self._connection() as connection:
+            connection.execute("DELETE FROM job_profiles")
+            self._profiles.clear()
+
+    def stats(self) -> Dict:
+        """Stored and cached profiles, lookup hits and builds"""
+        with self._lock, self._connection() as connection:
+            entries = connection.execute("SELECT COUNT(*) FROM job_profiles").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'cached_in_memory': len(self._profiles),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups * 100, 2) if lookups else 0,
+            'builds': self.builds
+        }
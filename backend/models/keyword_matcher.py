@@ -0,0 +1,98 @@
+from typing import Dict, List, NamedTuple, Set
+import re
+
+
+class KeywordMatch(NamedTuple):
+    """A single keyword occurrence found in a text"""
+    keyword: str
+    category: str
+    start: int
+    end: int
+
+
+class KeywordMatcher:
+    """Precompiled multi-keyword matcher.
+
+    All keywords are folded into one trie-shaped regular expression, so a text is
+    scanned once no matter how large the vocabulary is. Matching follows the
+    semantics of ``re.search(r'\\b' + re.escape(keyword) + r'\\b', text.lower())``
+    for every keyword, including overlapping hits such as 'react' inside
+    'react native'.
+    """
+
+    def __init__(self, keywords_by_category: Dict[str, List[str]]):
+        self.categories = {}  # keyword -> first category it was listed under
+        for category, keywords in keywords_by_category.items():
+            for keyword in keywords:
+                self.categories.setdefault(keyword.lower(), category)
+
+        self.keywords = list(self.categories)
+
+        # Shorter keywords that are prefixes of a longer one, e.g. 'react' for 'react native'.
+        # The regex reports only the longest keyword starting at a position; these are
+        # checked separately so that overlapping hits are not lost.
+        self._prefixes = {}
+        for keyword in self.keywords:
+            prefixes = [other for other in self.keywords
+                        if len(other) < len(keyword) and keyword.startswith(other)]
+            if prefixes:
+                self._prefixes[keyword] = sorted(prefixes, key=len)
+
+        # Zero-width lookahead so that every start position is tried, not just the
+        # positions after the previous match.
+        self._pattern = re.compile(r'(?=\b(' + self._build_trie_regex(self.keywords) + r')\b)')
+
+    @staticmethod
+    def _build_trie_regex(keywords: List[str]) -> str:
+        """Build a prefix-factored alternation (``py(?:thon|torch)``) for the keywords"""
+        trie = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def to_regex(node: Dict) -> str:
+            is_end = '' in node
+            branches = [re.escape(char) + to_regex(child)
+                        for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            if len(branches) == 1 and not is_end:
+                return branches[0]
+            # Greedy optional group: the longest keyword is tried first
+            return '(?:' + '|'.join(branches) + ')' + ('?' if is_end else '')
+
+        return to_regex(trie)
+
+    @staticmethod
+    def _is_boundary(text: str, index: int) -> bool:
+        """Equivalent of a regex \\b assertion at index"""
+        before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == '_')
+        after = index < len(text) and (text[index].isalnum() or text[index] == '_')
+        return before != after
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """Return every keyword occurrence in text, ordered by position.
+
+        Offsets refer to ``text.lower()``, which is identical to text for ASCII input.
+        """
+        text_lower = text.lower()
+        matches = []
+
+        for match in self._pattern.finditer(text_lower):
+            keyword = match.group(1)
+            start = match.start(1)
+
+            for prefix in self._prefixes.get(keyword, ()):
+                if self._is_boundary(text_lower, start + len(prefix)):
+                    matches.append(KeywordMatch(prefix, self.categories[prefix],
+                                                start, start + len(prefix)))
+
+            matches.append(KeywordMatch(keyword, self.categories[keyword], start, match.end(1)))
+
+        return matches
+
+    def find_keywords(self, text: str) -> Set[str]:
+        """Return the set of distinct keywords present in text"""
+        return {match.keyword for match in self.find_all(text)}
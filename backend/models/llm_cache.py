@@ -0,0 +1,155 @@
+from pathlib import Path
+from typing import Dict, Optional
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+
+class LLMResponseCache:
+    """Persistent cache of LLM responses, keyed by a hash of everything that shapes the answer.
+
+    Responses live in a SQLite table (WAL mode, one connection per thread). Entries
+    older than ttl_seconds count as misses and are deleted when looked up; when more
+    than max_entries are stored the least recently used ones are evicted. Each entry
+    remembers how long the API call took, so the stats report the time saved by hits.
+
+    The number of stored entries is kept in the llm_cache_meta table and updated in
+    the same transaction as the rows, so workers sharing the database agree on it.
+    """
+
+    def __init__(self, database_path: str = "./data/llm_cache.sqlite3", ttl_seconds: float = 7 * 24 * 3600,
+                 max_entries: int = 5000):
+        self.database_path = database_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.seconds_saved = 0.0
+
+        Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    model TEXT,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    api_seconds REAL NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses (last_used);
+                CREATE TABLE IF NOT EXISTS llm_cache_meta (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+            """)
+        with self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("DELETE FROM llm_responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            connection.execute(
+                "INSERT OR REPLACE INTO llm_cache_meta (name, value) "
+                "VALUES ('entries', (SELECT COUNT(*) FROM llm_responses))"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; requests run on the blocking executor's threads"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.database_path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """BLAKE2 hash of the JSON-encoded parts (prompt version, model, temperature, inputs, ...)"""
+        return hashlib.blake2b(json.dumps(parts).encode('utf-8'), digest_size=20).hexdigest()
+
+    @staticmethod
+    def _entries(connection: sqlite3.Connection) -> int:
+        row = connection.execute("SELECT value FROM llm_cache_meta WHERE name = 'entries'").fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def _add_entries(connection: sqlite3.Connection, delta: int):
+        """Adjust the stored entry count (inside the transaction that changed the rows)"""
+        if delta:
+            connection.execute("UPDATE llm_cache_meta SET value = value + ? WHERE name = 'entries'", (delta,))
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response for key, or None if missing or expired"""
+        now = time.time()
+        with self._lock, self._connection() as connection:
+            row = connection.execute(
+                "SELECT response, created_at, api_seconds FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            response, created_at, api_seconds = row
+            if created_at < now - self.ttl_seconds:
+                deleted = connection.execute("DELETE FROM llm_responses WHERE key = ?", (key,)).rowcount
+                self._add_entries(connection, -deleted)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            connection.execute("UPDATE llm_responses SET last_used = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            self.seconds_saved += api_seconds
+            return response
+
+    def put(self, key: str, response: str, model: Optional[str] = None, api_seconds: float = 0.0):
+        """Store a response, evicting the least recently used entries beyond max_entries"""
+        now = time.time()
+        with self._lock, self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            replaced = connection.execute("SELECT 1 FROM llm_responses WHERE key = ?", (key,)).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, response, model, created_at, last_used, api_seconds) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, response, model, now, now, api_seconds)
+            )
+            if not replaced:
+                self._add_entries(connection, 1)
+
+            overflow = self._entries(connection) - self.max_entries
+            if overflow > 0:
+                evicted = connection.execute(
+                    "DELETE FROM llm_responses WHERE key IN "
+                    "(SELECT key FROM llm_responses ORDER BY last_used LIMIT ?)", (overflow,)
+                ).rowcount
+                self._add_entries(connection, -evicted)
+                self.evictions += evicted
+
+    def clear(self):
+        """Remove every cached response"""
+        with self._lock, self._connection() as connection:
+            connection.execute("DELETE FROM llm_responses")
+            connection.execute("UPDATE llm_cache_meta SET value = 0 WHERE name = 'entries'")
+
+    def stats(self) -> Dict:
+        """Hit/miss counters, size and time saved"""
+        lookups = self.hits + self.misses
+        with self._lock:
+            entries = self._entries(self._connection())
+        return {
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups * 100, 2) if lookups else 0,
+            'expirations': self.expirations,
+            'evictions': self.evictions,
+            'api_seconds_saved': round(self.seconds_saved, 3)
+        }
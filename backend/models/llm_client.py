@@ -0,0 +1,189 @@
+from typing import AsyncIterator, Dict, List, Optional
+import asyncio
+import random
+import time
+import groq
+import httpx
+
+from .llm_cache import LLMResponseCache
+
+# Status codes worth another attempt: timeouts, lock conflicts, rate limits, server errors
+RETRYABLE_STATUS = {408, 409, 429}
+
+
+class AsyncLLMClient:
+    """Async Groq chat-completions client shared by every request.
+
+    At most max_concurrency API calls are in flight; further calls wait for a
+    slot. Failed calls that are worth repeating (connection errors, timeouts, 429
+    and 5xx) are retried up to max_retries times after a "full jitter" backoff:
+    a random delay up to backoff_base * 2**attempt, capped at backoff_max and
+    never shorter than a Retry-After header. Identical requests that arrive while
+    one is already in flight share its result instead of calling the API again
+    (streamed completions are never shared, each caller reads its own tokens).
+    base_url points the client at another server, e.g. a local stub.
+    """
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None, max_concurrency: int = 4,
+                 max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 8.0,
+                 timeout: float = 60.0):
+        # Retries happen here, with jitter and outside the concurrency slot. The
+        # connection pool matches the concurrency limit (passing our own httpx client
+        # also avoids the `proxies` argument newer httpx releases no longer accept).
+        self.client = groq.AsyncGroq(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=0,
+            timeout=timeout,
+            http_client=httpx.AsyncClient(
+                timeout=timeout,
+                limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+            )
+        )
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+        self.requests = 0
+        self.api_calls = 0
+        self.coalesced = 0
+        self.streams = 0
+        self.retries = 0
+        self.failures = 0
+        self.active_calls = 0
+
+    async def complete(self, model: str, messages: List[Dict], max_tokens: int, temperature: float,
+                       **options) -> Dict:
+        """Message content and token usage of one chat completion: {'content', 'usage', 'api_seconds'}
+
+        options are passed on to the API, e.g. response_format={'type': 'json_object'}.
+        """
+        self.requests += 1
+        key = LLMResponseCache.make_key(model, messages, max_tokens, temperature, options)
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(self._complete_with_retry(model, messages, max_tokens, temperature, options))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded: one caller giving up must not cancel the call the others wait for
+        return await asyncio.shield(task)
+
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """Full-jitter exponential backoff, respecting Retry-After when the server sends one"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        try:
+            return max(delay, min(float(retry_after), self.backoff_max)) if retry_after else delay
+        except ValueError:
+            return delay
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        if isinstance(error, groq.APIConnectionError):  # includes timeouts
+            return True
+        if isinstance(error, groq.APIStatusError):
+            return error.status_code in RETRYABLE_STATUS or error.status_code >= 500
+        return False
+
+    async def _complete_with_retry(self, model: str, messages: List[Dict], max_tokens: int,
+                                   temperature: float, options: Dict) -> Dict:
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    self.active_calls += 1
+                    self.api_calls += 1
+                    start = time.perf_counter()
+                    try:
+                        response = await self.client.chat.completions.create(
+                            model=model,
+                            messages=messages,
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            **options
+                        )
+                    finally:
+                        self.active_calls -= 1
+                usage = getattr(response, 'usage', None)
+                return {
+                    'content': response.choices[0].message.content,
+                    'usage': {
+                        'prompt_tokens': getattr(usage, 'prompt_tokens', None),
+                        'completion_tokens': getattr(usage, 'completion_tokens', None)
+                    },
+                    'api_seconds': time.perf_counter() - start
+                }
+            except Exception as e:
+                await self._wait_to_retry(attempt, e)
+                attempt += 1
+
+    async def _wait_to_retry(self, attempt: int, error: Exception):
+        """Sleep before retry attempt + 1, or re-raise error when it is not worth another try"""
+        if attempt >= self.max_retries or not self._is_retryable(error):
+            self.failures += 1
+            raise error
+        delay = self._retry_delay(attempt, error)
+        self.retries += 1
+        print(f"⚠️ Groq call failed ({error.__class__.__name__}), retry {attempt + 1}/{self.max_retries} "
+              f"in {delay:.2f}s")
+        await asyncio.sleep(delay)
+
+    async def stream(self, model: str, messages: List[Dict], max_tokens: int,
+                     temperature: float) -> AsyncIterator[str]:
+        """Text pieces of one chat completion as the API produces them.
+
+        The call keeps its concurrency slot until the last piece has been read. It is
+        retried like complete() only while nothing has been yielded yet; after that
+        an error ends the stream.
+        """
+        self.requests += 1
+        self.streams += 1
+        attempt = 0
+        while True:
+            started = False
+            try:
+                async with self._semaphore:
+                    self.active_calls += 1
+                    self.api_calls += 1
+                    try:
+                        response = await self.client.chat.completions.create(
+                            model=model,
+                            messages=messages,
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            stream=True
+                        )
+                        async for chunk in response:
+                            piece = chunk.choices[0].delta.content if chunk.choices else None
+                            if piece:
+                                started = True
+                                yield piece
+                    finally:
+                        self.active_calls -= 1
+                return
+            except Exception as e:
+                if started:
+                    self.failures += 1
+                    raise
+                await self._wait_to_retry(attempt, e)
+                attempt += 1
+
+    def stats(self) -> Dict:
+        """Request, call, coalescing, stream and retry counters"""
+        return {
+            'max_concurrency': self.max_concurrency,
+            'active_calls': self.active_calls,
+            'in_flight_prompts': len(self._in_flight),
+            'requests': self.requests,
+            'api_calls': self.api_calls,
+            'coalesced': self.coalesced,
+            'streams': self.streams,
+            'retries': self.retries,
+            'failures': self.failures
+        }
@@ -0,0 +1,79 @@
+from typing import Dict, List
+import threading
+import time
+
+# Process-wide registry of loaded SentenceTransformer models. JobMatcher and
+# EmbeddingManager both resolve their model here, so each model's weights are
+# loaded once per process, on first use.
+_models = {}
+_load_seconds = {}
+_registry_lock = threading.Lock()
+_model_locks = {}
+
+
+def canonical_model_name(model_name: str) -> str:
+    """Map short names ('all-MiniLM-L6-v2') to the hub id sentence-transformers resolves them to"""
+    return model_name if '/' in model_name else f"sentence-transformers/{model_name}"
+
+
+def get_model(model_name: str):
+    """Return the shared SentenceTransformer instance, loading it on first use (thread-safe)"""
+    model_name = canonical_model_name(model_name)
+    model = _models.get(model_name)
+    if model is not None:
+        return model
+
+    with _registry_lock:
+        model_lock = _model_locks.setdefault(model_name, threading.Lock())
+
+    # Per-model lock: concurrent first requests wait for a single load
+    with model_lock:
+        if model_name not in _models:
+            start = time.perf_counter()
+            try:
+                # Imported here: pulling in torch is a large part of the cold-start cost
+                from sentence_transformers import SentenceTransformer
+                _models[model_name] = SentenceTransformer(model_name)
+            except Exception as e:
+                print(f"Error loading embedding model {model_name}: {e}")
+                raise
+            _load_seconds[model_name] = time.perf_counter() - start
+            print(f"Loaded embedding model: {model_name} ({_load_seconds[model_name]:.2f}s)")
+
+    return _models[model_name]
+
+
+def is_loaded(model_name: str) -> bool:
+    """Whether the model has already been loaded in this process"""
+    return canonical_model_name(model_name) in _models
+
+
+def loaded_models() -> List[str]:
+    """Names of all models loaded in this process"""
+    return list(_models)
+
+
+def _model_memory_bytes(model) -> int:
+    """Bytes held by a model's parameters and buffers"""
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
+def memory_footprint() -> Dict:
+    """Parameter count, weight memory and load time of every loaded model"""
+    models = {}
+    for model_name, model in list(_models.items()):
+        memory_bytes = _model_memory_bytes(model)
+        models[model_name] = {
+            'parameters': sum(parameter.numel() for parameter in model.parameters()),
+            'memory_bytes': memory_bytes,
+            'memory_mb': round(memory_bytes / (1024 * 1024), 2),
+            'load_seconds': round(_load_seconds.get(model_name, 0), 3)
+        }
+
+    total_bytes = sum(info['memory_bytes'] for info in models.values())
+    return {
+        'loaded_models': len(models),
+        'models': models,
+        'total_memory_mb': round(total_bytes / (1024 * 1024), 2)
+    }
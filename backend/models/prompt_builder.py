@@ -0,0 +1,105 @@
+from typing import Callable, Dict, List, Optional
+import re
+
+import numpy as np
+
+from .text_chunking import TextChunker
+
+_WORD_PATTERN = re.compile(r'[a-z][a-z0-9+#.]*')
+
+# Stands for the resume text left out between two excerpts
+GAP_MARKER = "\n...\n"
+
+
+class PromptBuilder:
+    """Fits a resume and a job description into a prompt token budget.
+
+    The job description keeps its opening job_tokens tokens. The resume is cut into
+    section-aligned pieces of at most piece_tokens tokens, the pieces are ranked by
+    similarity to the job description and the best ones are kept, in document
+    order, until token_budget is used up. Similarity is the cosine of the encoder's
+    embeddings; without an encoder (or if it fails) it is the share of the job's
+    words found in the piece. Tokens are counted with TextChunker's approximation,
+    which over-counts slightly compared to the LLM tokenizer.
+    """
+
+    def __init__(self, token_budget: int = 900, job_tokens: int = 300, piece_tokens: int = 120,
+                 encoder: Optional[Callable[[List[str]], np.ndarray]] = None):
+        self.token_budget = token_budget
+        self.job_tokens = min(job_tokens, token_budget)
+        self.encoder = encoder
+        self.chunker = TextChunker(max_tokens=piece_tokens, overlap=0)
+
+    @property
+    def signature(self) -> str:
+        """Identifies the excerpts this builder produces (part of the response cache key)"""
+        ranking = 'embedding' if self.encoder is not None else 'keywords'
+        return f"{self.token_budget}:{self.job_tokens}:{self.chunker.max_tokens}:{ranking}"
+
+    def count_tokens(self, text: str) -> int:
+        """Approximate token count of text"""
+        return len(self.chunker.token_spans(text))
+
+    def _truncate(self, text: str, max_tokens: int):
+        """The first max_tokens tokens of text and their count"""
+        spans = self.chunker.token_spans(text)
+        if len(spans) <= max_tokens:
+            return text.strip(), len(spans)
+        return text[:spans[max_tokens - 1][1]].strip(), max_tokens
+
+    def _relevance(self, pieces: List[str], job_text: str) -> np.ndarray:
+        """Similarity of every piece to the job text"""
+        if self.encoder is not None:
+            try:
+                embeddings = np.asarray(self.encoder([job_text] + pieces), dtype=np.float32)
+                embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+                return embeddings[1:] @ embeddings[0]
+            except Exception as e:
+                print(f"⚠️ Prompt builder falling back to keyword overlap: {e}")
+
+        job_words = set(_WORD_PATTERN.findall(job_text.lower()))
+        return np.array([
+            len(job_words & set(_WORD_PATTERN.findall(piece.lower()))) / max(len(job_words), 1)
+            for piece in pieces
+        ], dtype=np.float32)
+
+    def build(self, resume_text: str, job_description: str) -> Dict:
+        """Excerpts that fit the budget: resume_excerpt, job_excerpt, their token counts and the sections kept"""
+        job_excerpt, job_tokens = self._truncate(job_description, self.job_tokens)
+        resume_budget = self.token_budget - job_tokens
+
+        pieces = self.chunker.chunk(resume_text)
+        if sum(piece['tokens'] for piece in pieces) <= resume_budget:
+            chosen = list(range(len(pieces)))  # everything fits, no ranking needed
+        else:
+            # Every piece may need a gap marker in front of it; charging for it keeps the total in budget
+            separator_tokens = self.count_tokens(GAP_MARKER)
+            scores = self._relevance([piece['text'] for piece in pieces], job_excerpt)
+            chosen, used = [], -separator_tokens
+            for index in np.argsort(-scores, kind='stable'):
+                cost = pieces[index]['tokens'] + separator_tokens
+                if used + cost <= resume_budget:
+                    chosen.append(int(index))
+                    used += cost
+            chosen.sort()
+
+        # Runs of neighbouring pieces are copied as one stretch of the resume
+        runs = []
+        for index in chosen:
+            if runs and runs[-1][1] == index - 1:
+                runs[-1][1] = index
+            else:
+                runs.append([index, index])
+        resume_excerpt = GAP_MARKER.join(resume_text[pieces[first]['start']:pieces[last]['end']] for first, last in runs)
+
+        sections = []
+        for index in chosen:
+            sections.extend(section for section in pieces[index]['sections'] if section not in sections)
+        return {
+            'resume_excerpt': resume_excerpt,
+            'job_excerpt': job_excerpt,
+            'resume_tokens': self.count_tokens(resume_excerpt),
+            'job_tokens': job_tokens,
+            'resume_pieces': f"{len(chosen)}/{len(pieces)}",
+            'sections': sections
+        }
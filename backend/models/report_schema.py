@@ -0,0 +1,138 @@
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import re
+
+# Fields of the ATS optimization report the LLM is asked for: 'score' is a number
+# from 0 to 100, 'list' a list of strings, a dict a nested object
+REPORT_SCHEMA = {
+    'ats_score': 'score',
+    'missing_keywords': 'list',
+    'keyword_optimization': {
+        'add_keywords': 'list',
+        'improve_sections': 'list'
+    },
+    'format_improvements': 'list',
+    'content_suggestions': 'list',
+    'skills_gap': 'list',
+    'strengths': 'list',
+    'action_items': 'list'
+}
+
+_FENCE_PATTERN = re.compile(r'^```(?:json)?\s*|\s*```$', re.IGNORECASE)
+_TRAILING_COMMA_PATTERN = re.compile(r',\s*([}\]])')
+_NUMBER_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')
+
+
+def schema_example(schema: Dict = REPORT_SCHEMA) -> Dict:
+    """The schema as an example object for the prompt"""
+    placeholders = {'score': '<0-100>', 'list': ['<string>']}
+    return {key: schema_example(kind) if isinstance(kind, dict) else placeholders[kind]
+            for key, kind in schema.items()}
+
+
+def _close_truncated(text: str) -> str:
+    """Close the strings, arrays and objects left open by an answer cut off at max_tokens"""
+    stack = []
+    in_string = escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in '{[':
+            stack.append('}' if char == '{' else ']')
+        elif char in '}]' and stack:
+            stack.pop()
+
+    if in_string:
+        text += '"'
+    text = text.rstrip().rstrip(',')
+    if text.endswith(':'):
+        text += ' null'
+    return text + ''.join(reversed(stack))
+
+
+def repair_json(text: str) -> Tuple[Optional[Any], bool]:
+    """Parse an LLM answer as JSON, fixing the usual defects if needed: (value or None, repaired)"""
+    try:
+        return json.loads(text), False
+    except (json.JSONDecodeError, TypeError):
+        pass
+    if not isinstance(text, str):
+        return None, False
+
+    # Code fences, prose around the object, trailing commas, a cut-off ending
+    candidate = _FENCE_PATTERN.sub('', text.strip())
+    start = candidate.find('{')
+    if start < 0:
+        return None, False
+    end = candidate.rfind('}')
+    for attempt in (candidate[start:end + 1] if end > start else None, candidate[start:]):
+        if attempt is None:
+            continue
+        for fixed in (_TRAILING_COMMA_PATTERN.sub(r'\1', attempt),
+                      _TRAILING_COMMA_PATTERN.sub(r'\1', _close_truncated(attempt))):
+            try:
+                return json.loads(fixed), True
+            except json.JSONDecodeError:
+                continue
+    return None, False
+
+
+def _coerce(value: Any, kind: str):
+    """value as the schema kind, or None when it cannot be"""
+    if kind == 'score':
+        if isinstance(value, str):
+            match = _NUMBER_PATTERN.search(value)  # "85", "85/100", "Score: 85"
+            value = float(match.group()) if match else None
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        return max(0, min(100, value))
+
+    if isinstance(value, str):
+        value = [item.strip() for item in re.split(r'[,\n]', value) if item.strip()]
+    if not isinstance(value, list):
+        return None
+    return [item if isinstance(item, str) else json.dumps(item) for item in value if item not in (None, '')]
+
+
+def validate_report(data: Any, schema: Dict = REPORT_SCHEMA) -> Tuple[Optional[Dict], List[str]]:
+    """Fit a decoded answer to the schema: (report, problems).
+
+    Values of the wrong type are converted where possible (a score given as
+    "85/100", a list given as a comma-separated string) and missing ones are
+    filled with empty defaults; every such fix is listed in problems. Extra keys
+    are kept. The report is None when data is not an object at all.
+    """
+    if not isinstance(data, dict):
+        return None, ['answer is not a JSON object']
+
+    report, problems = dict(data), []
+    for key, kind in schema.items():
+        if isinstance(kind, dict):
+            value = data.get(key)
+            if not isinstance(value, dict):
+                problems.append(f"{key}: missing" if key not in data else
+                                f"{key}: expected object, got {type(value).__name__}")
+                value = {}
+            report[key], nested_problems = validate_report(value, kind)
+            problems.extend(f"{key}.{problem}" for problem in nested_problems)
+            continue
+
+        if key not in data:
+            problems.append(f"{key}: missing")
+            report[key] = 0 if kind == 'score' else []
+            continue
+        value = _coerce(data[key], kind)
+        if value is None:
+            problems.append(f"{key}: expected {kind}, got {type(data[key]).__name__}")
+            value = 0 if kind == 'score' else []
+        elif value != data[key]:
+            problems.append(f"{key}: converted to {kind}")
+        report[key] = value
+    return report, problems
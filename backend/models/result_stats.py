@@ -0,0 +1,326 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from fractions import Fraction
+from typing import Dict, Iterable, List, Optional, Tuple
+import heapq
+import threading
+
+
+class _Ranking:
+    """Keys ordered by a sort key, so the top few are found without scanning them all.
+
+    The keys sit in a heap of (sort key, key) entries. Changing a key's sort key
+    pushes a new entry and leaves the old one to be skipped (and dropped) when it
+    reaches the top; the heap is rebuilt once stale entries outnumber live keys.
+    """
+
+    def __init__(self):
+        self._sort_keys = {}  # key -> current sort key
+        self._heap = []
+
+    def update(self, key, sort_key):
+        """Set a key's sort key (None removes the key)"""
+        if sort_key is None:
+            if self._sort_keys.pop(key, None) is None:
+                return
+        elif self._sort_keys.get(key) == sort_key:
+            return
+        else:
+            self._sort_keys[key] = sort_key
+            heapq.heappush(self._heap, (sort_key, key))
+        if len(self._heap) > 2 * len(self._sort_keys) + 64:
+            self._heap = [(sort_key, key) for key, sort_key in self._sort_keys.items()]
+            heapq.heapify(self._heap)
+
+    def smallest(self, n: int) -> List:
+        """The n keys with the smallest sort keys, smallest first"""
+        found = []
+        while self._heap and len(found) < n:
+            entry = heapq.heappop(self._heap)
+            sort_key, key = entry
+            # Stale entries are dropped; a key set back to an earlier sort key can appear twice
+            if self._sort_keys.get(key) == sort_key and (not found or found[-1] != entry):
+                found.append(entry)
+        for entry in found:
+            heapq.heappush(self._heap, entry)
+        return [key for _, key in found]
+
+
+class ResultStatistics(ABC):
+    """Running aggregates over a result store, updated on every save.
+
+    The aggregates are a flat set of named counters, each addressed by (name, key):
+    subclasses fold one record in or out with _add()/_set() in _apply(), and
+    _build() turns the counters into the get_statistics() payload. Score sums are
+    kept as exact fractions so that removing a record leaves no floating-point
+    residue and the result does not depend on the order records were added.
+    Counters that drop to zero disappear. Rankings (the top issues or candidates)
+    are kept up to date as counters change, see RANKED_COUNTERS, so _build() reads
+    the top few without scanning every key.
+
+    With track_changes set, every counter a change touches is remembered until
+    take_changes(), so a store can write just those next to the records it saved
+    (see SQLiteResultStore) and load() them on startup instead of replaying the
+    history, and update() them with what other processes saved. The payload is
+    cached until the next change (recent_activity is always recomputed, it depends
+    on the clock).
+    """
+
+    ACTIVITY_WINDOW = timedelta(days=7)
+    # Counter name -> the ranking its keys are ordered in (by _sort_key())
+    RANKED_COUNTERS = {}
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._counters = {}  # name -> {key -> int, Fraction or str}
+        self._rankings = {}  # ranking name -> _Ranking
+        self._changes = set()  # (name, key) touched since take_changes()
+        self.track_changes = False
+        self._snapshot = None
+        self._reset_rankings()
+
+    def rebuild(self, records: Iterable[Dict]):
+        """Start over from the full history"""
+        with self._lock:
+            self.clear()
+            for record in records:
+                self._apply(record, 1)
+
+    def load(self, counters: Iterable[Tuple[str, str, object]]):
+        """Replace the aggregates with stored (name, key, value) counters"""
+        with self._lock:
+            self._counters = {}
+            self._reset_rankings()
+            for name, key, value in counters:
+                self._counters.setdefault(name, {})[key] = value
+                self._rank(name, key)
+            self._changes = set()
+            self._snapshot = None
+
+    def update(self, counters: Iterable[Tuple[str, str, object]]):
+        """Apply (name, key, value) counters changed elsewhere (value None: removed)"""
+        with self._lock:
+            for name, key, value in counters:
+                values = self._counters.setdefault(name, {})
+                if value is None:
+                    values.pop(key, None)
+                else:
+                    values[key] = value
+                self._rank(name, key)
+            self._snapshot = None
+
+    def add(self, record: Dict):
+        with self._lock:
+            self._apply(record, 1)
+
+    def remove(self, record: Dict):
+        with self._lock:
+            self._apply(record, -1)
+
+    def clear(self):
+        with self._lock:
+            if self.track_changes:
+                self._changes.update((name, key) for name, values in self._counters.items() for key in values)
+            self._counters = {}
+            self._reset_rankings()
+            self._snapshot = None
+
+    def take_changes(self) -> Dict[Tuple[str, str], Optional[object]]:
+        """Current value of every counter changed since the last call (None: removed)"""
+        with self._lock:
+            changes = {(name, key): self._counters.get(name, {}).get(key) for name, key in self._changes}
+            self._changes = set()
+            return changes
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = self._build() if self._value('total') else self._empty()
+            statistics = dict(self._snapshot)
+            statistics["recent_activity"] = self._recent_activity()
+            return statistics
+
+    def _value(self, name: str, key: str = ''):
+        return self._counters.get(name, {}).get(key, 0)
+
+    def _values(self, name: str) -> Dict:
+        return self._counters.get(name, {})
+
+    def _add(self, name: str, key: str, amount):
+        """counter += amount, deleting counters that drop to zero"""
+        values = self._counters.setdefault(name, {})
+        value = values.get(key, 0) + amount
+        if value:
+            values[key] = value
+        else:
+            values.pop(key, None)
+        if self.track_changes:
+            self._changes.add((name, key))
+        self._rank(name, key)
+
+    def _set(self, name: str, key: str, value):
+        """Set a label (None removes it)"""
+        values = self._counters.setdefault(name, {})
+        if value is None:
+            values.pop(key, None)
+        else:
+            values[key] = value
+        if self.track_changes:
+            self._changes.add((name, key))
+        self._rank(name, key)
+
+    def _reset_rankings(self):
+        self._rankings = {ranking: _Ranking() for ranking in set(self.RANKED_COUNTERS.values())}
+
+    def _rank(self, name: str, key: str):
+        """Reorder key in the ranking counter name feeds, if any"""
+        ranking = self.RANKED_COUNTERS.get(name)
+        if ranking is not None:
+            self._rankings[ranking].update(key, self._sort_key(ranking, key))
+
+    def _sort_key(self, ranking: str, key: str):
+        """Where key goes in a ranking, smallest first (None: not ranked)"""
+        return None
+
+    @staticmethod
+    def _minute(timestamp: str) -> int:
+        return int(datetime.fromisoformat(timestamp).timestamp() // 60)
+
+    def _activity_cutoff(self) -> int:
+        return int((datetime.now() - self.ACTIVITY_WINDOW).timestamp() // 60)
+
+    def _recent_activity(self) -> int:
+        """Records in the last ACTIVITY_WINDOW, counted in one-minute buckets"""
+        cutoff = self._activity_cutoff()
+        return sum(count for minute, count in self._values('activity').items() if int(minute) >= cutoff)
+
+    def _apply(self, record: Dict, sign: int):
+        self._add('total', '', sign)
+
+        # Activity is bucketed by minute; buckets that aged out of the window are dropped
+        cutoff = self._activity_cutoff()
+        for minute in [minute for minute in self._values('activity') if int(minute) < cutoff]:
+            self._set('activity', minute, None)
+        minute = self._minute(record.get("timestamp", "1970-01-01"))
+        if minute >= cutoff and (sign > 0 or self._value('activity', str(minute))):
+            self._add('activity', str(minute), sign)
+
+        self._snapshot = None
+
+    @abstractmethod
+    def _empty(self) -> Dict:
+        """Payload when there are no records"""
+
+    @abstractmethod
+    def _build(self) -> Dict:
+        """Payload computed from the counters"""
+
+
+class ATSStatistics(ResultStatistics):
+    """Aggregates behind ATSResultsStorage.get_statistics()"""
+
+    RANKED_COUNTERS = {'issues': 'issues'}
+
+    def _apply(self, record: Dict, sign: int):
+        super()._apply(record, sign)
+        opt_results = record.get("optimization_results", {})
+        if "ats_score" in opt_results:
+            self._add('ats_score_sum', '', sign * Fraction(opt_results["ats_score"]))
+            self._add('ats_score_count', '', sign)
+
+        # Collect common issues
+        for issue in opt_results.get("missing_keywords", [])[:5]:  # Top 5 issues
+            self._add('issues', issue, sign)
+
+        email = record.get("resume_info", {}).get("email")
+        if email:
+            self._add('users', email, sign)
+
+    def _sort_key(self, ranking: str, key: str):
+        # Most frequent first, ties broken by name so the order does not depend on insertion history
+        count = self._value('issues', key)
+        return (-count, key) if count else None
+
+    def _empty(self) -> Dict:
+        return {
+            "total_optimizations": 0,
+            "average_ats_score": 0,
+            "common_issues": [],
+            "recent_activity": 0
+        }
+
+    def _build(self) -> Dict:
+        ats_score_count = self._value('ats_score_count')
+        average_ats_score = float(Fraction(self._value('ats_score_sum')) / ats_score_count) if ats_score_count else 0
+        issues = self._values('issues')
+        common_issues = [(issue, issues[issue]) for issue in self._rankings['issues'].smallest(10)]
+        return {
+            "total_optimizations": self._value('total'),
+            "average_ats_score": round(average_ats_score, 1),
+            "common_issues": [{"issue": issue, "count": count} for issue, count in common_issues],
+            "recent_activity": 0,
+            "success_rate": 100,  # All completed optimizations are successful
+            "total_users": len(self._values('users'))
+        }
+
+
+class ScreeningStatistics(ResultStatistics):
+    """Aggregates behind ScreeningResultsStorage.get_statistics()"""
+
+    RANKED_COUNTERS = {'candidate_scores': 'candidates', 'candidate_matches': 'candidates'}
+
+    def _apply(self, record: Dict, sign: int):
+        super()._apply(record, sign)
+        self._add('total_candidates', '', sign * record.get("total_candidates", 0))
+        self._add('total_matches', '', sign * record.get("actual_matches", 0))
+
+        # Aggregate candidate performance
+        for match in record.get("matches", []):
+            email = match.get("candidate_email", "")
+            if sign > 0 and not self._value('candidate_matches', email):
+                self._set('candidate_names', email, match.get("candidate_name", "Unknown"))
+            self._add('candidate_scores', email, sign * Fraction(match.get("score", 0)))
+            self._add('candidate_matches', email, sign)
+            if not self._value('candidate_matches', email):
+                self._set('candidate_names', email, None)
+                self._set('candidate_scores', email, None)
+
+    def _average_score(self, email: str) -> float:
+        return round(float(Fraction(self._value('candidate_scores', email)) / self._value('candidate_matches', email)), 2)
+
+    def _sort_key(self, ranking: str, key: str):
+        # Best average first, ties broken by email
+        return (-self._average_score(key), key) if self._value('candidate_matches', key) else None
+
+    def _empty(self) -> Dict:
+        return {
+            "total_screenings": 0,
+            "total_candidates_screened": 0,
+            "average_matches_per_screening": 0,
+            "top_candidates": [],
+            "recent_activity": 0
+        }
+
+    def _build(self) -> Dict:
+        names = self._values('candidate_names')
+        top_candidates = [
+            {
+                "name": names.get(email, "Unknown"),
+                "email": email,
+                "average_score": self._average_score(email),
+                "times_matched": self._value('candidate_matches', email)
+            }
+            for email in self._rankings['candidates'].smallest(10)
+        ]
+
+        total = self._value('total')
+        total_candidates = self._value('total_candidates')
+        return {
+            "total_screenings": total,
+            "total_candidates_screened": total_candidates,
+            "average_matches_per_screening": round(self._value('total_matches') / total, 1),
+            "average_candidates_per_screening": round(total_candidates / total, 1),
+            "top_candidates": top_candidates,
+            "recent_activity": 0,
+            "success_rate": 100  # All completed screenings are successful
+        }
@@ -0,0 +1,623 @@
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from fractions import Fraction
+
+
+def sqlite_path_from_url(database_url: str) -> str:
+    """Turn a sqlite:///path URL (Config.DATABASE_URL) into a filesystem path"""
+    prefix = "sqlite:///"
+    if not database_url.startswith(prefix) or len(database_url) == len(prefix):
+        raise ValueError(f"Only sqlite:///<file> database URLs are supported, got {database_url!r}")
+    return database_url[len(prefix):]
+
+
+def _rebuild_statistics(store):
+    """Replay a capped store's records into its statistics (at most max_records of them)"""
+    if store.statistics is None:
+        return
+    try:
+        store.statistics.rebuild(store.iter_records())
+    except Exception as e:
+        print(f"❌ Error building result statistics: {e}")
+
+
+class JSONResultStore:
+    """Result records kept as one JSON array, rewritten on every save.
+
+    Only suitable for small histories: the oldest records beyond max_records are dropped.
+    statistics (a ResultStatistics) is kept in memory and replayed from those
+    records on open.
+    """
+
+    def __init__(self, results_file: Path, email_fn: Callable[[Dict], List[str]], max_records: int,
+                 statistics=None):
+        self.results_file = Path(results_file)
+        self.email_fn = email_fn
+        self.max_records = max_records
+        self.statistics = statistics
+        self._lock = threading.Lock()  # saves are read-modify-write and may run concurrently
+        if not self.results_file.exists():
+            with open(self.results_file, 'w') as f:
+                json.dump([], f)
+        _rebuild_statistics(self)
+
+    def _load(self) -> List[Dict]:
+        """Read the whole results array"""
+        if self.results_file.exists():
+            with open(self.results_file, 'r') as f:
+                return json.load(f)
+        return []
+
+    def add(self, record: Dict) -> List[Dict]:
+        """Append one record, dropping (and returning) the oldest beyond max_records"""
+        with self._lock:
+            results = self._load()
+            results.append(record)
+            dropped = results[:-self.max_records]
+            results = results[-self.max_records:]
+            with open(self.results_file, 'w') as f:
+                json.dump(results, f, indent=2)
+            if self.statistics is not None:
+                self.statistics.add(record)
+                for old in dropped:
+                    self.statistics.remove(old)
+            return dropped
+
+    def add_many(self, records: List[Dict]) -> List[Dict]:
+        dropped = []
+        for record in records:
+            dropped.extend(self.add(record))
+        return dropped
+
+    def get(self, result_id: str) -> Optional[Dict]:
+        """Record with this id, or None"""
+        for record in self._load():
+            if record.get("id") == result_id:
+                return record
+        return None
+
+    def _newest(self, records, limit: int) -> List[Dict]:
+        """Newest records first, at most limit"""
+        return sorted(records, key=lambda x: x.get("timestamp", ""), reverse=True)[:limit]
+
+    def recent(self, limit: int) -> List[Dict]:
+        """Most recent records"""
+        return self._newest(self._load(), limit)
+
+    def by_email(self, email: str, limit: int) -> List[Dict]:
+        """Most recent records involving this email (case-insensitive)"""
+        email = email.lower()
+        return self._newest(
+            [r for r in self._load() if email in (e.lower() for e in self.email_fn(r))], limit
+        )
+
+    def by_job_hash(self, job_hash, limit: int) -> List[Dict]:
+        """Most recent records for this job description hash"""
+        return self._newest([r for r in self._load() if r.get("job_description_hash") == job_hash], limit)
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Every record, oldest first"""
+        return iter(self._load())
+
+    def count(self) -> int:
+        """Number of stored records"""
+        return len(self._load())
+
+    def refresh_statistics(self):
+        """Nothing to reload: statistics only change through this object"""
+
+    def clear(self):
+        """Remove every record"""
+        with self._lock:
+            with open(self.results_file, 'w') as f:
+                json.dump([], f)
+            if self.statistics is not None:
+                self.statistics.clear()
+
+
+class SQLiteResultStore:
+    """Result records in a SQLite table, indexed by id, timestamp, email and job hash.
+
+    Each record is stored as JSON next to the columns it is looked up by; emails go
+    to a side table so a screening (one row, many candidates) is findable by any of
+    them. The database runs in WAL mode so readers do not block the writer, and every
+    query is a fixed parameterized statement, which sqlite3 prepares once per
+    connection and reuses. There is no retention cap.
+
+    statistics (a ResultStatistics) is persisted in a {table}_aggregates table:
+    each save writes the counters it changed, stamped with a new version, in the
+    same transaction as the records (a removed counter leaves a row without a
+    value). Opening the store loads the counters instead of replaying the history,
+    and a worker that falls behind applies just the rows newer than the version it
+    holds. Once in PRUNE_INTERVAL versions the removed-counter rows older than that
+    are deleted; a worker further behind than the '_reset' row then reloads them all.
+    """
+
+    VERSION_KEY = ('_version', '')
+    RESET_KEY = ('_reset', '')
+    PRUNE_INTERVAL = 1000
+
+    def __init__(self, database_path: str, table: str, email_fn: Callable[[Dict], List[str]],
+                 statistics=None):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table!r}")
+        self.database_path = database_path
+        self.table = table
+        self.email_fn = email_fn
+        self.statistics = statistics
+        if statistics is not None:
+            statistics.track_changes = True
+        self._statistics_version = None  # version of the aggregates held in memory
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+        Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+
+        t = table
+        self._sql = {
+            'insert': f"INSERT OR REPLACE INTO {t} (id, timestamp, job_hash, record) VALUES (?, ?, ?, ?)",
+            'insert_email': f"INSERT INTO {t}_emails (result_id, email, timestamp) VALUES (?, ?, ?)",
+            'delete_emails': f"DELETE FROM {t}_emails WHERE result_id = ?",
+            'get': f"SELECT record FROM {t} WHERE id = ?",
+            'recent': f"SELECT record FROM {t} ORDER BY timestamp DESC LIMIT ?",
+            'by_email': (f"SELECT r.record FROM {t}_emails e JOIN {t} r ON r.id = e.result_id "
+                         f"WHERE e.email = ? ORDER BY e.timestamp DESC LIMIT ?"),
+            'by_job_hash': f"SELECT record FROM {t} WHERE job_hash = ? ORDER BY timestamp DESC LIMIT ?",
+            'all': f"SELECT record FROM {t} ORDER BY timestamp",
+            'count': f"SELECT COUNT(*) FROM {t}",
+            'aggregates': (f"SELECT name, key, value FROM {t}_aggregates "
+                           f"WHERE name NOT IN ('_version', '_reset') AND value IS NOT NULL"),
+            'aggregates_since': (f"SELECT name, key, value FROM {t}_aggregates "
+                                 f"WHERE version > ? AND name NOT IN ('_version', '_reset')"),
+            'aggregates_version': f"SELECT value FROM {t}_aggregates WHERE name = '_version' AND key = ''",
+            'aggregates_reset': f"SELECT value FROM {t}_aggregates WHERE name = '_reset' AND key = ''",
+            'put_aggregate': f"INSERT OR REPLACE INTO {t}_aggregates (name, key, value, version) VALUES (?, ?, ?, ?)",
+            'prune_aggregates': f"DELETE FROM {t}_aggregates WHERE value IS NULL AND version <= ?",
+        }
+        self._create_schema()
+        if self.statistics is not None:
+            try:
+                self.refresh_statistics()
+            except Exception as e:
+                print(f"❌ Error loading result statistics: {e}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; requests run on the blocking executor's threads"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.database_path, timeout=30, cached_statements=64)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _create_schema(self):
+        t = self.table
+        with self._connection() as connection:
+            columns = [row[1] for row in connection.execute(f"PRAGMA table_info({t}_aggregates)")]
+            if columns and 'version' not in columns:
+                # Written before counters were versioned; rebuilt from the records
+                connection.execute(f"DROP TABLE {t}_aggregates")
+            connection.executescript(f"""
+                CREATE TABLE IF NOT EXISTS {t} (
+                    id TEXT PRIMARY KEY,
+                    timestamp TEXT NOT NULL,
+                    job_hash,
+                    record TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_{t}_timestamp ON {t} (timestamp);
+                CREATE INDEX IF NOT EXISTS idx_{t}_job_hash ON {t} (job_hash, timestamp);
+                CREATE TABLE IF NOT EXISTS {t}_emails (
+                    result_id TEXT NOT NULL,
+                    email TEXT NOT NULL,
+                    timestamp TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_{t}_emails_email ON {t}_emails (email, timestamp);
+                CREATE INDEX IF NOT EXISTS idx_{t}_emails_result ON {t}_emails (result_id);
+                CREATE TABLE IF NOT EXISTS {t}_aggregates (
+                    name TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT,
+                    version INTEGER NOT NULL,
+                    PRIMARY KEY (name, key)
+                );
+                CREATE INDEX IF NOT EXISTS idx_{t}_aggregates_version ON {t}_aggregates (version);
+            """)
+
+    @staticmethod
+    def _encode(value) -> str:
+        return json.dumps([value.numerator, value.denominator] if isinstance(value, Fraction) else value)
+
+    @staticmethod
+    def _decode(value: str):
+        value = json.loads(value)
+        return Fraction(*value) if isinstance(value, list) else value
+
+    def _stored_version(self, connection: sqlite3.Connection, sql: str) -> Optional[int]:
+        row = connection.execute(self._sql[sql]).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def _sync_statistics(self, connection: sqlite3.Connection):
+        """Catch up with the aggregates other workers stored since we last read or wrote them.
+
+        Tables written before aggregates were stored are replayed once and saved.
+        """
+        version = self._stored_version(connection, 'aggregates_version')
+        if version is None:
+            self.statistics.rebuild(self.iter_records())
+            self._write_statistics(connection, version=0, reset=True)
+            return
+        held = self._statistics_version
+        if held == version:
+            return
+        if held is None or held > version or held < (self._stored_version(connection, 'aggregates_reset') or 0):
+            self.statistics.load(
+                (name, key, self._decode(value)) for name, key, value in connection.execute(self._sql['aggregates'])
+            )
+        else:
+            self.statistics.update(
+                (name, key, None if value is None else self._decode(value))
+                for name, key, value in connection.execute(self._sql['aggregates_since'], (held,))
+            )
+        self._statistics_version = version
+
+    def _write_statistics(self, connection: sqlite3.Connection, version: int, reset: bool = False):
+        """Store the counters changed since the last write, under a new version.
+
+        reset: the counters were replaced wholesale, so workers holding an older
+        version must reload them all.
+        """
+        changes = self.statistics.take_changes()
+        put = self._sql['put_aggregate']
+        connection.executemany(put, [
+            (name, key, None if value is None else self._encode(value), version)
+            for (name, key), value in changes.items()
+        ])
+        connection.execute(put, (*self.VERSION_KEY, self._encode(version), version))
+        if reset:
+            connection.execute(put, (*self.RESET_KEY, self._encode(version), version))
+        elif version % self.PRUNE_INTERVAL == 0:
+            cutoff = version - self.PRUNE_INTERVAL
+            connection.execute(self._sql['prune_aggregates'], (cutoff,))
+            reset_version = max(cutoff, self._stored_version(connection, 'aggregates_reset') or 0)
+            connection.execute(put, (*self.RESET_KEY, self._encode(reset_version), version))
+        self._statistics_version = version
+
+    def refresh_statistics(self):
+        """Bring the in-memory statistics up to date with what other workers saved"""
+        if self.statistics is None:
+            return
+        with self._write_lock, self._connection() as connection:
+            row = connection.execute(self._sql['aggregates_version']).fetchone()
+            if row is not None and self._decode(row[0]) == self._statistics_version:
+                return
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._sync_statistics(connection)
+            except Exception:
+                self._statistics_version = None
+                raise
+
+    def add(self, record: Dict) -> List[Dict]:
+        return self.add_many([record])
+
+    def add_many(self, records: List[Dict]) -> List[Dict]:
+        """Insert records (and their statistics) in one transaction; nothing is ever dropped, so returns []"""
+        rows = []
+        email_rows = []
+        for record in records:
+            timestamp = record.get("timestamp", "")
+            rows.append((record["id"], timestamp, record.get("job_description_hash"), json.dumps(record)))
+            emails = {email.lower() for email in self.email_fn(record) if email}
+            email_rows.extend((record["id"], email, timestamp) for email in emails)
+
+        with self._write_lock, self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if self.statistics is not None:
+                    self._sync_statistics(connection)
+                    version = self._statistics_version
+                    # A saved id replaces its old record, which leaves the aggregates
+                    for row in rows:
+                        for replaced in self._records(self._sql['get'], (row[0],)):
+                            self.statistics.remove(replaced)
+                connection.executemany(self._sql['delete_emails'], [(row[0],) for row in rows])
+                connection.executemany(self._sql['insert'], rows)
+                connection.executemany(self._sql['insert_email'], email_rows)
+                if self.statistics is not None:
+                    for record in records:
+                        self.statistics.add(record)
+                    self._write_statistics(connection, version + 1)
+            except Exception:
+                # The transaction rolls back; reload the aggregates on next use
+                self._statistics_version = None
+                raise
+        return []
+
+    def _records(self, sql: str, params=()) -> List[Dict]:
+        return [json.loads(row[0]) for row in self._connection().execute(sql, params)]
+
+    def get(self, result_id: str) -> Optional[Dict]:
+        records = self._records(self._sql['get'], (result_id,))
+        return records[0] if records else None
+
+    def recent(self, limit: int) -> List[Dict]:
+        return self._records(self._sql['recent'], (limit,))
+
+    def by_email(self, email: str, limit: int) -> List[Dict]:
+        return self._records(self._sql['by_email'], (email.lower(), limit))
+
+    def by_job_hash(self, job_hash, limit: int) -> List[Dict]:
+        return self._records(self._sql['by_job_hash'], (job_hash, limit))
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Stream every record, oldest first, without loading the table into memory"""
+        for row in self._connection().execute(self._sql['all']):
+            yield json.loads(row[0])
+
+    def count(self) -> int:
+        return self._connection().execute(self._sql['count']).fetchone()[0]
+
+    def clear(self):
+        with self._write_lock, self._connection() as connection:
+            connection.execute(f"DELETE FROM {self.table}_emails")
+            connection.execute(f"DELETE FROM {self.table}")
+            if self.statistics is not None:
+                version = self._stored_version(connection, 'aggregates_version') or 0
+                connection.execute(f"DELETE FROM {self.table}_aggregates")
+                self.statistics.load([])
+                self._write_statistics(connection, version + 1, reset=True)
+
+
+
+class JournalResultStore:
+    """Result records appended to a JSON-lines journal.
+
+    A save is one write + fsync of one line. An in-memory index maps each live id
+    to the (offset, length) of its line, plus per-email and per-job-hash id lists,
+    so lookups read only the lines they return. Records beyond max_records (oldest
+    first) and superseded copies of an id become dead lines; once they outnumber
+    the live ones the journal is compacted by rewriting the live lines to a new
+    file and atomically replacing the old one. A torn last line left by a crash
+    is truncated away on open. The journal assumes one writing process (and one
+    store object per file within it); statistics (a ResultStatistics) is kept in
+    memory and replayed from the live records on open.
+    """
+
+    COMPACT_MIN_DEAD = 1000
+
+    def __init__(self, journal_file: Path, email_fn: Callable[[Dict], List[str]],
+                 max_records: Optional[int] = None, statistics=None):
+        self.journal_file = Path(journal_file)
+        self.email_fn = email_fn
+        self.max_records = max_records
+        self.statistics = statistics
+        self._lock = threading.RLock()
+        self._offsets = OrderedDict()  # id -> (offset, length), oldest first
+        self._by_email = {}
+        self._by_job_hash = {}
+        self._dead = 0
+        self._size = 0  # bytes of complete lines; the next append goes here
+        self.compactions = 0
+
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        self.journal_file.touch(exist_ok=True)
+        self._recover()
+        self._writer = open(self.journal_file, 'ab')
+        self._reader = open(self.journal_file, 'rb')
+        _rebuild_statistics(self)
+
+    def _recover(self):
+        """Rebuild the index from the journal, truncating a torn or unreadable last line"""
+        good_end = 0
+        with open(self.journal_file, 'rb') as f:
+            offset = 0
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # torn write of the last line
+                try:
+                    self._index(json.loads(line), offset, len(line))
+                except (ValueError, KeyError):
+                    print(f"❌ Skipping unreadable journal line at byte {offset} of {self.journal_file}")
+                    self._dead += 1
+                offset += len(line)
+                good_end = offset
+
+        if good_end < os.path.getsize(self.journal_file):
+            print(f"⚠️ Truncating incomplete tail of {self.journal_file} at byte {good_end}")
+            with open(self.journal_file, 'r+b') as f:
+                f.truncate(good_end)
+                os.fsync(f.fileno())
+        self._size = good_end
+
+    def _index(self, record: Dict, offset: int, length: int) -> List[tuple]:
+        """Point the index at a freshly written (or recovered) line.
+
+        Returns the (offset, length) of lines that stopped being live as a result.
+        """
+        dropped = []
+        result_id = record["id"]
+        if result_id in self._offsets:
+            dropped.append(self._forget(result_id))
+        self._offsets[result_id] = (offset, length)
+        for email in {email.lower() for email in self.email_fn(record) if email}:
+            self._by_email.setdefault(email, []).append(result_id)
+        self._by_job_hash.setdefault(record.get("job_description_hash"), []).append(result_id)
+
+        while self.max_records and len(self._offsets) > self.max_records:
+            dropped.append(self._forget(next(iter(self._offsets))))
+        return dropped
+
+    def _forget(self, result_id: str) -> tuple:
+        """Drop an id from the index; its line stays in the file until compaction"""
+        self._dead += 1
+        return self._offsets.pop(result_id)
+
+    def _live_ids(self, ids: List[str], limit: int) -> List[str]:
+        """Newest ids that are still live, pruning dead ones from the list"""
+        ids[:] = [result_id for result_id in ids if result_id in self._offsets]
+        return list(dict.fromkeys(reversed(ids)))[:limit]
+
+    def _read(self, result_id: str) -> Dict:
+        return self._read_at(*self._offsets[result_id])
+
+    def _read_at(self, offset: int, length: int) -> Dict:
+        self._reader.seek(offset)
+        return json.loads(self._reader.read(length))
+
+    def add(self, record: Dict) -> List[Dict]:
+        """Append one record; returns the records dropped to stay within max_records"""
+        return self.add_many([record])
+
+    def add_many(self, records: List[Dict]) -> List[Dict]:
+        """Append records with a single write + fsync; returns the records that were dropped"""
+        lines = [json.dumps(record).encode('utf-8') + b'\n' for record in records]
+        with self._lock:
+            self._writer.write(b''.join(lines))
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+            dropped = []
+            for record, line in zip(records, lines):
+                dropped.extend(self._index(record, self._size, len(line)))
+                self._size += len(line)
+            dropped_records = [self._read_at(offset, length) for offset, length in dropped]
+            if self.statistics is not None:
+                for record in records:
+                    self.statistics.add(record)
+                for record in dropped_records:
+                    self.statistics.remove(record)
+
+            if self._dead >= max(self.COMPACT_MIN_DEAD, len(self._offsets)):
+                self.compact()
+            return dropped_records
+
+    def compact(self):
+        """Rewrite the journal with only live records"""
+        with self._lock:
+            temp_file = self.journal_file.with_suffix('.compacting')
+            records = [self._read(result_id) for result_id in self._offsets]
+            lines = [json.dumps(record).encode('utf-8') + b'\n' for record in records]
+            with open(temp_file, 'wb') as f:
+                f.write(b''.join(lines))
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._writer.close()
+            self._reader.close()
+            os.replace(temp_file, self.journal_file)
+
+            self._offsets = OrderedDict()
+            self._by_email = {}
+            self._by_job_hash = {}
+            self._dead = 0
+            self._size = 0
+            for record, line in zip(records, lines):
+                self._index(record, self._size, len(line))
+                self._size += len(line)
+
+            self._writer = open(self.journal_file, 'ab')
+            self._reader = open(self.journal_file, 'rb')
+            self.compactions += 1
+
+    def get(self, result_id: str) -> Optional[Dict]:
+        with self._lock:
+            return self._read(result_id) if result_id in self._offsets else None
+
+    def recent(self, limit: int) -> List[Dict]:
+        with self._lock:
+            ids = list(self._offsets)[::-1][:limit]
+            return [self._read(result_id) for result_id in ids]
+
+    def by_email(self, email: str, limit: int) -> List[Dict]:
+        with self._lock:
+            ids = self._live_ids(self._by_email.get(email.lower(), []), limit)
+            return [self._read(result_id) for result_id in ids]
+
+    def by_job_hash(self, job_hash, limit: int) -> List[Dict]:
+        with self._lock:
+            ids = self._live_ids(self._by_job_hash.get(job_hash, []), limit)
+            return [self._read(result_id) for result_id in ids]
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Every live record, oldest first"""
+        with self._lock:
+            ids = list(self._offsets)
+        for result_id in ids:
+            record = self.get(result_id)
+            if record is not None:
+                yield record
+
+    def count(self) -> int:
+        return len(self._offsets)
+
+    def refresh_statistics(self):
+        """Nothing to reload: statistics only change through this object"""
+
+    def clear(self):
+        with self._lock:
+            if self.statistics is not None:
+                self.statistics.clear()
+            self._writer.truncate(0)
+            os.fsync(self._writer.fileno())
+            self._reader.close()
+            self._reader = open(self.journal_file, 'rb')  # drop bytes buffered before the truncate
+            self._offsets = OrderedDict()
+            self._by_email = {}
+            self._by_job_hash = {}
+            self._dead = 0
+            self._size = 0
+
+    def stats(self) -> Dict:
+        """Journal size and how much of it compaction would reclaim"""
+        return {
+            'live_records': len(self._offsets),
+            'dead_records': self._dead,
+            'size_bytes': self._size,
+            'compactions': self.compactions
+        }
+
+
+def _import_json(store, results_file: Path) -> int:
+    """Copy records from a legacy JSON results file into an empty store; returns how many"""
+    results_file = Path(results_file)
+    if store.count() or not results_file.exists():
+        return 0
+    with open(results_file, 'r') as f:
+        records = json.load(f)
+    store.add_many(records)
+    return len(records)
+
+def create_result_store(backend: str, results_file: Path, table: str,
+                        email_fn: Callable[[Dict], List[str]], max_records: int,
+                        database_path: Optional[str] = None, statistics=None):
+    """Build the store for a results storage class.
+
+    backend is "json" (the original single-file array), "journal" (an append-only
+    JSON-lines file next to it), both capped at max_records, or "sqlite"
+    (database_path, uncapped). A new journal or SQLite table is seeded from an
+    existing JSON results file so switching backends keeps the history. The store
+    keeps statistics (a ResultStatistics) up to date with every save.
+    """
+    if backend == "json":
+        return JSONResultStore(results_file, email_fn, max_records, statistics)
+
+    if backend == "journal":
+        store = JournalResultStore(Path(results_file).with_suffix('.jsonl'), email_fn, max_records, statistics)
+    elif backend == "sqlite":
+        store = SQLiteResultStore(database_path or str(Path(results_file).with_suffix('.db')), table, email_fn,
+                                  statistics)
+    else:
+        raise ValueError(f"Unknown results storage backend: {backend!r} (expected 'json', 'journal' or 'sqlite')")
+
+    try:
+        imported = _import_json(store, results_file)
+        if imported:
+            print(f"✅ Imported {imported} results from {results_file} into the {backend} store")
+    except Exception as e:
+        print(f"❌ Error importing {results_file} into the {backend} store: {e}")
+    return store
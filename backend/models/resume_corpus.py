@@ -0,0 +1,381 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from .scoring_engine import normalize_rows
+
+# Parsed resume fields kept in their own columns; everything else goes in the JSON 'fields' column
+_COLUMNS = ('file_name', 'name', 'email', 'phone', 'experience_years', 'word_count', 'parsing_status')
+# Derived in memory, never stored as fields
+_TRANSIENT = ('resume_id', 'full_text', 'skills', 'chunk_embeddings', 'chunk_spans', 'embedding') + _COLUMNS
+
+
+class ResumeCorpus:
+    """Persistent pool of parsed resumes that grows across uploads and survives restarts.
+
+    Parsed fields and full text live in a SQLite table, one row per resume keyed by
+    resume_id (a BLAKE2 hash of the uploaded file). The chunk embeddings of all
+    resumes are rows of one float32 matrix in an append-only file that is
+    memory-mapped for reading; each resume points at its run of rows. Replacing or
+    removing a resume leaves its old rows unused until compaction rewrites the
+    matrix, which happens once unused rows outnumber used ones.
+
+    resumes() returns the resume dicts in upload order, with 'chunk_embeddings',
+    'chunk_spans' and 'embedding' set as JobMatcher expects, so nothing is parsed
+    or embedded again. Every write bumps a generation number stored next to the
+    data; other processes sharing the directory (uvicorn workers) see it change and
+    reload. Embeddings made with another model are dropped when the corpus is
+    opened, and those resumes come back without them.
+    """
+
+    COMPACT_MIN_DEAD_ROWS = 1024
+
+    def __init__(self, corpus_dir: str = "./data/resume_corpus", embedding_model: Optional[str] = None):
+        self.corpus_dir = Path(corpus_dir)
+        self.corpus_dir.mkdir(parents=True, exist_ok=True)
+        self.database_path = self.corpus_dir / "corpus.sqlite3"
+        self.vectors_file = self.corpus_dir / "chunks.f32"
+        self.embedding_model = embedding_model
+        self._local = threading.local()
+        self._lock = threading.RLock()
+
+        self._resumes = []  # snapshot in upload order
+        self._by_id = {}
+        self._generation = None  # generation the snapshot was loaded at; None: not loaded
+        self._count = 0
+
+        self._connection().executescript("""
+            CREATE TABLE IF NOT EXISTS resumes (
+                resume_id TEXT PRIMARY KEY,
+                added_at REAL NOT NULL,
+                file_name TEXT,
+                name TEXT,
+                email TEXT,
+                phone TEXT,
+                experience_years NUMERIC,
+                word_count INTEGER,
+                parsing_status TEXT NOT NULL,
+                skills TEXT NOT NULL,
+                fields TEXT NOT NULL,
+                full_text TEXT NOT NULL,
+                chunk_start INTEGER,
+                chunk_count INTEGER NOT NULL DEFAULT 0,
+                chunk_spans TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_resumes_added_at ON resumes (added_at);
+            CREATE TABLE IF NOT EXISTS corpus_meta (
+                key TEXT PRIMARY KEY,
+                value
+            );
+        """)
+        # Only a new corpus or a model change writes here; opening an existing one leaves other workers alone
+        stored = self._meta(self._connection())
+        if 'embedding_model' not in stored or stored['embedding_model'] != embedding_model:
+            with self._write_transaction() as connection:
+                meta = self._meta(connection)
+                if meta.get('embedding_model') != embedding_model and meta.get('next_row'):
+                    print(f"⚠️ Resume corpus embeddings were made with {meta.get('embedding_model')}, "
+                          f"dropping them for {embedding_model}")
+                    connection.execute("UPDATE resumes SET chunk_start = NULL, chunk_count = 0, chunk_spans = NULL")
+                    self._replace_vectors_file(np.empty((0, 0), dtype=np.float32))
+                    meta.update(next_row=0, dead_rows=0, dimension=None)
+                meta['embedding_model'] = embedding_model
+                meta['generation'] = meta.get('generation', 0) + 1
+                self._save_meta(connection, meta)
+        self._count = self._connection().execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    @staticmethod
+    def file_id(file_path: str) -> str:
+        """resume_id of an uploaded file: BLAKE2 hash of its bytes"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; requests run on the blocking executor's threads"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # Autocommit mode: writes run in explicit BEGIN IMMEDIATE transactions (see _write_transaction)
+            connection = sqlite3.connect(self.database_path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def _write_transaction(self):
+        """A write transaction that also serializes writers in other processes (vector rows are allocated in it)"""
+        with self._lock:
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _meta(connection: sqlite3.Connection) -> Dict:
+        return dict(connection.execute("SELECT key, value FROM corpus_meta").fetchall())
+
+    @staticmethod
+    def _save_meta(connection: sqlite3.Connection, meta: Dict):
+        connection.executemany("INSERT OR REPLACE INTO corpus_meta (key, value) VALUES (?, ?)", meta.items())
+
+    def _read_generation(self) -> int:
+        row = self._connection().execute("SELECT value FROM corpus_meta WHERE key = 'generation'").fetchone()
+        return row[0] if row else 0
+
+    def _map_vectors(self, dimension: Optional[int]) -> Optional[np.ndarray]:
+        """Read-only memory map of the chunk embedding matrix"""
+        if not dimension or not self.vectors_file.exists():
+            return None
+        rows = os.path.getsize(self.vectors_file) // (dimension * 4)
+        if rows == 0:
+            return None
+        return np.memmap(self.vectors_file, dtype=np.float32, mode='r', shape=(rows, dimension))
+
+    def _replace_vectors_file(self, matrix: np.ndarray):
+        """Atomically swap in a new matrix file; readers keep their mapping of the old one"""
+        temp_file = self.vectors_file.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(np.ascontiguousarray(matrix, dtype=np.float32).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.vectors_file)
+
+    @staticmethod
+    def _to_resume(row, vectors: Optional[np.ndarray]) -> Dict:
+        (resume_id, file_name, name, email, phone, experience_years, word_count, parsing_status,
+         skills, fields, full_text, chunk_start, chunk_count, chunk_spans) = row
+        resume = json.loads(fields)
+        resume.update(
+            resume_id=resume_id,
+            file_name=file_name,
+            name=name,
+            email=email,
+            phone=phone,
+            experience_years=experience_years,
+            word_count=word_count,
+            parsing_status=parsing_status,
+            skills=json.loads(skills),
+            full_text=full_text
+        )
+        if chunk_count and vectors is not None and chunk_start + chunk_count <= len(vectors):
+            resume['chunk_embeddings'] = vectors[chunk_start:chunk_start + chunk_count]
+            resume['chunk_spans'] = [tuple(span) for span in json.loads(chunk_spans)]
+            resume['embedding'] = normalize_rows(resume['chunk_embeddings'].mean(axis=0))[0]
+        return resume
+
+    def _refresh(self):
+        """Reload the snapshot if the corpus changed since it was loaded (here or in another process)"""
+        generation = self._read_generation()
+        if generation == self._generation:
+            return
+        connection = self._connection()
+        meta = self._meta(connection)
+        vectors = self._map_vectors(meta.get('dimension'))
+        rows = connection.execute(
+            "SELECT resume_id, file_name, name, email, phone, experience_years, word_count, parsing_status, "
+            "skills, fields, full_text, chunk_start, chunk_count, chunk_spans FROM resumes ORDER BY added_at, rowid"
+        ).fetchall()
+        self._resumes = [self._to_resume(row, vectors) for row in rows]
+        self._by_id = {resume['resume_id']: resume for resume in self._resumes}
+        self._count = len(self._resumes)
+        self._generation = generation
+        print(f"Loaded resume corpus: {len(self._resumes)} resumes")
+
+    def resumes(self) -> List[Dict]:
+        """Every resume in the corpus, in upload order (the dicts are shared: do not modify them)"""
+        with self._lock:
+            self._refresh()
+            return list(self._resumes)
+
+    def get_many(self, resume_ids: Iterable[str]) -> Dict[str, Dict]:
+        """The stored resumes among resume_ids, by id"""
+        with self._lock:
+            self._refresh()
+            return {resume_id: self._by_id[resume_id] for resume_id in resume_ids if resume_id in self._by_id}
+
+    def count(self) -> int:
+        """Number of resumes as of the last load or write in this process (no I/O; resumes() is current)"""
+        return self._count
+
+    def add(self, resumes: List[Dict]) -> int:
+        """Store parsed resumes (with their chunk embeddings, if computed), replacing any with the same resume_id.
+
+        A resume without 'resume_id' is keyed by a hash of its text. Returns the
+        number of resumes stored.
+        """
+        records = []
+        for resume in resumes:
+            record = dict(resume)
+            if not record.get('resume_id'):
+                record['resume_id'] = hashlib.blake2b(record.get('full_text', '').encode('utf-8'),
+                                                      digest_size=16).hexdigest()
+            if record.get('chunk_embeddings') is not None:
+                record['chunk_embeddings'] = np.asarray(record['chunk_embeddings'], dtype=np.float32)
+            records.append(record)
+        if not records:
+            return 0
+
+        with self._write_transaction() as connection:
+            meta = self._meta(connection)
+            up_to_date = self._generation == meta.get('generation')
+            next_row = meta.get('next_row', 0)
+            dimension = meta.get('dimension')
+
+            embedded = [record for record in records if record.get('chunk_embeddings') is not None
+                        and len(record['chunk_embeddings'])]
+            if embedded:
+                dimension = dimension or embedded[0]['chunk_embeddings'].shape[1]
+                matrix = np.concatenate([record['chunk_embeddings'] for record in embedded])
+                if matrix.shape[1] != dimension:
+                    raise ValueError(f"Expected {dimension}-d embeddings, got {matrix.shape[1]}-d")
+                # Vectors first, then the rows that point at them
+                self.vectors_file.touch(exist_ok=True)
+                with open(self.vectors_file, 'r+b') as f:
+                    f.seek(next_row * dimension * 4)
+                    f.write(np.ascontiguousarray(matrix).tobytes())
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            placeholders = ','.join('?' * len(records))
+            previous = dict(connection.execute(
+                f"SELECT resume_id, added_at FROM resumes WHERE resume_id IN ({placeholders})",
+                [record['resume_id'] for record in records]
+            ).fetchall())
+            meta['dead_rows'] = meta.get('dead_rows', 0) + (connection.execute(
+                f"SELECT COALESCE(SUM(chunk_count), 0) FROM resumes WHERE resume_id IN ({placeholders})",
+                [record['resume_id'] for record in records]
+            ).fetchone()[0])
+
+            rows, now = [], time.time()
+            for record in records:
+                chunk_start, chunk_count, chunk_spans = None, 0, None
+                if record.get('chunk_embeddings') is not None and len(record['chunk_embeddings']):
+                    chunk_start, chunk_count = next_row, len(record['chunk_embeddings'])
+                    chunk_spans = json.dumps([list(span) for span in record['chunk_spans']])
+                    next_row += chunk_count
+                fields = {key: value for key, value in record.items() if key not in _TRANSIENT}
+                rows.append((
+                    record['resume_id'], previous.get(record['resume_id'], now),
+                    *(record.get(column) for column in _COLUMNS),
+                    json.dumps(record.get('skills', [])), json.dumps(fields, default=str),
+                    record.get('full_text', ''), chunk_start, chunk_count, chunk_spans
+                ))
+            connection.executemany(
+                "INSERT OR REPLACE INTO resumes (resume_id, added_at, file_name, name, email, phone, "
+                "experience_years, word_count, parsing_status, skills, fields, full_text, "
+                "chunk_start, chunk_count, chunk_spans) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            meta.update(next_row=next_row, dimension=dimension, generation=meta.get('generation', 0) + 1)
+            self._save_meta(connection, meta)
+
+            # Extend the snapshot in place instead of reloading everything, unless another process wrote meanwhile
+            if up_to_date:
+                for record in records:
+                    if record.get('chunk_embeddings') is not None and len(record['chunk_embeddings']):
+                        record['embedding'] = normalize_rows(record['chunk_embeddings'].mean(axis=0))[0]
+                    if record['resume_id'] in self._by_id:
+                        position = self._resumes.index(self._by_id[record['resume_id']])
+                        self._resumes = self._resumes[:position] + [record] + self._resumes[position + 1:]
+                    else:
+                        self._resumes = self._resumes + [record]
+                    self._by_id[record['resume_id']] = record
+                self._generation = meta['generation']
+            self._count = connection.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+        return len(records)
+
+    def remove(self, resume_ids: Iterable[str]) -> int:
+        """Remove resumes by id; returns how many were stored"""
+        resume_ids = list(resume_ids)
+        if not resume_ids:
+            return 0
+        with self._write_transaction() as connection:
+            placeholders = ','.join('?' * len(resume_ids))
+            removed, rows = connection.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(chunk_count), 0) FROM resumes WHERE resume_id IN ({placeholders})",
+                resume_ids
+            ).fetchone()
+            if not removed:
+                return 0
+            connection.execute(f"DELETE FROM resumes WHERE resume_id IN ({placeholders})", resume_ids)
+            meta = self._meta(connection)
+            up_to_date = self._generation == meta.get('generation')
+            meta.update(dead_rows=meta.get('dead_rows', 0) + rows, generation=meta.get('generation', 0) + 1)
+            self._save_meta(connection, meta)
+            if meta['dead_rows'] >= max(self.COMPACT_MIN_DEAD_ROWS, meta.get('next_row', 0) - meta['dead_rows']):
+                self._compact(connection, meta)
+
+            if up_to_date:
+                removed_ids = set(resume_ids)
+                self._resumes = [resume for resume in self._resumes if resume['resume_id'] not in removed_ids]
+                for resume_id in removed_ids:
+                    self._by_id.pop(resume_id, None)
+                self._generation = meta['generation']
+            self._count = connection.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+        return removed
+
+    def _compact(self, connection: sqlite3.Connection, meta: Dict):
+        """Rewrite the matrix with only the rows still in use (snapshot dicts keep their old, still valid, views)"""
+        vectors = self._map_vectors(meta.get('dimension'))
+        rows = connection.execute(
+            "SELECT resume_id, chunk_start, chunk_count FROM resumes WHERE chunk_count > 0 ORDER BY chunk_start"
+        ).fetchall()
+        parts, starts, next_row = [], [], 0
+        for resume_id, chunk_start, chunk_count in rows:
+            parts.append(vectors[chunk_start:chunk_start + chunk_count])
+            starts.append((next_row, resume_id))
+            next_row += chunk_count
+        dimension = meta.get('dimension') or 0
+        self._replace_vectors_file(np.concatenate(parts) if parts else np.empty((0, dimension), dtype=np.float32))
+        connection.executemany("UPDATE resumes SET chunk_start = ? WHERE resume_id = ?", starts)
+        print(f"Compacted resume corpus embeddings: {meta.get('next_row', 0)} -> {next_row} rows")
+        meta.update(next_row=next_row, dead_rows=0)
+        self._save_meta(connection, meta)
+
+    def clear(self):
+        """Remove every resume"""
+        with self._write_transaction() as connection:
+            connection.execute("DELETE FROM resumes")
+            meta = self._meta(connection)
+            self._replace_vectors_file(np.empty((0, meta.get('dimension') or 0), dtype=np.float32))
+            meta.update(next_row=0, dead_rows=0, generation=meta.get('generation', 0) + 1)
+            self._save_meta(connection, meta)
+            self._resumes, self._by_id = [], {}
+            self._count = 0
+            self._generation = meta['generation']
+
+    def stats(self) -> Dict:
+        """Stored resumes, embedding rows in use and unused, and size on disk"""
+        connection = self._connection()
+        meta = self._meta(connection)
+        resumes, successful, embedded = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(parsing_status = 'success'), 0), COALESCE(SUM(chunk_count > 0), 0) "
+            "FROM resumes"
+        ).fetchone()
+        return {
+            'resumes': resumes,
+            'successful_parses': successful,
+            'embedded_resumes': embedded,
+            'embedding_rows': meta.get('next_row', 0) - meta.get('dead_rows', 0),
+            'unused_embedding_rows': meta.get('dead_rows', 0),
+            'dimension': meta.get('dimension'),
+            'embedding_model': meta.get('embedding_model'),
+            'vectors_bytes': os.path.getsize(self.vectors_file) if self.vectors_file.exists() else 0,
+            'database_bytes': os.path.getsize(self.database_path),
+            'generation': meta.get('generation', 0)
+        }
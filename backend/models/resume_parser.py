@@ -3,11 +3,141 @@ import docx
 from typing import Dict, List, Optional
 import re
 import os
+import multiprocessing
+import signal
+import threading
 from pathlib import Path
 
+from .keyword_matcher import KeywordMatcher
+
+
+# Comprehensive skill keywords organized by category
+SKILL_KEYWORDS = {
+    'programming_languages': [
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 
+        'rust', 'kotlin', 'swift', 'r', 'matlab', 'scala', 'perl', 'shell', 'bash'
+    ],
+    'web_technologies': [
+        'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'next.js', 
+        'nuxt.js', 'gatsby', 'svelte', 'bootstrap', 'tailwind', 'sass', 'less', 
+        'webpack', 'vite', 'jquery', 'backbone.js', 'ember.js'
+    ],
+    'databases': [
+        'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'sql server',
+        'cassandra', 'dynamodb', 'elasticsearch', 'neo4j', 'firebase', 'supabase'
+    ],
+    'frameworks': [
+        'django', 'flask', 'fastapi', 'spring', 'laravel', 'rails', 'express.js',
+        'nest.js', 'asp.net', 'xamarin', 'react native', 'flutter', 'ionic'
+    ],
+    'cloud_devops': [
+        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab ci',
+        'github actions', 'terraform', 'ansible', 'chef', 'puppet', 'vagrant',
+        'nginx', 'apache', 'linux', 'ubuntu', 'centos', 'redhat'
+    ],
+    'data_science': [
+        'machine learning', 'deep learning', 'artificial intelligence', 'data science',
+        'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras',
+        'matplotlib', 'seaborn', 'jupyter', 'anaconda', 'spark', 'hadoop',
+        'tableau', 'power bi', 'looker', 'qlik'
+    ],
+    'tools': [
+        'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence', 'slack',
+        'trello', 'asana', 'notion', 'figma', 'sketch', 'adobe xd', 'photoshop',
+        'illustrator', 'postman', 'insomnia', 'vs code', 'intellij', 'eclipse'
+    ],
+    'methodologies': [
+        'agile', 'scrum', 'kanban', 'waterfall', 'devops', 'ci/cd', 'tdd', 'bdd',
+        'microservices', 'api', 'rest', 'graphql', 'soap', 'json', 'xml'
+    ],
+    'soft_skills': [
+        'leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking',
+        'project management', 'time management', 'analytical', 'creative', 'adaptable'
+    ]
+}
+
+# Compiled once per process; scans a resume in a single pass
+SKILL_MATCHER = KeywordMatcher(SKILL_KEYWORDS)
+
+
+_worker_parser = None
+
+
+class _ParseTimeout(BaseException):
+    """Raised by SIGALRM in a pool worker; not an Exception, so the extractors' error handling does not swallow it"""
+
+
+def _raise_parse_timeout(signum, frame):
+    raise _ParseTimeout()
+
+
+def _parse_in_worker(file_path: str, timeout: Optional[float] = None) -> Dict:
+    """Entry point for pool workers (must be module-level to be picklable).
+
+    timeout is counted from when this file starts parsing and enforced with
+    SIGALRM, so it only applies where setitimer exists (not on Windows).
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ResumeParser(execution_mode='sequential')
+    if not timeout or not hasattr(signal, 'setitimer'):
+        return _worker_parser.parse_resume(file_path)
+    
+    signal.signal(signal.SIGALRM, _raise_parse_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return _worker_parser.parse_resume(file_path)
+    except _ParseTimeout:
+        return _worker_parser._error_result(file_path, f"Parsing timed out after {timeout} seconds")
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class _WorkerPool:
+    """A spawn Pool and how many batches are still waiting on its results"""
+
+    def __init__(self, processes: int, max_tasks_per_child: int):
+        # Spawn rather than fork: the API process holds model and server threads
+        # that must not be duplicated into the children.
+        context = multiprocessing.get_context('spawn')
+        self.pool = context.Pool(processes=processes, maxtasksperchild=max_tasks_per_child)
+        self.waiting = 0
+        self.retired = False
+
+
 class ResumeParser:
-    def __init__(self):
+    # Pool workers are replaced after this many files, so memory leaked by the
+    # PDF/DOCX libraries does not pile up in long-lived processes
+    WORKER_MAX_TASKS = 200
+    # Extra seconds past file_timeout before a worker that ignores its timeout
+    # (stuck in native code) is given up on and its pool replaced
+    HUNG_WORKER_GRACE = 30
+
+    def __init__(self,
+                 execution_mode: str = 'sequential',
+                 max_workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None,
+                 file_timeout: Optional[float] = None,
+                 min_parallel_files: int = 4):
+        """Initialize the parser.
+
+        execution_mode is 'sequential' (parse in the calling process) or 'process'
+        (spread batches of at least min_parallel_files files over a pool of worker
+        processes, started on first use and kept until close()). file_timeout is the
+        number of seconds a single file may take in process mode, counted from when
+        it starts parsing, before it is reported as an error.
+        """
+        if execution_mode not in ('sequential', 'process'):
+            raise ValueError(f"Unsupported execution mode: {execution_mode}")
+        
         self.sections = ['experience', 'education', 'skills', 'projects', 'summary']
+        self.execution_mode = execution_mode
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size or self.max_workers)
+        self.file_timeout = file_timeout
+        self.min_parallel_files = max(2, min_parallel_files)
+        self._pool = None
+        self._pool_lock = threading.Lock()
         
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF file"""
@@ -158,63 +288,7 @@ class ResumeParser:
 
     def extract_skills(self, text: str) -> List[str]:
         """Extract skills from resume text"""
-        # Comprehensive skill keywords organized by category
-        skill_keywords = {
-            'programming_languages': [
-                'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 
-                'rust', 'kotlin', 'swift', 'r', 'matlab', 'scala', 'perl', 'shell', 'bash'
-            ],
-            'web_technologies': [
-                'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'next.js', 
-                'nuxt.js', 'gatsby', 'svelte', 'bootstrap', 'tailwind', 'sass', 'less', 
-                'webpack', 'vite', 'jquery', 'backbone.js', 'ember.js'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'sql server',
-                'cassandra', 'dynamodb', 'elasticsearch', 'neo4j', 'firebase', 'supabase'
-            ],
-            'frameworks': [
-                'django', 'flask', 'fastapi', 'spring', 'laravel', 'rails', 'express.js',
-                'nest.js', 'asp.net', 'xamarin', 'react native', 'flutter', 'ionic'
-            ],
-            'cloud_devops': [
-                'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab ci',
-                'github actions', 'terraform', 'ansible', 'chef', 'puppet', 'vagrant',
-                'nginx', 'apache', 'linux', 'ubuntu', 'centos', 'redhat'
-            ],
-            'data_science': [
-                'machine learning', 'deep learning', 'artificial intelligence', 'data science',
-                'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras',
-                'matplotlib', 'seaborn', 'jupyter', 'anaconda', 'spark', 'hadoop',
-                'tableau', 'power bi', 'looker', 'qlik'
-            ],
-            'tools': [
-                'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence', 'slack',
-                'trello', 'asana', 'notion', 'figma', 'sketch', 'adobe xd', 'photoshop',
-                'illustrator', 'postman', 'insomnia', 'vs code', 'intellij', 'eclipse'
-            ],
-            'methodologies': [
-                'agile', 'scrum', 'kanban', 'waterfall', 'devops', 'ci/cd', 'tdd', 'bdd',
-                'microservices', 'api', 'rest', 'graphql', 'soap', 'json', 'xml'
-            ],
-            'soft_skills': [
-                'leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking',
-                'project management', 'time management', 'analytical', 'creative', 'adaptable'
-            ]
-        }
-        
-        text_lower = text.lower()
-        found_skills = []
-        
-        # Flatten all skill categories
-        all_skills = []
-        for category, skills in skill_keywords.items():
-            all_skills.extend(skills)
-        
-        for skill in all_skills:
-            # Use word boundaries to avoid partial matches
-            if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
-                found_skills.append(skill.title())
+        found_skills = [skill.title() for skill in SKILL_MATCHER.find_keywords(text)]
         
         # Remove duplicates and sort
         found_skills = sorted(list(set(found_skills)))
@@ -372,29 +446,110 @@ class ResumeParser:
             return parsed_data
             
         except Exception as e:
-            return {
-                'file_name': os.path.basename(file_path),
-                'file_path': file_path,
-                'parsing_status': 'error',
-                'error_message': str(e),
-                'full_text': '',
-                'name': '',
-                'email': '',
-                'phone': '',
-                'skills': [],
-                'experience_years': None,
-                'text_length': 0,
-                'word_count': 0
-            }
+            return self._error_result(file_path, str(e))
+    
+    def _error_result(self, file_path: str, error_message: str) -> Dict:
+        """Build the record returned for a resume that could not be parsed"""
+        return {
+            'file_name': os.path.basename(file_path),
+            'file_path': file_path,
+            'parsing_status': 'error',
+            'error_message': error_message,
+            'full_text': '',
+            'name': '',
+            'email': '',
+            'phone': '',
+            'skills': [],
+            'experience_years': None,
+            'text_length': 0,
+            'word_count': 0
+        }
     
     def batch_parse_resumes(self, file_paths: List[str]) -> List[Dict]:
-        """Parse multiple resumes"""
+        """Parse multiple resumes, returning results in input order"""
+        if self.execution_mode == 'process' and len(file_paths) >= self.min_parallel_files and self.max_workers > 1:
+            return self._parallel_parse_resumes(file_paths)
+        
         results = []
         for file_path in file_paths:
             result = self.parse_resume(file_path)
             results.append(result)
         return results
     
+    def _acquire_pool(self) -> _WorkerPool:
+        """The shared worker pool, started on first use"""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = _WorkerPool(self.max_workers, self.WORKER_MAX_TASKS)
+            self._pool.waiting += 1
+            return self._pool
+    
+    def _release_pool(self, worker_pool: _WorkerPool, stuck: bool = False):
+        """Stop waiting on a pool.
+
+        A pool with a worker stuck on a timed-out file is replaced for new batches
+        and terminated (killing that worker) once no batch is waiting on it.
+        """
+        with self._pool_lock:
+            worker_pool.waiting -= 1
+            if stuck and not worker_pool.retired:
+                worker_pool.retired = True
+                if self._pool is worker_pool:
+                    self._pool = None
+            terminate = worker_pool.retired and worker_pool.waiting == 0
+        if terminate:
+            worker_pool.pool.terminate()
+    
+    def close(self):
+        """Terminate the worker pool (at application shutdown)"""
+        with self._pool_lock:
+            worker_pool, self._pool = self._pool, None
+            if worker_pool is not None:
+                worker_pool.retired = True
+        if worker_pool is not None:
+            worker_pool.pool.terminate()
+    
+    def _parallel_parse_resumes(self, file_paths: List[str]) -> List[Dict]:
+        """Parse resumes in the worker pool, submitting chunk_size files at a time.
+
+        A file that raises or exceeds file_timeout yields an error record instead of
+        failing the batch. Workers enforce file_timeout themselves; waiting on a
+        result is additionally capped at file_timeout + HUNG_WORKER_GRACE seconds per
+        wait, which catches a worker the timeout cannot interrupt (and, without
+        SIGALRM, is the only limit).
+        """
+        wait_timeout = self.file_timeout + self.HUNG_WORKER_GRACE if self.file_timeout else None
+        results = []
+        
+        try:
+            for start in range(0, len(file_paths), self.chunk_size):
+                chunk = file_paths[start:start + self.chunk_size]
+                worker_pool = self._acquire_pool()
+                stuck = False
+                try:
+                    pending = [worker_pool.pool.apply_async(_parse_in_worker, (path, self.file_timeout))
+                               for path in chunk]
+                    
+                    for file_path, async_result in zip(chunk, pending):
+                        try:
+                            results.append(async_result.get(timeout=wait_timeout))
+                        except multiprocessing.TimeoutError:
+                            print(f"Parser worker hung on {file_path}, replacing the worker pool")
+                            stuck = True
+                            results.append(self._error_result(
+                                file_path, f"Parsing timed out after {self.file_timeout} seconds"
+                            ))
+                        except Exception as e:
+                            results.append(self._error_result(file_path, str(e)))
+                finally:
+                    self._release_pool(worker_pool, stuck)
+        except Exception as e:
+            # Pool broke down - parse whatever is left in-process
+            print(f"Process pool unavailable ({e}), parsing remaining files sequentially")
+            results.extend(self.parse_resume(path) for path in file_paths[len(results):])
+        
+        return results
+    
     def debug_extraction(self, file_path: str) -> Dict:
         """Debug method to see what's being extracted from each step"""
         try:
@@ -0,0 +1,154 @@
+from typing import Dict, List, Optional
+import numpy as np
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Return a contiguous float32 copy of matrix with unit-length rows (zero rows stay zero)"""
+    matrix = np.array(matrix, dtype=np.float32, ndmin=2, copy=True, order='C')
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+class ScoringEngine:
+    """Vectorized candidate ranking over a pre-normalized embedding matrix.
+
+    Cosine similarity for every candidate is a single matrix-vector product, the
+    keyword match ratio is counted from per-keyword posting arrays, and the top-k
+    candidates are selected with argpartition instead of a full sort. Scores use
+    the same weighting as JobMatcher.match_resumes (60% similarity, 40% keywords).
+
+    With chunk_counts, embeddings holds several rows per candidate (its chunks,
+    stored consecutively) and a candidate's similarity is the max or mean
+    (pooling) of its chunks' similarities.
+    """
+
+    POOLING = ("max", "mean")
+
+    def __init__(self, embeddings: np.ndarray, keywords: List[List[str]],
+                 similarity_weight: float = 0.6, keyword_weight: float = 0.4,
+                 chunk_counts: Optional[List[int]] = None, pooling: str = "max"):
+        if chunk_counts is None:
+            chunk_counts = np.ones(len(keywords), dtype=np.int64)
+        chunk_counts = np.asarray(chunk_counts, dtype=np.int64)
+        if len(chunk_counts) != len(keywords) or chunk_counts.sum() != len(embeddings):
+            raise ValueError("embeddings and keywords must describe the same candidates")
+        if len(chunk_counts) and chunk_counts.min() < 1:
+            raise ValueError("every candidate needs at least one embedding row")
+        if pooling not in self.POOLING:
+            raise ValueError(f"Unknown pooling {pooling!r} (expected one of {self.POOLING})")
+
+        self.embeddings = normalize_rows(embeddings) if len(embeddings) else np.empty((0, 0), dtype=np.float32)
+        self.chunk_counts = chunk_counts
+        self.chunk_offsets = np.concatenate([[0], np.cumsum(chunk_counts)])  # rows of candidate i: offsets[i]:offsets[i + 1]
+        self.pooling = pooling
+        self.keywords = [list(candidate_keywords) for candidate_keywords in keywords]
+        self.similarity_weight = similarity_weight
+        self.keyword_weight = keyword_weight
+
+        # keyword -> indices of the candidates that contain it
+        postings = {}
+        for index, candidate_keywords in enumerate(self.keywords):
+            for keyword in set(candidate_keywords):
+                postings.setdefault(keyword, []).append(index)
+        self.postings = {keyword: np.array(rows, dtype=np.int32) for keyword, rows in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _rows(self, candidates: np.ndarray) -> np.ndarray:
+        """Embedding rows of the given candidates, in candidate order"""
+        counts = self.chunk_counts[candidates]
+        starts = self.chunk_offsets[candidates]
+        # Each candidate's run of rows: its start plus 0..count-1
+        return np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+
+    def similarity_scores(self, job_embedding: np.ndarray, candidates: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cosine similarity of every candidate (or only of candidates) to the job embedding"""
+        job_vector = normalize_rows(job_embedding)[0]
+        if candidates is None:
+            if len(self.embeddings) == len(self):
+                return self.embeddings @ job_vector
+            row_similarities = self.embeddings @ job_vector
+            counts = self.chunk_counts
+        else:
+            row_similarities = self.embeddings[self._rows(candidates)] @ job_vector
+            counts = self.chunk_counts[candidates]
+        if not len(counts):
+            return row_similarities
+
+        # Pool each candidate's consecutive chunk similarities
+        starts = np.cumsum(counts) - counts
+        if self.pooling == "max":
+            return np.maximum.reduceat(row_similarities, starts)
+        return np.add.reduceat(row_similarities, starts) / counts
+
+    def best_chunk(self, index: int, job_embedding: np.ndarray) -> int:
+        """Position of candidate index's chunk most similar to the job embedding"""
+        rows = self.embeddings[self.chunk_offsets[index]:self.chunk_offsets[index + 1]]
+        return int(np.argmax(rows @ normalize_rows(job_embedding)[0]))
+
+    def keyword_match_ratios(self, job_keywords: List[str]) -> np.ndarray:
+        """Fraction of the (distinct) job keywords found in each candidate"""
+        job_keywords = set(job_keywords)
+        if not job_keywords or not len(self):
+            return np.zeros(len(self))
+
+        hits = [self.postings[keyword] for keyword in job_keywords if keyword in self.postings]
+        if not hits:
+            return np.zeros(len(self))
+
+        counts = np.bincount(np.concatenate(hits), minlength=len(self))
+        return counts / len(job_keywords)
+
+    def top_k(self, scores: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k highest scores, best first (ties keep candidate order)"""
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+
+        if k < len(scores):
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(len(scores))
+
+        order = np.lexsort((candidates, -scores[candidates]))
+        return candidates[order]
+
+    def rank(self, job_embedding: np.ndarray, job_keywords: List[str], top_k: int,
+             candidates: Optional[np.ndarray] = None) -> List[Dict]:
+        """Rank candidates against a job and return the top_k scored entries.
+
+        Each entry has 'index', 'score', 'similarity_score', 'keyword_match_ratio'
+        and 'matched_keywords'. Pass candidates (indices, e.g. the nearest
+        neighbours from a vector index) to score only those instead of everyone.
+        """
+        if not len(self):
+            return []
+
+        ratios = self.keyword_match_ratios(job_keywords)
+        if candidates is None:
+            similarities = self.similarity_scores(job_embedding)
+            scores = self.similarity_weight * similarities + self.keyword_weight * ratios
+            best = self.top_k(scores, top_k)
+        else:
+            # Score only the given rows; sorting them keeps ties in candidate order
+            candidates = np.sort(np.asarray(candidates, dtype=np.int64))
+            similarities = np.zeros(len(self), dtype=np.float32)
+            similarities[candidates] = self.similarity_scores(job_embedding, candidates)
+            scores = np.zeros(len(self))
+            scores[candidates] = (self.similarity_weight * similarities[candidates] +
+                                  self.keyword_weight * ratios[candidates])
+            best = candidates[self.top_k(scores[candidates], top_k)]
+
+        job_keywords = set(job_keywords)
+        return [
+            {
+                'index': int(index),
+                'score': float(scores[index]),
+                'similarity_score': float(similarities[index]),
+                'keyword_match_ratio': float(ratios[index]),
+                'matched_keywords': list(job_keywords & set(self.keywords[index]))
+            }
+            for index in best
+        ]
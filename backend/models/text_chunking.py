@@ -0,0 +1,136 @@
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional, Tuple
+import re
+
+# Bump when chunk boundaries change, so stored chunks get rebuilt
+CHUNKING_VERSION = 2
+
+# Resume section headings, matched at the start of a line and followed by a
+# colon or the end of the line ("EXPERIENCE", "Technical Skills: Python, ...")
+SECTION_HEADINGS = {
+    'summary': ['summary', 'professional summary', 'profile', 'objective', 'about me'],
+    'experience': ['experience', 'work experience', 'professional experience', 'employment',
+                   'employment history', 'work history'],
+    'education': ['education', 'academic background', 'qualifications'],
+    'skills': ['skills', 'technical skills', 'core competencies', 'technologies'],
+    'projects': ['projects', 'personal projects', 'key projects'],
+    'certifications': ['certifications', 'certificates', 'licenses'],
+    'achievements': ['achievements', 'awards', 'honors']
+}
+_HEADING_SECTIONS = {heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings}
+_HEADING_PATTERN = re.compile(
+    r'^[ \t]*(' + '|'.join(sorted(map(re.escape, _HEADING_SECTIONS), key=len, reverse=True)) + r')[ \t]*(?::|$)',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Stand-in for the model tokenizer: words cut into pieces of at most 6 characters
+# and single punctuation marks. It over-counts compared to WordPiece, so chunks
+# come out a little short rather than getting truncated by the model.
+_APPROXIMATE_TOKEN_PATTERN = re.compile(r'\w{1,6}|[^\w\s]')
+
+
+class TextChunker:
+    """Token-aware chunking of resume text.
+
+    Chunks hold at most max_tokens model tokens and never straddle a section
+    heading: consecutive sections that fit are packed into one chunk, longer ones
+    are cut into windows that share overlap tokens, ending at a line break when
+    there is one near the end of the window. Every chunk records its character
+    offsets, so text[start:end] is exactly the chunk text.
+    """
+
+    def __init__(self, max_tokens: int = 254, overlap: int = 32, tokenizer=None):
+        if not 0 <= overlap < max_tokens:
+            raise ValueError("overlap must be smaller than max_tokens")
+        self.max_tokens = max_tokens
+        self.overlap = overlap
+        self.tokenizer = tokenizer  # Hugging Face fast tokenizer, or None for the approximation
+
+    @classmethod
+    def for_model(cls, model, max_tokens: Optional[int] = None, overlap: int = 32) -> 'TextChunker':
+        """Chunker sized to a SentenceTransformer's input window, using its tokenizer when it reports offsets"""
+        window = model.max_seq_length - 2  # [CLS] and [SEP]
+        max_tokens = min(max_tokens, window) if max_tokens else window
+        tokenizer = getattr(model, 'tokenizer', None)
+        if not getattr(tokenizer, 'is_fast', False):
+            tokenizer = None  # only fast tokenizers return offset mappings
+        return cls(max_tokens, min(overlap, max_tokens - 1), tokenizer)
+
+    @property
+    def signature(self) -> str:
+        """Identifies the chunk boundaries this chunker produces"""
+        tokenizer = getattr(self.tokenizer, 'name_or_path', 'approximate') if self.tokenizer else 'approximate'
+        return f"v{CHUNKING_VERSION}:{tokenizer}:{self.max_tokens}:{self.overlap}"
+
+    def token_spans(self, text: str) -> List[Tuple[int, int]]:
+        """(start, end) character offsets of every token in text"""
+        if self.tokenizer is not None:
+            encoding = self.tokenizer(text, add_special_tokens=False, return_offsets_mapping=True,
+                                      truncation=False, verbose=False)
+            return [(start, end) for start, end in encoding['offset_mapping'] if end > start]
+        return [match.span() for match in _APPROXIMATE_TOKEN_PATTERN.finditer(text)]
+
+    def sections(self, text: str) -> List[Tuple[str, int, int]]:
+        """(section, start, end) spans covering text; text before the first heading is the 'header'"""
+        boundaries = [('header', 0)]
+        for match in _HEADING_PATTERN.finditer(text):
+            boundaries.append((_HEADING_SECTIONS[match.group(1).lower()], match.start()))
+        ends = [start for _, start in boundaries[1:]] + [len(text)]
+        return [(section, start, end) for (section, start), end in zip(boundaries, ends) if end > start]
+
+    def _windows(self, text: str, spans: List[Tuple[int, int]], first: int, stop: int) -> Iterator[Tuple[int, int]]:
+        """Overlapping windows [first, last) of at most max_tokens tokens over spans[first:stop]"""
+        while True:
+            last = min(first + self.max_tokens, stop)
+            if last < stop:
+                # End at the last line break in the final quarter of the window, if any
+                for cut in range(last, first + self.max_tokens * 3 // 4, -1):
+                    if '\n' in text[spans[cut - 1][1]:spans[cut][0]]:
+                        last = cut
+                        break
+            yield first, last
+            if last >= stop:
+                return
+            first = max(last - self.overlap, first + 1)
+
+    def chunk(self, text: str) -> List[Dict]:
+        """Split text into chunks: dicts with 'text', 'start', 'end', 'tokens' and 'sections'"""
+        spans = self.token_spans(text)
+        if not spans:
+            return [{'text': text, 'start': 0, 'end': len(text), 'tokens': 0, 'sections': []}] if text else []
+
+        starts = [start for start, _ in spans]
+        chunks = []
+        packed = None  # whole sections gathered into the chunk being built
+
+        def flush():
+            if packed:
+                chunks.append(packed)
+
+        for section, section_start, section_end in self.sections(text):
+            first, stop = bisect_left(starts, section_start), bisect_left(starts, section_end)
+            tokens = stop - first
+            if not tokens:
+                continue
+
+            if tokens <= self.max_tokens:
+                if packed and packed['tokens'] + tokens <= self.max_tokens:
+                    packed['end'] = spans[stop - 1][1]
+                    packed['tokens'] += tokens
+                    packed['sections'].append(section)
+                else:
+                    flush()
+                    packed = {'start': spans[first][0], 'end': spans[stop - 1][1], 'tokens': tokens,
+                              'sections': [section]}
+                continue
+
+            flush()
+            packed = None
+            for window_first, window_last in self._windows(text, spans, first, stop):
+                chunks.append({'start': spans[window_first][0], 'end': spans[window_last - 1][1],
+                               'tokens': window_last - window_first, 'sections': [section]})
+        flush()
+
+        for chunk in chunks:
+            chunk['text'] = text[chunk['start']:chunk['end']]
+        return chunks
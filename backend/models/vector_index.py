@@ -0,0 +1,375 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+import heapq
+import json
+import math
+import numpy as np
+
+from .scoring_engine import normalize_rows
+
+try:
+    import hnswlib
+except ImportError:  # optional: the pure NumPy HNSW below is used instead
+    hnswlib = None
+
+
+class BruteForceIndex:
+    """Exact cosine-similarity search: one matrix-vector product over every vector.
+
+    Vectors are stored unit-normalized with an integer label each. Removing a
+    label moves the last row into its slot, so the matrix stays dense.
+    """
+
+    kind = "brute"
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self._vectors = np.empty((0, dimension), dtype=np.float32)
+        self._labels = np.empty(0, dtype=np.int64)
+        self._rows = {}  # label -> row
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def add(self, labels: Iterable[int], vectors: np.ndarray):
+        """Insert (or replace) one vector per label"""
+        labels = np.asarray(list(labels), dtype=np.int64)
+        vectors = normalize_rows(vectors)
+        if len(labels) != len(vectors):
+            raise ValueError("labels and vectors must have the same length")
+
+        existing = [label in self._rows for label in labels.tolist()]
+        for label, vector in zip(labels[existing], vectors[existing]):
+            self._vectors[self._rows[int(label)]] = vector
+
+        new = ~np.asarray(existing, dtype=bool)
+        if new.any():
+            start = len(self._labels)
+            self._vectors = np.concatenate([self._vectors, vectors[new]])
+            self._labels = np.concatenate([self._labels, labels[new]])
+            self._rows.update((int(label), start + offset) for offset, label in enumerate(labels[new]))
+
+    def remove(self, labels: Iterable[int]):
+        """Delete labels (unknown labels are ignored)"""
+        for label in labels:
+            row = self._rows.pop(int(label), None)
+            if row is None:
+                continue
+            last = len(self._labels) - 1
+            if row != last:
+                self._vectors[row] = self._vectors[last]
+                self._labels[row] = self._labels[last]
+                self._rows[int(self._labels[row])] = row
+            self._vectors = self._vectors[:last]
+            self._labels = self._labels[:last]
+
+    def search(self, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Labels and cosine similarities of the k nearest vectors, best first"""
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        similarities = self._vectors @ normalize_rows(query)[0]
+        if k < len(similarities):
+            rows = np.argpartition(-similarities, k - 1)[:k]
+        else:
+            rows = np.arange(len(similarities))
+        rows = rows[np.lexsort((rows, -similarities[rows]))]
+        return self._labels[rows], similarities[rows]
+
+    def save(self, path: str):
+        Path(path).mkdir(parents=True, exist_ok=True)
+        np.save(Path(path) / "vectors.npy", self._vectors)
+        np.save(Path(path) / "labels.npy", self._labels)
+        _write_meta(path, {"kind": self.kind, "dimension": self.dimension})
+
+    @classmethod
+    def load(cls, path: str) -> "BruteForceIndex":
+        meta = _read_meta(path)
+        index = cls(meta["dimension"])
+        index._vectors = np.load(Path(path) / "vectors.npy")
+        index._labels = np.load(Path(path) / "labels.npy")
+        index._rows = {int(label): row for row, label in enumerate(index._labels)}
+        return index
+
+
+class NumpyHNSWIndex:
+    """Hierarchical Navigable Small World graph in pure Python/NumPy.
+
+    Fallback for when hnswlib is not installed. Follows the HNSW paper: each
+    node gets a random top layer, inserts greedily descend from the entry point
+    and link to the M closest nodes found with an ef_construction-wide beam on
+    every layer they live on (2*M on layer 0). Searches descend the same way and
+    widen the beam to max(ef_search, k) on layer 0. Removal marks nodes deleted;
+    they keep routing traffic but are never returned.
+    """
+
+    kind = "hnsw-numpy"
+
+    def __init__(self, dimension: int, M: int = 16, ef_construction: int = 100,
+                 ef_search: int = 64, seed: int = 42):
+        self.dimension = dimension
+        self.M = M
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self._level_multiplier = 1 / math.log(M)
+        self._rng = np.random.default_rng(seed)
+
+        self._vectors = np.empty((1024, dimension), dtype=np.float32)
+        self._count = 0
+        self._labels = []          # node -> label
+        self._nodes = {}           # label -> node
+        self._deleted = set()      # nodes removed by label
+        self._links = []           # level -> {node: [neighbour nodes]}
+        self._entry_point = None
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _similarities(self, query: np.ndarray, nodes: List[int]) -> np.ndarray:
+        return self._vectors[nodes] @ query
+
+    def _search_layer(self, query: np.ndarray, entry_points: List[Tuple[float, int]],
+                      ef: int, level: int) -> List[Tuple[float, int]]:
+        """Beam search on one layer; returns up to ef (similarity, node) pairs, best first"""
+        links = self._links[level]
+        visited = {node for _, node in entry_points}
+        candidates = [(-similarity, node) for similarity, node in entry_points]  # max-heap by similarity
+        heapq.heapify(candidates)
+        best = list(entry_points)  # min-heap by similarity: best[0] is the worst kept
+        heapq.heapify(best)
+
+        while candidates:
+            negative_similarity, node = heapq.heappop(candidates)
+            if -negative_similarity < best[0][0] and len(best) >= ef:
+                break
+            neighbours = [neighbour for neighbour in links.get(node, ()) if neighbour not in visited]
+            if not neighbours:
+                continue
+            visited.update(neighbours)
+            for similarity, neighbour in zip(self._similarities(query, neighbours).tolist(), neighbours):
+                if len(best) < ef or similarity > best[0][0]:
+                    heapq.heappush(candidates, (-similarity, neighbour))
+                    heapq.heappush(best, (similarity, neighbour))
+                    if len(best) > ef:
+                        heapq.heappop(best)
+
+        return sorted(best, reverse=True)
+
+    def _descend(self, query: np.ndarray, target_level: int) -> List[Tuple[float, int]]:
+        """Greedy walk from the entry point down to target_level"""
+        entry = self._entry_point
+        current = [(float(self._vectors[entry] @ query), entry)]
+        for level in range(len(self._links) - 1, target_level, -1):
+            current = self._search_layer(query, current, 1, level)
+        return current
+
+    def _connect(self, node: int, neighbours: List[Tuple[float, int]], level: int):
+        """Link node to its closest neighbours and shrink any neighbour list that overflows"""
+        max_links = self.M * 2 if level == 0 else self.M
+        links = self._links[level]
+        links[node] = [neighbour for _, neighbour in neighbours[:self.M]]
+        for neighbour in links[node]:
+            neighbour_links = links.setdefault(neighbour, [])
+            neighbour_links.append(node)
+            if len(neighbour_links) > max_links:
+                similarities = self._similarities(self._vectors[neighbour], neighbour_links)
+                keep = np.argsort(-similarities)[:max_links]
+                links[neighbour] = [neighbour_links[i] for i in keep]
+
+    def _insert(self, label: int, vector: np.ndarray):
+        if self._count == len(self._vectors):
+            self._vectors = np.concatenate([self._vectors, np.empty_like(self._vectors)])
+        node = self._count
+        self._vectors[node] = vector
+        self._count += 1
+        self._labels.append(label)
+        self._nodes[label] = node
+
+        level = int(-math.log(1.0 - self._rng.random()) * self._level_multiplier)
+        while len(self._links) <= level:
+            self._links.append({})
+
+        if self._entry_point is None:
+            for layer in range(level + 1):
+                self._links[layer][node] = []
+            self._entry_point = node
+            return
+
+        top_level = max(level for level, links in enumerate(self._links) if links)
+        current = self._descend(vector, level) if level < top_level else \
+            [(float(self._vectors[self._entry_point] @ vector), self._entry_point)]
+        for layer in range(min(level, top_level), -1, -1):
+            current = self._search_layer(vector, current, self.ef_construction, layer)
+            self._connect(node, current, layer)
+        for layer in range(top_level + 1, level + 1):
+            self._links[layer][node] = []
+
+        if level > top_level:
+            self._entry_point = node
+
+    def add(self, labels: Iterable[int], vectors: np.ndarray):
+        """Insert one vector per label (an existing label is removed and re-inserted)"""
+        labels = [int(label) for label in labels]
+        vectors = normalize_rows(vectors)
+        if len(labels) != len(vectors):
+            raise ValueError("labels and vectors must have the same length")
+        self.remove(label for label in labels if label in self._nodes)
+        for label, vector in zip(labels, vectors):
+            self._insert(label, vector)
+
+    def remove(self, labels: Iterable[int]):
+        """Mark labels deleted (unknown labels are ignored)"""
+        for label in list(labels):
+            node = self._nodes.pop(int(label), None)
+            if node is not None:
+                self._deleted.add(node)
+
+    def search(self, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Labels and cosine similarities of (approximately) the k nearest vectors, best first"""
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        query = normalize_rows(query)[0]
+        ef = max(self.ef_search, k)
+        if self._deleted:
+            ef *= 2  # deleted nodes still occupy beam slots
+        found = self._search_layer(query, self._descend(query, 0), ef, 0)
+        found = [(similarity, node) for similarity, node in found if node not in self._deleted][:k]
+        return (np.array([self._labels[node] for _, node in found], dtype=np.int64),
+                np.array([similarity for similarity, _ in found], dtype=np.float32))
+
+    def save(self, path: str):
+        Path(path).mkdir(parents=True, exist_ok=True)
+        arrays = {
+            "vectors": self._vectors[:self._count],
+            "labels": np.array(self._labels, dtype=np.int64),
+            "deleted": np.array(sorted(self._deleted), dtype=np.int64)
+        }
+        for level, links in enumerate(self._links):
+            nodes = sorted(links)
+            arrays[f"nodes_{level}"] = np.array(nodes, dtype=np.int64)
+            arrays[f"indptr_{level}"] = np.cumsum([0] + [len(links[node]) for node in nodes])
+            arrays[f"indices_{level}"] = np.array([n for node in nodes for n in links[node]], dtype=np.int64)
+        np.savez(Path(path) / "graph.npz", **arrays)
+        _write_meta(path, {
+            "kind": self.kind, "dimension": self.dimension, "M": self.M,
+            "ef_construction": self.ef_construction, "ef_search": self.ef_search,
+            "levels": len(self._links), "entry_point": self._entry_point
+        })
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyHNSWIndex":
+        meta = _read_meta(path)
+        index = cls(meta["dimension"], meta["M"], meta["ef_construction"], meta["ef_search"])
+        with np.load(Path(path) / "graph.npz") as arrays:
+            index._vectors = np.array(arrays["vectors"])
+            index._count = len(index._vectors)
+            index._labels = arrays["labels"].tolist()
+            index._deleted = set(arrays["deleted"].tolist())
+            index._nodes = {label: node for node, label in enumerate(index._labels)
+                            if node not in index._deleted}
+            for level in range(meta["levels"]):
+                nodes, indptr, indices = (arrays[f"{name}_{level}"] for name in ("nodes", "indptr", "indices"))
+                index._links.append({
+                    int(node): indices[indptr[i]:indptr[i + 1]].tolist() for i, node in enumerate(nodes)
+                })
+        if not len(index._vectors):
+            index._vectors = np.empty((1024, index.dimension), dtype=np.float32)
+        index._entry_point = meta["entry_point"]
+        return index
+
+
+class HNSWLibIndex:
+    """HNSW through hnswlib (inner product over unit vectors, i.e. cosine similarity)"""
+
+    kind = "hnswlib"
+
+    def __init__(self, dimension: int, M: int = 16, ef_construction: int = 100,
+                 ef_search: int = 64, initial_capacity: int = 1024):
+        self.dimension = dimension
+        self.ef_search = ef_search
+        self._index = hnswlib.Index(space="ip", dim=dimension)
+        self._index.init_index(max_elements=initial_capacity, M=M, ef_construction=ef_construction,
+                               allow_replace_deleted=True)
+        self._index.set_ef(ef_search)
+        self._labels = set()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def add(self, labels: Iterable[int], vectors: np.ndarray):
+        """Insert (or replace) one vector per label"""
+        labels = np.asarray(list(labels), dtype=np.int64)
+        vectors = normalize_rows(vectors)
+        needed = self._index.element_count + len(labels)
+        if needed > self._index.get_max_elements():
+            self._index.resize_index(max(needed, self._index.get_max_elements() * 2))
+        self._index.add_items(vectors, labels, replace_deleted=True)
+        self._labels.update(labels.tolist())
+
+    def remove(self, labels: Iterable[int]):
+        """Mark labels deleted (unknown labels are ignored)"""
+        for label in labels:
+            if int(label) in self._labels:
+                self._index.mark_deleted(int(label))
+                self._labels.discard(int(label))
+
+    def search(self, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Labels and cosine similarities of (approximately) the k nearest vectors, best first"""
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        self._index.set_ef(max(self.ef_search, k))
+        labels, distances = self._index.knn_query(normalize_rows(query), k=k)
+        return labels[0].astype(np.int64), (1 - distances[0]).astype(np.float32)
+
+    def save(self, path: str):
+        Path(path).mkdir(parents=True, exist_ok=True)
+        self._index.save_index(str(Path(path) / "hnswlib.bin"))
+        _write_meta(path, {"kind": self.kind, "dimension": self.dimension, "ef_search": self.ef_search,
+                           "labels": sorted(self._labels)})
+
+    @classmethod
+    def load(cls, path: str) -> "HNSWLibIndex":
+        meta = _read_meta(path)
+        index = cls.__new__(cls)
+        index.dimension = meta["dimension"]
+        index.ef_search = meta["ef_search"]
+        index._index = hnswlib.Index(space="ip", dim=index.dimension)
+        index._index.load_index(str(Path(path) / "hnswlib.bin"), allow_replace_deleted=True)
+        index._index.set_ef(index.ef_search)
+        index._labels = set(meta["labels"])
+        return index
+
+
+def _write_meta(path: str, meta: Dict):
+    with open(Path(path) / "index.json", "w") as f:
+        json.dump(meta, f)
+
+
+def _read_meta(path: str) -> Dict:
+    with open(Path(path) / "index.json") as f:
+        return json.load(f)
+
+
+INDEX_BACKENDS = ("brute", "hnsw")
+
+
+def create_vector_index(backend: str, dimension: int, **options):
+    """Build an empty index: "brute" (exact) or "hnsw" (hnswlib when installed, else pure NumPy)"""
+    if backend == "brute":
+        return BruteForceIndex(dimension)
+    if backend == "hnsw":
+        return HNSWLibIndex(dimension, **options) if hnswlib is not None else NumpyHNSWIndex(dimension, **options)
+    raise ValueError(f"Unknown vector index backend: {backend!r} (expected one of {INDEX_BACKENDS})")
+
+
+def load_vector_index(path: str):
+    """Load an index written by save(), whatever its backend"""
+    kind = _read_meta(path)["kind"]
+    classes = {cls.kind: cls for cls in (BruteForceIndex, NumpyHNSWIndex, HNSWLibIndex)}
+    if kind == HNSWLibIndex.kind and hnswlib is None:
+        raise ImportError(f"{path} was written by hnswlib, which is not installed")
+    return classes[kind].load(path)
@@ -0,0 +1,49 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict
+
+# Seconds spent in each startup step (module imports, component construction,
+# model loading), in the order they happened. Exposed through the /ready endpoint.
+startup_timings: Dict[str, float] = {}
+
+
+@contextmanager
+def timed(step: str):
+    """Record how long the wrapped block takes under startup_timings[step]"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        startup_timings[step] = round(time.perf_counter() - start, 4)
+
+
+class LazyComponent:
+    """Proxy that builds a heavy component on first attribute access.
+
+    The factory runs once (thread-safe); afterwards attribute access is forwarded
+    to the real object, so call sites keep using the proxy like the component.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], object]):
+        self._name = name
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_initialized(self) -> bool:
+        return self._instance is not None
+
+    def get(self):
+        """Return the component, building it if this is the first use"""
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    with timed(f"init {self._name}"):
+                        self._instance = self._factory()
+                    print(f"✅ Initialized {self._name} in {startup_timings[f'init {self._name}']:.2f}s")
+        return self._instance
+
+    def __getattr__(self, attribute):
+        return getattr(self.get(), attribute)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: blocking vs. async Groq optimization against the local stub server.
+
+Sends --requests optimizations built from --distinct resume/job pairs (so some
+prompts are identical and in flight together) through two paths:
+  * blocking: ATSOptimizer.optimize_resume on a pool of --threads threads
+  * async:    ATSOptimizer.optimize_resume_async, all requests at once
+and prints wall time, API calls the stub served, coalesced requests and retries.
+The response cache is disabled so every request reaches the client.
+
+Start the stub first: python benchmarks/groq_stub_server.py --latency 0.5 [--error-rate 0.1]
+Usage: python benchmarks/bench_async_llm.py [--url http://127.0.0.1:8900] [--requests 40]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from models.ats_optimizer import ATSOptimizer
+
+
+def make_inputs(count, distinct):
+    """count (resume, job) pairs cycling through distinct different ones"""
+    return [
+        (f"Candidate {i % distinct}\nSkills: python, sql, docker\n"
+         f"{3 + i % distinct} years building backend services.",
+         f"Backend engineer {i % distinct}: python, kubernetes, terraform, aws.")
+        for i in range(count)
+    ]
+
+
+def stub_calls(url):
+    return requests.get(f"{url}/stub-stats", timeout=10).json()
+
+
+def reset_stub(url):
+    requests.post(f"{url}/stub-stats/reset", timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8900')
+    parser.add_argument('--requests', type=int, default=40)
+    parser.add_argument('--distinct', type=int, default=10, help='different resume/job pairs')
+    parser.add_argument('--threads', type=int, default=4, help='worker threads for the blocking path')
+    parser.add_argument('--concurrency', type=int, default=4, help='async client concurrency limit')
+    args = parser.parse_args()
+    url = args.url.rstrip('/')
+
+    os.environ.setdefault("GROQ_API_KEY", "stub-key")
+    optimizer = ATSOptimizer(base_url=url, max_concurrency=args.concurrency, max_retries=5)
+    inputs = make_inputs(args.requests, args.distinct)
+
+    reset_stub(url)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        blocking_results = list(pool.map(lambda pair: optimizer.optimize_resume(*pair), inputs))
+    blocking_s = time.perf_counter() - start
+    blocking_stub = stub_calls(url)
+
+    async def run_async():
+        return await asyncio.gather(*(optimizer.optimize_resume_async(*pair) for pair in inputs))
+
+    reset_stub(url)
+    start = time.perf_counter()
+    async_results = asyncio.run(run_async())
+    async_s = time.perf_counter() - start
+    async_stub = stub_calls(url)
+
+    scored = sum('ats_score' in result for result in async_results)
+    print(f"requests: {args.requests}  distinct prompts: {args.distinct}  stub: {url}")
+    print(f"blocking ({args.threads} threads):   {blocking_s:7.2f} s  api calls {blocking_stub['calls']:4d}  "
+          f"stub errors {blocking_stub['errors']}")
+    print(f"async (limit {args.concurrency}):        {async_s:7.2f} s  api calls {async_stub['calls']:4d}  "
+          f"stub errors {async_stub['errors']}  max concurrent {async_stub['max_concurrent']}")
+    print(f"async client: {optimizer.async_client.stats()}")
+    print(f"results with an ATS score: {scored}/{len(async_results)} async, "
+          f"{sum('ats_score' in result for result in blocking_results)}/{len(blocking_results)} blocking")
+
+
+if __name__ == '__main__':
+    main()
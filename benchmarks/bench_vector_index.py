@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark: recall and latency of the vector index backends.
+
+For each size, builds random MiniLM-sized (384-d) embeddings, indexes them with
+the brute-force index and both HNSW backends (hnswlib, when installed, and the
+pure NumPy fallback), and reports build time, query latency and recall@k against
+the exact brute-force result.
+
+The NumPy HNSW inserts one vector at a time in Python (a few ms each), so at 1M
+vectors expect hours of build time; skip it there with --skip-numpy-hnsw.
+
+Usage: python benchmarks/bench_vector_index.py [--sizes 10000 100000 1000000] [--k 500]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from models.vector_index import BruteForceIndex, HNSWLibIndex, NumpyHNSWIndex, hnswlib
+
+DIMENSION = 384
+LATENT_DIMENSION = 24
+
+
+def make_vectors(rng, projection, count):
+    """Vectors with low intrinsic dimension, like sentence embeddings, rather than uniform noise"""
+    latent = rng.standard_normal((count, projection.shape[0])).astype(np.float32)
+    return latent @ projection + 0.05 * rng.standard_normal((count, DIMENSION)).astype(np.float32)
+
+
+def run(name, index, vectors, queries, k, exact):
+    """Build index, time the queries and compare against the exact top-k"""
+    start = time.perf_counter()
+    index.add(range(len(vectors)), vectors)
+    build_s = time.perf_counter() - start
+
+    found = []
+    start = time.perf_counter()
+    for query in queries:
+        labels, _ = index.search(query, k)
+        found.append(labels)
+    query_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    recall = 1.0
+    if exact is not None:
+        recall = float(np.mean([len(set(a.tolist()) & set(b.tolist())) / len(b) for a, b in zip(found, exact)]))
+    print(f"  {name:<12} build {build_s:9.2f} s   query {query_ms:8.2f} ms   recall@{k} {recall:.3f}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--k', type=int, default=500, help='candidates retrieved (VECTOR_INDEX_CANDIDATES)')
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--ef-search', type=int, default=0, help='HNSW search breadth (default: max(64, k))')
+    parser.add_argument('--skip-hnswlib', action='store_true')
+    parser.add_argument('--skip-numpy-hnsw', action='store_true')
+    args = parser.parse_args()
+    ef_search = args.ef_search or max(64, args.k)
+
+    rng = np.random.default_rng(0)
+    projection = rng.standard_normal((LATENT_DIMENSION, DIMENSION)).astype(np.float32)
+    for size in args.sizes:
+        vectors = make_vectors(rng, projection, size)
+        queries = make_vectors(rng, projection, args.queries)
+        print(f"vectors: {size:,}  dim: {DIMENSION}  k: {args.k}  queries: {args.queries}")
+
+        exact = run("brute", BruteForceIndex(DIMENSION), vectors, queries, args.k, None)
+        if hnswlib is not None and not args.skip_hnswlib:
+            run("hnswlib", HNSWLibIndex(DIMENSION, ef_search=ef_search, initial_capacity=size),
+                vectors, queries, args.k, exact)
+        if not args.skip_numpy_hnsw:
+            run("hnsw-numpy", NumpyHNSWIndex(DIMENSION, ef_search=ef_search), vectors, queries, args.k, exact)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Groq chat-completions API.
+
+Answers POST /openai/v1/chat/completions after a configurable delay with a
+deterministic ATS report (JSON). It can inject rate limits and server errors to
+exercise retries, and malformed JSON to exercise the answer repair. Requests
+with "stream": true get the report as server-sent chunks, a few characters every
+--token-delay seconds. GET /stub-stats returns how many calls it served. Point
+the backend at it with GROQ_BASE_URL=http://127.0.0.1:8900 (any GROQ_API_KEY).
+
+Usage: python benchmarks/groq_stub_server.py [--port 8900] [--latency 0.5] [--error-rate 0.1]
+       [--token-delay 0.02] [--malformed-rate 0.2]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+app = FastAPI(title="Groq stub")
+settings = {"latency": 0.5, "error_rate": 0.0, "token_delay": 0.02, "malformed_rate": 0.0}
+counters = {"calls": 0, "errors": 0, "concurrent": 0, "max_concurrent": 0}
+
+
+def make_report(prompt):
+    """A well-formed optimization report whose score depends on the prompt"""
+    digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=8).digest()
+    return {
+        "ats_score": 50 + digest[0] % 50,
+        "missing_keywords": ["kubernetes", "terraform", "graphql"][:1 + digest[1] % 3],
+        "keyword_optimization": {"add_keywords": ["kubernetes"], "improve_sections": ["Experience"]},
+        "format_improvements": ["Use standard section headings"],
+        "content_suggestions": ["Quantify achievements"],
+        "skills_gap": ["kubernetes"],
+        "strengths": ["python"],
+        "action_items": ["Add a skills section"]
+    }
+
+
+@app.post("/openai/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    counters["calls"] += 1
+    counters["concurrent"] += 1
+    counters["max_concurrent"] = max(counters["max_concurrent"], counters["concurrent"])
+    try:
+        await asyncio.sleep(settings["latency"])
+        if random.random() < settings["error_rate"]:
+            counters["errors"] += 1
+            if random.random() < 0.5:
+                return JSONResponse(status_code=429, headers={"retry-after": "0.1"},
+                                    content={"error": {"message": "Rate limit reached", "type": "rate_limit"}})
+            return JSONResponse(status_code=503, content={"error": {"message": "Overloaded", "type": "server"}})
+
+        prompt = "".join(message.get("content", "") for message in body.get("messages", []))
+        content = json.dumps(make_report(prompt))
+        if random.random() < settings["malformed_rate"]:
+            # The usual LLM defects: a code fence, a trailing comma, a score as text
+            content = "```json\n" + content.replace('"ats_score": ', '"ats_score": "').replace(
+                ', "missing_keywords"', '/100", "missing_keywords"', 1)[:-1] + ",}\n```"
+        if body.get("stream"):
+            return StreamingResponse(stream_chunks(content, body.get("model", "stub")),
+                                     media_type="text/event-stream")
+        prompt_tokens = len(prompt.split())
+        completion_tokens = len(content.split())
+        return {
+            "id": f"chatcmpl-stub-{counters['calls']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "system_fingerprint": "stub",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+    finally:
+        counters["concurrent"] -= 1
+
+
+async def stream_chunks(content, model):
+    """chat.completion.chunk events carrying content a few characters at a time"""
+    def chunk(delta, finish_reason=None):
+        return "data: " + json.dumps({
+            "id": f"chatcmpl-stub-{counters['calls']}",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "system_fingerprint": "stub",
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+        }) + "\n\n"
+
+    yield chunk({"role": "assistant", "content": ""})
+    for start in range(0, len(content), 8):
+        await asyncio.sleep(settings["token_delay"])
+        yield chunk({"content": content[start:start + 8]})
+    yield chunk({}, "stop")
+    yield "data: [DONE]\n\n"
+
+
+@app.get("/stub-stats")
+async def stub_stats():
+    return counters
+
+
+@app.post("/stub-stats/reset")
+async def reset_stub_stats():
+    counters.update(calls=0, errors=0, max_concurrent=0)
+    return counters
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--latency', type=float, default=0.5, help='seconds per completion')
+    parser.add_argument('--malformed-rate', type=float, default=0.0,
+                        help='fraction of answers with fenced, slightly broken JSON')
+    parser.add_argument('--token-delay', type=float, default=0.02, help='seconds between streamed chunks')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of calls answered 429/503')
+    args = parser.parse_args()
+    settings.update(latency=args.latency, error_rate=args.error_rate, token_delay=args.token_delay,
+                    malformed_rate=args.malformed_rate)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == '__main__':
+    main()
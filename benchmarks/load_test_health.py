@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Load test: /health/ latency while the server is busy processing uploads.
+
+Polls /health/ on its own, then again while several clients keep posting batches
+of generated resumes to /upload-resumes/. With the blocking work moved off the
+event loop the two latency distributions should stay close.
+
+Start the API first (cd backend && uvicorn app:app), then:
+Usage: python benchmarks/load_test_health.py [--url http://localhost:8000] [--uploaders 4]
+"""
+
+import argparse
+import io
+import statistics
+import threading
+import time
+
+import requests
+
+SKILLS = ["python", "java", "react", "docker", "kubernetes", "aws", "sql", "machine learning",
+          "tensorflow", "git", "linux", "fastapi", "postgresql", "redis", "terraform"]
+
+
+def make_resume(index):
+    """A plain-text resume large enough to keep the parser and encoder busy"""
+    skills = ", ".join(SKILLS[(index + offset) % len(SKILLS)] for offset in range(8))
+    lines = [
+        f"Candidate {index}",
+        f"candidate{index}@example.com",
+        "+1 555 010 0000",
+        "EXPERIENCE",
+        f"{3 + index % 10} years of experience building backend services.",
+        f"Skills: {skills}",
+    ]
+    lines.extend(f"Delivered project {n} using {skills}." for n in range(200))
+    return "\n".join(lines).encode("utf-8")
+
+
+def poll_health(url, duration, latencies, stop):
+    """Call /health/ back to back for duration seconds, recording latency in ms"""
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline and not stop.is_set():
+        start = time.perf_counter()
+        response = requests.get(f"{url}/health/", timeout=30)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.01)
+
+
+def upload_loop(url, files_per_upload, stop, counters, worker):
+    """Keep posting resume batches until stop is set"""
+    batch = 0
+    while not stop.is_set():
+        files = [
+            ("files", (f"load_{worker}_{batch}_{n}.txt",
+                       io.BytesIO(make_resume(worker * 1000 + batch * files_per_upload + n)),
+                       "text/plain"))
+            for n in range(files_per_upload)
+        ]
+        response = requests.post(f"{url}/upload-resumes/", files=files, timeout=600)
+        counters["ok" if response.ok else "failed"] += 1
+        batch += 1
+
+
+def summarize(label, latencies):
+    """Print p50 / p95 / max of a latency sample"""
+    if not latencies:
+        print(f"{label:<18} no samples")
+        return
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label:<18} n={len(ordered):5d}  p50={statistics.median(ordered):7.2f} ms  "
+          f"p95={p95:7.2f} ms  max={ordered[-1]:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default='http://localhost:8000')
+    parser.add_argument('--duration', type=float, default=15, help='seconds per phase')
+    parser.add_argument('--uploaders', type=int, default=4, help='concurrent upload clients')
+    parser.add_argument('--files-per-upload', type=int, default=10)
+    args = parser.parse_args()
+    url = args.url.rstrip('/')
+
+    stop = threading.Event()
+
+    idle = []
+    poll_health(url, args.duration, idle, stop)
+
+    counters = {"ok": 0, "failed": 0}
+    uploaders = [
+        threading.Thread(target=upload_loop, args=(url, args.files_per_upload, stop, counters, worker),
+                         daemon=True)
+        for worker in range(args.uploaders)
+    ]
+    for thread in uploaders:
+        thread.start()
+    time.sleep(1)  # let the first uploads reach the server
+
+    busy = []
+    poll_health(url, args.duration, busy, stop)
+    stop.set()
+    for thread in uploaders:
+        thread.join()
+
+    print(f"server: {url}  uploaders: {args.uploaders}  files/upload: {args.files_per_upload}")
+    summarize("/health/ idle", idle)
+    summarize("/health/ uploads", busy)
+    print(f"uploads completed: {counters['ok']}  failed: {counters['failed']}")
+
+
+if __name__ == '__main__':
+    main()
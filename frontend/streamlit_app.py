@@ -900,6 +900,21 @@ def call_api(endpoint: str, method: str = "GET", data=None, files=None):
     except Exception as e:
         return None, f"Error: {str(e)}"
 
+def stream_api(endpoint: str, data=None, files=None):
+    """POST to a server-sent events endpoint, yielding (event, data) pairs as they arrive"""
+    url = f"{API_BASE_URL}{endpoint}"
+    with requests.post(url, data=data, files=files, stream=True) as response:
+        if response.status_code != 200:
+            yield "error", {"detail": f"API Error: {response.status_code} - {response.text}"}
+            return
+        
+        event = "message"
+        for line in response.iter_lines(decode_unicode=True):
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                yield event, json.loads(line[len("data: "):])
+
 def display_resume_matches(matches: List[Dict]):
     """Display resume matches in a formatted way"""
     if not matches:
@@ -1407,7 +1422,8 @@ def show_resume_screening():
                 st.error(f"Error uploading resumes: {upload_error}")
                 return
             
-            st.info(f"✅ Successfully uploaded {upload_response['successful_parses']} resumes")
+            st.info(f"✅ Successfully uploaded {upload_response['successful_parses']} resumes "
+                    f"({upload_response.get('total_resumes_in_corpus', upload_response['successful_parses'])} candidates in total)")
             
             # Step 2: Match resumes to job description
             match_data = {
@@ -1513,52 +1529,80 @@ def show_ats_optimization():
             st.error("Please enter a job description")
             return
         
-        with st.spinner("✨ Optimizing your resume..."):
-            # Prepare file and form data for API
-            files = [("file", (resume_file.name, resume_file.getvalue(), resume_file.type))]
-            data = {
-                "job_description": job_description
-            }
-            
-            # Call API
-            response, error = call_api(
-                "/optimize-resume/",
-                method="POST",
-                data=data,
-                files=files
-            )
-            
-            if error:
-                st.error(f"Error during optimization: {error}")
-                return
-            
-            # Display results
-            st.success("✅ Optimization completed successfully!")
-            
-            # Extract optimization results from the response
-            optimization_results = response.get('optimization_results', {})
-            if not optimization_results:
-                st.error("No optimization results found in response")
-                st.json(response)  # Debug: show full response
-                return
-                
-            # Show result ID and saved status
-            if response.get('result_id'):
-                st.success(f"✅ Results saved with ID: `{response['result_id']}`")
-                
-                # Option to view saved results
-                if st.button("📋 View My Saved Results"):
-                    show_saved_ats_results(response.get('resume_info', {}).get('email', ''))
+        # Prepare file and form data for API
+        files = [("file", (resume_file.name, resume_file.getvalue(), resume_file.type))]
+        data = {
+            "job_description": job_description
+        }
+        
+        # Stream the results: the keyword analysis shows up right away, the AI
+        # answer is written out while it is generated
+        status = st.empty()
+        preview = st.empty()
+        response = {}
+        ai_text = ""
+        status.info("✨ Optimizing your resume...")
+        
+        try:
+            for event, payload in stream_api("/optimize-resume/stream/", data=data, files=files):
+                if event == "error":
+                    status.empty()
+                    st.error(f"Error during optimization: {payload.get('detail')}")
+                    return
+                elif event == "resume_info":
+                    response['resume_info'] = payload
+                elif event == "job_analysis":
+                    response['job_analysis'] = payload
+                elif event == "basic_analysis":
+                    with preview.container():
+                        st.caption("Quick keyword analysis (AI recommendations on the way)")
+                        st.metric("Estimated ATS Score", f"{payload.get('ats_score', 0)}/100")
+                        missing = payload.get('missing_keywords', [])
+                        if missing:
+                            st.write("**Missing keywords:** " + ", ".join(missing[:10]))
+                elif event == "token":
+                    ai_text += payload.get('text', '')
+                    status.info("🤖 AI recommendations are being written...")
+                    preview.code(ai_text, language="json")
+                elif event == "optimization":
+                    response['optimization_results'] = payload
+                elif event == "saved":
+                    response.update(payload)
+        except requests.exceptions.ConnectionError:
+            status.empty()
+            st.error("Cannot connect to API. Please make sure the backend server is running.")
+            return
+        
+        status.empty()
+        preview.empty()
+        
+        # Display results
+        st.success("✅ Optimization completed successfully!")
+        
+        # Extract optimization results from the response
+        optimization_results = response.get('optimization_results', {})
+        if not optimization_results:
+            st.error("No optimization results found in response")
+            st.json(response)  # Debug: show full response
+            return
             
-            display_optimization_results(optimization_results)
+        # Show result ID and saved status
+        if response.get('result_id'):
+            st.success(f"✅ Results saved with ID: `{response['result_id']}`")
             
-            # Download optimized resume if available
-            if 'optimized_resume_url' in response:
-                st.markdown("### 📥 Download Optimized Resume")
-                st.markdown(
-                    f"Your optimized resume is ready! [Download here]({API_BASE_URL}{response['optimized_resume_url']})",
-                    unsafe_allow_html=True
-                )
+            # Option to view saved results
+            if st.button("📋 View My Saved Results"):
+                show_saved_ats_results(response.get('resume_info', {}).get('email', ''))
+        
+        display_optimization_results(optimization_results)
+        
+        # Download optimized resume if available
+        if 'optimized_resume_url' in response:
+            st.markdown("### 📥 Download Optimized Resume")
+            st.markdown(
+                f"Your optimized resume is ready! [Download here]({API_BASE_URL}{response['optimized_resume_url']})",
+                unsafe_allow_html=True
+            )
 
 def show_saved_ats_results(email: str = None):
     """Show saved ATS optimization results"""